@@ -0,0 +1,115 @@
+"""
+Benchmark the BnBSearch on generated instances of the standard hard classes.
+
+    python benchmark.py --sizes 100 1000 --time-limit 5 --output results.json
+    python benchmark.py --compare old.json new.json
+
+Add your own configurations to `CONFIGURATIONS` to compare them. Each run is
+limited by `--time-limit` and reports nodes, time, peak memory and final gap.
+"""
+
+import argparse
+import logging
+
+from knapsack_bnb import BnBSearch, Instance, TrackerMode
+from knapsack_bnb.benchmark import (
+    compare_results,
+    read_results,
+    run_benchmark,
+    write_results,
+)
+from knapsack_bnb.branching_strategy import MyBranchingStrategy
+from knapsack_bnb.generators import InstanceClass
+from knapsack_bnb.heuristics import MyHeuristic
+from knapsack_bnb.relaxation import (
+    FractionalRelaxationSolver,
+    MartelloTothRelaxationSolver,
+)
+from knapsack_bnb.search_strategy import (
+    BestFirstSearchStrategy,
+    DepthFirstSearchStrategy,
+)
+
+
+def fractional_depth_first(instance: Instance) -> BnBSearch:
+    return BnBSearch(
+        instance,
+        relaxation=FractionalRelaxationSolver(),
+        search_strategy=DepthFirstSearchStrategy(),
+        branching_strategy=MyBranchingStrategy(),
+        heuristics=MyHeuristic(),
+        tracker_mode=TrackerMode.SILENT,
+        compact_nodes=True,
+    )
+
+
+def martello_toth_best_first(instance: Instance) -> BnBSearch:
+    return BnBSearch(
+        instance,
+        relaxation=MartelloTothRelaxationSolver(),
+        search_strategy=BestFirstSearchStrategy(),
+        branching_strategy=MyBranchingStrategy(),
+        heuristics=MyHeuristic(),
+        tracker_mode=TrackerMode.SILENT,
+        compact_nodes=True,
+        presolve=True,
+    )
+
+
+# Configurations have to be module-level functions (they run in worker processes).
+CONFIGURATIONS = {
+    "fractional-depth-first": fractional_depth_first,
+    "martello-toth-best-first": martello_toth_best_first,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--configurations",
+        nargs="+",
+        choices=sorted(CONFIGURATIONS),
+        default=list(CONFIGURATIONS),
+    )
+    parser.add_argument(
+        "--classes",
+        nargs="+",
+        choices=[c.value for c in InstanceClass],
+        default=[c.value for c in InstanceClass],
+    )
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=[100, 1000, 10_000, 100_000]
+    )
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0])
+    parser.add_argument("--time-limit", type=float, default=10.0)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "CURRENT"),
+        help="only compare two result files",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        baseline, current = (read_results(path) for path in args.compare)
+        print(compare_results(baseline, current))
+        return
+
+    runs = run_benchmark(
+        {name: CONFIGURATIONS[name] for name in args.configurations},
+        instance_classes=[InstanceClass(c) for c in args.classes],
+        sizes=args.sizes,
+        seeds=args.seeds,
+        time_limit=args.time_limit,
+    )
+    write_results(args.output, runs)
+    logging.info("Wrote %d runs to %s.", len(runs), args.output)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    main()
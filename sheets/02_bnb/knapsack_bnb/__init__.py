@@ -1,27 +1,47 @@
-from .bnb import BnBSearch
+from .bnb import BnBSearch, SearchResult, TerminationReason
 from .bnb_nodes import BnBNode, NodeFactory
+from .branching_decisions import BitsetBranchingDecisions
 from .branching_strategy import BranchingStrategy
+from .dynamic_programming import DynamicProgrammingSolver
+from .engine_selection import AutoSearch, Engine, select_engine
+from .heuristic_scheduler import HeuristicScheduler
 from .heuristics import Heuristics
-from .instance import Instance, Item
+from .instance import Constraint, Instance, Item
+from .parallel import ParallelBnBSearch
 from .relaxation import (
     BranchingDecisions,
     RelaxationSolver,
     RelaxedSolution,
 )
+from .profiling import ProfileReport, SearchProfiler
+from .progress_tracker import TrackerMode
 from .search_strategy import SearchStrategy
 from .solutions import SolutionPool
 
 __all__ = [
+    "AutoSearch",
     "BnBNode",
     "BnBSearch",
+    "BitsetBranchingDecisions",
     "BranchingDecisions",
     "BranchingStrategy",
+    "Constraint",
+    "DynamicProgrammingSolver",
+    "Engine",
     "RelaxedSolution",
+    "HeuristicScheduler",
     "Heuristics",
     "Instance",
     "Item",
     "NodeFactory",
+    "ParallelBnBSearch",
+    "ProfileReport",
     "RelaxationSolver",
+    "SearchProfiler",
+    "SearchResult",
     "SearchStrategy",
     "SolutionPool",
+    "TerminationReason",
+    "TrackerMode",
+    "select_engine",
 ]
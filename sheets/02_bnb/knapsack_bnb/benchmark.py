@@ -0,0 +1,252 @@
+"""
+Benchmark Module
+
+Runs `BnBSearch` configurations on generated instances (see `generators`) and
+records per run:
+  - the processed (iterations) and created nodes,
+  - the wall time and the time to the first incumbent,
+  - the peak memory (resident set size, RSS),
+  - the best value, the proven bound, the final gap and why the search stopped.
+Every run executes in a fresh process, so the peak memory belongs to this run
+alone. The results are written to JSON together with the git commit, so two
+result files (e.g., of two commits) can be compared with `compare_results`.
+
+A configuration is a function that creates the `BnBSearch` for an instance. It
+is sent to the worker process, so define it at module level and use
+`TrackerMode.SILENT` (see `benchmark.py` next to `run.py`).
+
+Usage:
+    results = run_benchmark(
+        {"fractional": make_fractional_search},
+        instance_classes=[InstanceClass.STRONGLY_CORRELATED],
+        sizes=[100, 1000],
+    )
+    write_results("benchmark.json", results)
+"""
+
+import json
+import logging
+import math
+import multiprocessing
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+from .bnb import BnBSearch
+from .generators import InstanceClass, generate_instance
+from .instance import Instance
+
+try:  # not available on Windows
+    import resource
+except ImportError:
+    resource = None
+
+Configuration = Callable[[Instance], BnBSearch]
+
+
+@dataclass
+class BenchmarkRun:
+    """
+    Measurements of one configuration on one instance. Infinite bounds and gaps
+    (e.g., no solution found) are stored as None.
+    """
+
+    configuration: str
+    instance_class: str
+    num_items: int
+    seed: int
+    iterations: int
+    nodes: int
+    seconds: float
+    first_incumbent_seconds: Optional[float]
+    peak_rss_mib: Optional[float]
+    value: Optional[float]
+    upper_bound: Optional[float]
+    gap: Optional[float]
+    relative_gap: Optional[float]
+    reason: str
+
+    def key(self) -> tuple[str, str, int, int]:
+        return (self.configuration, self.instance_class, self.num_items, self.seed)
+
+
+def _finite(value: float) -> Optional[float]:
+    return float(value) if math.isfinite(value) else None
+
+
+def _peak_rss_mib() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def run_once(
+    name: str,
+    configuration: Configuration,
+    instance_class: InstanceClass,
+    num_items: int,
+    seed: int,
+    time_limit: float,
+    iteration_limit: int,
+) -> BenchmarkRun:
+    """
+    Generate the instance, run the configuration on it and measure the run
+    in the current process.
+    """
+    instance = generate_instance(instance_class, num_items, seed=seed)
+    start = time.perf_counter()
+    searcher = configuration(instance)
+    try:
+        searcher.search(iteration_limit=iteration_limit, time_limit=time_limit)
+    except ValueError:
+        pass  # iteration limit, `searcher.result` is still set
+    seconds = time.perf_counter() - start
+    result = searcher.result
+    first_solution_time = searcher.solutions.first_solution_time
+    return BenchmarkRun(
+        configuration=name,
+        instance_class=instance_class.value,
+        num_items=num_items,
+        seed=seed,
+        iterations=result.iterations,
+        nodes=searcher.node_factory.num_nodes(),
+        seconds=seconds,
+        first_incumbent_seconds=(
+            max(0.0, first_solution_time - start)
+            if first_solution_time is not None
+            else None
+        ),
+        peak_rss_mib=_peak_rss_mib(),
+        value=_finite(result.lower_bound),
+        upper_bound=_finite(result.upper_bound),
+        gap=_finite(result.gap),
+        relative_gap=_finite(result.relative_gap),
+        reason=result.reason.value,
+    )
+
+
+def run_benchmark(
+    configurations: dict[str, Configuration],
+    instance_classes: Iterable[InstanceClass] = tuple(InstanceClass),
+    sizes: Iterable[int] = (100, 1000, 10_000, 100_000),
+    seeds: Iterable[int] = (0,),
+    time_limit: float = 10.0,
+    iteration_limit: int = 10**9,
+    isolate: bool = True,
+) -> list[BenchmarkRun]:
+    """
+    Run every configuration on every instance.
+
+    Args:
+        configurations: name -> function creating the `BnBSearch` for an instance.
+        instance_classes: the instance classes to generate.
+        sizes: the numbers of items.
+        seeds: one instance per seed, class and size.
+        time_limit: time limit per run in seconds (checked after every node).
+        iteration_limit: node limit per run.
+        isolate: run each measurement in a fresh process. Otherwise the peak
+                 memory is the maximum over all runs so far.
+
+    Returns:
+        One `BenchmarkRun` per configuration and instance.
+    """
+    context = multiprocessing.get_context("spawn")
+    runs = []
+    for instance_class in instance_classes:
+        for num_items in sizes:
+            for seed in seeds:
+                for name, configuration in configurations.items():
+                    args = (
+                        name,
+                        configuration,
+                        instance_class,
+                        num_items,
+                        seed,
+                        time_limit,
+                        iteration_limit,
+                    )
+                    if isolate:
+                        with context.Pool(1) as pool:
+                            run = pool.apply(run_once, args)
+                    else:
+                        run = run_once(*args)
+                    logging.info(
+                        "%s on %s/%d/%d: %d nodes in %.2fs (%s)",
+                        name,
+                        instance_class.value,
+                        num_items,
+                        seed,
+                        run.nodes,
+                        run.seconds,
+                        run.reason,
+                    )
+                    runs.append(run)
+    return runs
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(path: str, runs: list[BenchmarkRun]) -> None:
+    """
+    Write the runs with the commit, Python version and date to a JSON file.
+    """
+    data = {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "runs": [asdict(run) for run in runs],
+    }
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2)
+
+
+def read_results(path: str) -> list[BenchmarkRun]:
+    """
+    Read the runs of a JSON file written by `write_results`.
+    """
+    with open(path) as file:
+        return [BenchmarkRun(**run) for run in json.load(file)["runs"]]
+
+
+def compare_results(baseline: list[BenchmarkRun], current: list[BenchmarkRun]) -> str:
+    """
+    Return a table of the runs contained in both lists with the change of
+    nodes and time (current / baseline) and both gaps.
+    """
+    previous = {run.key(): run for run in baseline}
+
+    def ratio(new: float, old: float) -> str:
+        return f"{new / old:8.2f}x" if old else f"{'-':>9}"
+
+    lines = [
+        f"{'configuration':<24}{'instance':<36}{'nodes':>9}{'time':>9}"
+        f"{'old gap':>10}{'gap':>10}"
+    ]
+    for run in current:
+        old = previous.get(run.key())
+        if old is None:
+            continue
+        instance = f"{run.instance_class}/{run.num_items}/{run.seed}"
+        lines.append(
+            f"{run.configuration:<24}{instance:<36}"
+            f"{ratio(run.nodes, old.nodes)}{ratio(run.seconds, old.seconds)}"
+            f"{str(old.gap):>10}{str(run.gap):>10}"
+        )
+    return "\n".join(lines)
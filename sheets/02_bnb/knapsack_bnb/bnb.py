@@ -17,18 +17,74 @@ for relaxation, branching, search ordering, and heuristics to observe performanc
 """
 
 import logging
-from typing import Optional
+import math
+import time
+from enum import Enum
+from typing import NamedTuple, Optional
 
 from .bnb_nodes import BnBNode, NodeFactory, NodeStatus
+from .branching_decisions import BranchingDecisions
 from .branching_strategy import BranchingStrategy
+from .checkpoint import read_checkpoint, write_checkpoint
+from .heuristic_scheduler import HeuristicScheduler
 from .heuristics import Heuristics
 from .instance import Instance
-from .progress_tracker import ProgressTracker
+from .presolve import PresolveResult, presolve_instance
+from .profiling import DISABLED, Phase, ProfileReport, SearchProfiler
+from .progress_tracker import ProgressTracker, TrackerMode
 from .relaxation import RelaxationSolver, RelaxedSolution
 from .search_strategy import SearchStrategy
 from .solutions import SolutionPool
 
 
+class TerminationReason(Enum):
+    """
+    Why a search stopped.
+    """
+
+    OPTIMAL = "optimal"  # the queue is empty or globally pruned
+    GAP = "gap"  # the absolute or relative gap is reached
+    TIME_LIMIT = "time limit"
+    NODE_LIMIT = "node limit"
+    ITERATION_LIMIT = "iteration limit"
+    UNBRANCHED = "unbranched"  # the queue is empty, but a node got no children
+
+
+class SearchResult(NamedTuple):
+    """
+    Outcome of `BnBSearch.search` or `BnBSearch.resume`.
+
+    Attributes:
+        solution: the best feasible solution found, or None.
+        lower_bound: its value (-inf if none).
+        upper_bound: proven bound on the optimal value.
+        gap: upper_bound - lower_bound (0 if optimal).
+        relative_gap: gap / |upper_bound| (0 if optimal, inf without solution).
+        reason: the criterion that stopped the search.
+        iterations: number of processed nodes in this run.
+        seconds: wall-clock time of this run.
+        profile: time per search phase if a `SearchProfiler` was given.
+    """
+
+    solution: Optional[RelaxedSolution]
+    lower_bound: float
+    upper_bound: float
+    gap: float
+    relative_gap: float
+    reason: TerminationReason
+    iterations: int
+    seconds: float
+    profile: Optional[ProfileReport] = None
+
+
+def _relative_gap(lower_bound: float, upper_bound: float) -> float:
+    if lower_bound >= upper_bound:
+        return 0.0
+    if math.isinf(lower_bound) or upper_bound == 0:
+        return math.inf
+    return (upper_bound - lower_bound) / abs(upper_bound)
+
+
 class BnBSearch:
     """
     Branch-and-bound solver for the 0/1 knapsack problem.
@@ -42,6 +98,45 @@ class BnBSearch:
             heuristics=my_heuristics,
         )
         best = searcher.search(iteration_limit=10000)
+
+    Pass `decisions_type=BitsetBranchingDecisions` to store the branching
+    decisions as bitmasks instead of lists.
+
+    For long runs, use `tracker_mode=TrackerMode.SAMPLED` (a progress line every
+    `report_every` iterations or `report_interval` seconds) or `TrackerMode.SILENT`
+    (no output); both skip the visualization.
+
+    Heuristics run at most once per node. Pass a `HeuristicScheduler` as
+    `heuristics` to run them only at selected nodes.
+
+    With `compact_nodes=True`, open nodes store a decision trail instead of their
+    decisions and relaxed solution, which are rebuilt on dequeue (see `NodeFactory`).
+    This trades relaxation time for memory on large instances; use it together
+    with `TrackerMode.SAMPLED` or `TrackerMode.SILENT`.
+
+    Besides `iteration_limit`, `search` accepts anytime stopping criteria:
+    `time_limit` (seconds), `node_limit` (created nodes), `absolute_gap` and
+    `relative_gap`. If one of them fires, the best solution found so far is
+    returned. In any case, `self.result` holds a `SearchResult` with the
+    solution, the proven bound, the final gap and the reason for stopping.
+    If the branching strategy creates no children for a node that is neither
+    pruned nor feasible, the node's bound stays in the proven bound, and a search
+    that runs out of nodes stops with `UNBRANCHED` instead of `OPTIMAL`.
+
+    Long runs can write checkpoints with `search(checkpoint_path=...)` and be
+    continued with `resume(checkpoint_path)`.
+
+    A custom `solutions` pool can be passed, e.g., to share the incumbent with
+    other searches (see `ParallelBnBSearch`).
+
+    With `presolve=True`, items are fixed at the root by dominance and
+    reduced-cost fixing (see `presolve_instance`) and the search runs on the
+    reduced instance (`self.instance`; the progress output refers to it as
+    well). `search()` still returns a solution of the original instance.
+
+    Pass a `SearchProfiler` as `profiler` to measure the time per phase
+    (relaxation, heuristics, branching, queue, ...). Its report is stored in
+    `self.result.profile`; it can also log periodic snapshots.
     """
 
     def __init__(
@@ -50,29 +145,71 @@ class BnBSearch:
         relaxation: RelaxationSolver,
         search_strategy: SearchStrategy,
         branching_strategy: BranchingStrategy,
-        heuristics: Heuristics,
+        heuristics: Heuristics | HeuristicScheduler,
+        decisions_type: type[BranchingDecisions] = BranchingDecisions,
+        tracker_mode: TrackerMode = TrackerMode.FULL,
+        report_every: int = 1000,
+        report_interval: float = 5.0,
+        solutions: Optional[SolutionPool] = None,
+        presolve: bool = False,
+        compact_nodes: bool = False,
+        profiler: Optional[SearchProfiler] = None,
     ):
+        self.profiler = profiler if profiler is not None else DISABLED
+
+        # Optional presolve: search the reduced instance instead
+        self.presolve_result: Optional[PresolveResult] = None
+        if presolve:
+            start = self.profiler.now()
+            self.presolve_result = presolve_instance(instance)
+            self.profiler.lap(Phase.PRESOLVE, start)
+            instance = self.presolve_result.instance
+
         # Core components
         self.instance = instance
         self.relaxation = relaxation
         self.search_strategy = search_strategy
         self.branching_strategy = branching_strategy
         self.heuristics = heuristics
+        self.heuristic_scheduler = (
+            heuristics
+            if isinstance(heuristics, HeuristicScheduler)
+            else HeuristicScheduler(heuristics)
+        )
 
         # Data structures for solutions and progress tracking
-        self.solutions = SolutionPool()
+        self.solutions = solutions if solutions is not None else SolutionPool()
         self.progress_tracker = ProgressTracker(
-            instance, search_strategy, self.solutions
+            instance,
+            search_strategy,
+            self.solutions,
+            mode=tracker_mode,
+            report_every=report_every,
+            report_interval=report_interval,
         )
 
         # Factory to create tree nodes, with callback on new node
         self.node_factory = NodeFactory(
             instance=instance,
             relaxation=relaxation,
-            heuristics=heuristics,
+            heuristics=self.heuristic_scheduler,
             on_new_node=self.progress_tracker.on_new_node_in_tree,
+            decisions_type=decisions_type,
+            compact=compact_nodes,
+            profiler=self.profiler,
         )
 
+        # number of processed nodes before `resume`
+        self.iterations_before_resume = 0
+        # highest bound of the nodes without children (never closed)
+        self._unbranched_bound = -math.inf
+        self.result: Optional[SearchResult] = None
+
+        if self.presolve_result is not None:
+            incumbent = self.presolve_result.project(self.presolve_result.incumbent)
+            if incumbent is not None:
+                self.solutions.add(incumbent)
+
     def _process_node(self, node: BnBNode) -> NodeStatus:
         """
         Process a single node:
@@ -82,7 +219,12 @@ class BnBSearch:
           4. Branch otherwise.
         Returns the node status after processing.
         """
+        profiler = self.profiler
         sol: RelaxedSolution = node.relaxed_solution
+        start = profiler.now()
+        best_value = self.solutions.best_solution_value()
+        self.heuristic_scheduler.observe(best_value)
+        profiler.lap(Phase.SOLUTIONS, start)
 
         # 1. Infeasibility prune
         if sol.is_infeasible():
@@ -90,80 +232,303 @@ class BnBSearch:
             return node.status
 
         # 2. Bound-based prune: no better solution possible
-        if sol.upper_bound <= self.solutions.best_solution_value():
+        if sol.upper_bound <= best_value:
             node.status = NodeStatus.PRUNED
             return node.status
 
         # 3. Feasible solution found: integral and obeys capacity
         if sol.does_obey_capacity_constraint() and sol.is_integral():
+            start = profiler.now()
             self.solutions.add(sol)
+            profiler.lap(Phase.SOLUTIONS, start)
             node.status = NodeStatus.FEASIBLE
             return node.status
 
         # 4. Heuristic improvement: generate extra feasible solutions
-        for heur_sol in self.heuristics.search(self.instance, node.relaxed_solution):
+        start = profiler.now()
+        runs = self.heuristic_scheduler.num_calls
+        heuristic_solutions = self.heuristic_scheduler.search(self.instance, node)
+        start = profiler.lap(
+            Phase.HEURISTICS, start, self.heuristic_scheduler.num_calls > runs
+        )
+        for heur_sol in heuristic_solutions:
             # heur_sol must be feasible; pool enforces validity
             self.solutions.add(heur_sol)
+            start = profiler.lap(Phase.SOLUTIONS, start)
             self.progress_tracker.on_heuristic_solution(node, heur_sol)
+            start = profiler.lap(Phase.TRACKING, start)
 
         # 5. Branch on a fractional decision variable
         branches = self.branching_strategy.make_branching_decisions(node)
+        profiler.lap(Phase.BRANCHING, start)
         if not branches:
             logging.warning(
                 "No branches created for node %s; check branching strategy.", node
             )
+            self._unbranched_bound = max(self._unbranched_bound, sol.upper_bound)
 
-        for decision in branches:
-            child = self.node_factory.create_child(node, decision)
+        # the relaxation, heuristics and tracking are measured by the factory
+        children = self.node_factory.create_children(node, list(branches))
+        start = profiler.now()
+        self.branching_strategy.on_children(node, children)
+        start = profiler.lap(Phase.BRANCHING, start)
+        for child in children:
             self.search_strategy.enqueue(child)
             child.status = NodeStatus.ENQUEUED
+        profiler.lap(Phase.QUEUE, start)
 
         node.status = NodeStatus.BRANCHED
         return node.status
 
-    def search(self, iteration_limit: int = 10_000) -> Optional[RelaxedSolution]:
+    def search(
+        self,
+        iteration_limit: int = 10_000,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+        absolute_gap: Optional[float] = None,
+        relative_gap: Optional[float] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = 1000,
+    ) -> Optional[RelaxedSolution]:
         """
-        Run the branch-and-bound algorithm to optimum or until iteration_limit is reached.
+        Run the branch-and-bound algorithm to optimum or until a stopping criterion fires.
 
         Args:
             iteration_limit: max number of nodes to process before aborting.
+            time_limit: stop after this many seconds (checked after every node).
+            node_limit: stop once this many nodes have been created.
+            absolute_gap: stop once upper bound - best value <= absolute_gap.
+            relative_gap: stop once (upper bound - best value) / |upper bound|
+                <= relative_gap.
+            checkpoint_path: if given, the open nodes, the incumbent and the node
+                counter are written to this file every `checkpoint_every`
+                iterations, when a limit is reached and on KeyboardInterrupt.
+                Continue such a search with `resume`.
+            checkpoint_every: number of iterations between two checkpoints.
 
         Returns:
             The best feasible solution found (relaxed) or None if none found.
+            See `self.result` for its bound and gap.
 
         Raises:
-            ValueError: if the iteration_limit is reached without completion.
+            ValueError: if the iteration_limit is reached without completion
+                (`self.result` still holds the best solution found).
         """
         # Initialize root node and progress tracking
         root = self.node_factory.create_root()
         self.search_strategy.enqueue(root)
+        return self._run(
+            iteration_limit,
+            time_limit,
+            node_limit,
+            absolute_gap,
+            relative_gap,
+            checkpoint_path,
+            checkpoint_every,
+        )
+
+    def resume(
+        self,
+        checkpoint_path: str,
+        iteration_limit: int = 10_000,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+        absolute_gap: Optional[float] = None,
+        relative_gap: Optional[float] = None,
+        checkpoint_every: int = 1000,
+    ) -> Optional[RelaxedSolution]:
+        """
+        Continue a search from a checkpoint written by `search` or `resume`.
+
+        Use a fresh `BnBSearch` with the same instance and components (and the
+        same `presolve` setting) as the checkpointed search. The checkpoint is
+        updated in the same way as by `search`. The visualization of
+        `TrackerMode.FULL` cannot be resumed.
+
+        Args:
+            checkpoint_path: the checkpoint file.
+            iteration_limit, time_limit, node_limit, absolute_gap, relative_gap:
+                the stopping criteria of this run as for `search`.
+            checkpoint_every: number of iterations between two checkpoints.
+
+        Returns:
+            The best feasible solution found (relaxed) or None if none found.
+
+        Raises:
+            ValueError: if the checkpoint does not fit this search, or if the
+                iteration_limit is reached without completion.
+        """
+        if self.progress_tracker.mode == TrackerMode.FULL:
+            raise ValueError("Resuming requires TrackerMode.SAMPLED or SILENT.")
+        checkpoint = read_checkpoint(checkpoint_path, self.instance, self.node_factory)
+        if checkpoint.incumbent is not None:
+            self.solutions.add(checkpoint.incumbent)
+        self.node_factory.restore_counter(checkpoint.num_nodes)
+        self.iterations_before_resume = checkpoint.num_iterations
+        for node in checkpoint.nodes:
+            self.search_strategy.enqueue(node)
+        logging.info(
+            "Resuming from %s with %d open nodes after %d iterations.",
+            checkpoint_path,
+            len(checkpoint.nodes),
+            checkpoint.num_iterations,
+        )
+        return self._run(
+            iteration_limit,
+            time_limit,
+            node_limit,
+            absolute_gap,
+            relative_gap,
+            checkpoint_path,
+            checkpoint_every,
+        )
+
+    def write_checkpoint(self, checkpoint_path: str) -> None:
+        """
+        Write the open nodes, the incumbent and the node counter to a file.
+        """
+        write_checkpoint(
+            checkpoint_path,
+            self.instance,
+            self.search_strategy.nodes_in_queue(),
+            self.solutions.best_solution(),
+            num_nodes=self.node_factory.num_nodes(),
+            num_iterations=self.iterations_before_resume
+            + self.progress_tracker.num_iterations,
+        )
+
+    def _bounds(self) -> tuple[Optional[RelaxedSolution], float, float]:
+        """
+        Return the best solution (of the original instance), its value and the
+        proven upper bound.
+        """
+        best = self.solutions.best_solution()
+        upper_bound = max(self.search_strategy.upper_bound(), self._unbranched_bound)
+        if self.presolve_result is not None:
+            best = self.presolve_result.restore(best)
+            upper_bound += self.presolve_result.fixed_value
+        lower_bound = best.value() if best is not None else -math.inf
+        return best, lower_bound, max(upper_bound, lower_bound)
+
+    def _finish(
+        self, reason: TerminationReason, start: float
+    ) -> Optional[RelaxedSolution]:
+        """
+        Store the `SearchResult` in `self.result` and return the best solution.
+        """
+        best, lower_bound, upper_bound = self._bounds()
+        if reason == TerminationReason.OPTIMAL:
+            if self._unbranched_bound > self.solutions.best_solution_value():
+                reason = TerminationReason.UNBRANCHED
+            else:
+                upper_bound = lower_bound
+        self.result = SearchResult(
+            solution=best,
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            gap=upper_bound - lower_bound,
+            relative_gap=_relative_gap(lower_bound, upper_bound),
+            reason=reason,
+            iterations=self.progress_tracker.num_iterations,
+            seconds=time.perf_counter() - start,
+            profile=self.profiler.report(),
+        )
+        logging.info("Search stopped (%s) with gap %g.", reason.value, self.result.gap)
+        return best
+
+    def _run(
+        self,
+        iteration_limit: int,
+        time_limit: Optional[float],
+        node_limit: Optional[int],
+        absolute_gap: Optional[float],
+        relative_gap: Optional[float],
+        checkpoint_path: Optional[str],
+        checkpoint_every: int,
+    ) -> Optional[RelaxedSolution]:
+        """
+        Process the queued nodes (see `search`).
+        """
+        search_start = time.perf_counter()
+        deadline = search_start + time_limit if time_limit is not None else math.inf
+        check_gap = absolute_gap is not None or relative_gap is not None
+        profiler = self.profiler
         self.progress_tracker.start_search()
 
-        for iteration in range(1, iteration_limit + 1):
-            if not self.search_strategy.has_next():
-                break
-
-            node = self.search_strategy.next()
-            self.progress_tracker.start_iteration(node)
-            status = self._process_node(node)
-            self.progress_tracker.end_iteration(status)
-
-            # Global prune: no better solution exists
-            if (
-                self.search_strategy.upper_bound()
-                <= self.solutions.best_solution_value()
-            ):
-                logging.info("Global prune at iteration %d", iteration)
-                for pruned_node in self.search_strategy.nodes_in_queue():
-                    pruned_node.status = NodeStatus.PRUNED
-                    self.progress_tracker.on_node_pruned(
-                        pruned_node, self.solutions.best_solution()
-                    )
-                break
-
-        else:
-            # Iteration limit exhausted without finishing
-            raise ValueError(f"Iteration limit of {iteration_limit} reached")
+        reason = TerminationReason.OPTIMAL
+        unfinished: Optional[BnBNode] = None  # dequeued, but not processed yet
+        try:
+            for iteration in range(1, iteration_limit + 1):
+                start = profiler.now()
+                if not self.search_strategy.has_next():
+                    break
+
+                node = unfinished = self.search_strategy.next()
+                start = profiler.lap(Phase.QUEUE, start)
+                self.progress_tracker.start_iteration(node)
+                profiler.lap(Phase.TRACKING, start)
+                status = self._process_node(node)
+                unfinished = None
+                profiler.end_iteration()
+                start = profiler.now()
+                self.progress_tracker.end_iteration(status)
+                start = profiler.lap(Phase.TRACKING, start)
+
+                # Global prune: no better solution exists
+                queue_bound = self.search_strategy.upper_bound()
+                start = profiler.lap(Phase.QUEUE, start)
+                best_value = self.solutions.best_solution_value()
+                profiler.lap(Phase.SOLUTIONS, start)
+                if queue_bound <= best_value:
+                    logging.info("Global prune at iteration %d", iteration)
+                    for pruned_node in self.search_strategy.nodes_in_queue():
+                        pruned_node.status = NodeStatus.PRUNED
+                        self.progress_tracker.on_node_pruned(
+                            pruned_node, self.solutions.best_solution()
+                        )
+                    break
+
+                if checkpoint_path is not None and iteration % checkpoint_every == 0:
+                    start = profiler.now()
+                    self.write_checkpoint(checkpoint_path)
+                    profiler.lap(Phase.CHECKPOINT, start)
+
+                # Anytime stopping criteria
+                if time.perf_counter() >= deadline:
+                    reason = TerminationReason.TIME_LIMIT
+                elif (
+                    node_limit is not None
+                    and self.node_factory.num_nodes() >= node_limit
+                ):
+                    reason = TerminationReason.NODE_LIMIT
+                elif check_gap:
+                    _, lower_bound, upper_bound = self._bounds()
+                    if (
+                        absolute_gap is not None
+                        and upper_bound - lower_bound <= absolute_gap
+                    ) or (
+                        relative_gap is not None
+                        and _relative_gap(lower_bound, upper_bound) <= relative_gap
+                    ):
+                        reason = TerminationReason.GAP
+                if reason != TerminationReason.OPTIMAL:
+                    if checkpoint_path is not None and self.search_strategy.has_next():
+                        self.write_checkpoint(checkpoint_path)
+                    break
+
+            else:
+                # Iteration limit exhausted without finishing
+                if checkpoint_path is not None:
+                    self.write_checkpoint(checkpoint_path)
+                self._finish(TerminationReason.ITERATION_LIMIT, search_start)
+                raise ValueError(f"Iteration limit of {iteration_limit} reached")
+        except KeyboardInterrupt:
+            if checkpoint_path is not None:
+                if unfinished is not None:
+                    # process it again after resuming (children may be duplicated)
+                    self.search_strategy.enqueue(unfinished)
+                self.write_checkpoint(checkpoint_path)
+            raise
 
         self.progress_tracker.end_search()
-        return self.solutions.best_solution()
+        return self._finish(reason, search_start)
@@ -7,6 +7,12 @@ and a factory to create new nodes. A node encapsulates:
   - branching decisions (which items are fixed to 0 or 1),
   - metadata (depth, unique IDs, status).
 
+In compact mode (`NodeFactory(compact=True)`), an open node only keeps its bound,
+the branched item and a pointer into a shared trail of decisions. Its decisions and
+relaxed solution are rebuilt when they are accessed, i.e., when it is dequeued, so
+the memory of the open list grows with the depth of the nodes instead of the number
+of items.
+
 You will not modify this file directly; instead, focus on supplying your own
 `BranchingDecisions` and `RelaxationSolver` implementations.
 """
@@ -14,11 +20,13 @@ You will not modify this file directly; instead, focus on supplying your own
 from __future__ import annotations
 
 from enum import Enum
-from typing import Callable, Optional
+from typing import Callable, Optional, Sequence
 
 from .branching_decisions import BranchingDecisions
+from .heuristic_scheduler import HeuristicScheduler
 from .heuristics import Heuristics, HeuristicSolution
 from .instance import Instance
+from .profiling import DISABLED, Phase, SearchProfiler
 from .relaxation import RelaxationSolver, RelaxedSolution
 
 
@@ -35,26 +43,71 @@ class NodeStatus(Enum):
     UNKNOWN = "Unknown"
 
 
+class _TrailEntry:
+    """
+    One step of a decision trail: the item fixed relative to the parent entry.
+    Root entries (and nodes whose decisions differ in more than one item from
+    their parent's) keep their complete decisions instead.
+    """
+
+    __slots__ = ("parent", "item_index", "value", "decisions")
+
+    def __init__(
+        self,
+        parent: Optional[_TrailEntry],
+        item_index: int = -1,
+        value: int = -1,
+        decisions: Optional[BranchingDecisions] = None,
+    ) -> None:
+        self.parent = parent
+        self.item_index = item_index
+        self.value = value
+        self.decisions = decisions
+
+    def restore(self) -> BranchingDecisions:
+        """
+        Rebuild the (frozen) decisions by replaying the trail from its root.
+        """
+        fixations = []
+        entry = self
+        while entry.decisions is None:
+            fixations.append((entry.item_index, entry.value))
+            entry = entry.parent
+        if not fixations:
+            return entry.decisions
+        decisions = entry.decisions.copy()
+        for item_index, value in reversed(fixations):
+            decisions.fix(item_index, value)
+        return decisions.freeze()
+
+
 class BnBNode:
     """
     Represents a node in the branch-and-bound tree.
 
     Attributes:
-        relaxed_solution: a copy of the bounding solution under current decisions.
-        branching_decisions: a copy of fixed/undef decisions for each item.
+        relaxed_solution: the (immutable) bounding solution under current decisions.
+        branching_decisions: the read-only fixed/undef decisions for each item.
         depth: tree depth (root = 0).
         node_id: unique identifier for tie-breaking and tracking.
         parent_id: optional ID of the parent node.
         status: current NodeStatus (initialized to UNKNOWN).
+        upper_bound: the bound of the relaxed solution, available without materializing.
 
-    You should not modify `relaxed_solution` or `branching_decisions` in place.
-    Use `copy()` methods if you need to inspect and adjust.
+    The node shares its relaxed solution and decisions instead of copying them,
+    so accessing them is free. Both are read-only: use their `copy()` methods
+    if you need to adjust them (e.g., `branching_decisions.copy().fix(...)`).
+
+    A compact node has dropped both and rebuilds them on access via its trail.
     """
 
     __slots__ = (
         "_heuristic_solution",
         "_relaxed_solution",
         "_branching_decisions",
+        "_upper_bound",
+        "_trail",
+        "_factory",
         "depth",
         "node_id",
         "parent_id",
@@ -69,10 +122,16 @@ class BnBNode:
         node_id: int,
         parent_id: Optional[int] = None,
     ) -> None:
-        # Store private copies to prevent external mutation
+        # Relaxed solutions are immutable and the decisions are frozen,
+        # so both can be shared instead of copied.
         self._heuristic_solution: HeuristicSolution | None = None
-        self._relaxed_solution = relaxed_solution.copy()
-        self._branching_decisions = branching_decisions.copy()
+        self._relaxed_solution = relaxed_solution
+        self._branching_decisions: BranchingDecisions | None = (
+            branching_decisions.freeze()
+        )
+        self._upper_bound = relaxed_solution.upper_bound
+        self._trail: _TrailEntry | None = None
+        self._factory: NodeFactory | None = None
         self.depth = depth
         self.node_id = node_id
         self.parent_id = parent_id
@@ -88,29 +147,45 @@ class BnBNode:
     @property
     def heuristic_solution(self) -> HeuristicSolution | None:
         """
-        Return a copy of the heuristic solution to avoid in-place edits.
+        Return the (immutable) heuristic solution of this node, if any.
         """
-        if self._heuristic_solution is None:
-            return None
-        return self._heuristic_solution.copy()
+        return self._heuristic_solution
 
     @heuristic_solution.setter
     def heuristic_solution(self, heuristic_solution: HeuristicSolution | None) -> None:
         self._heuristic_solution = heuristic_solution
 
+    @property
+    def upper_bound(self) -> float:
+        """
+        Return the upper bound of the relaxed solution of this node.
+        Unlike `relaxed_solution.upper_bound`, this never rebuilds a compact node.
+        """
+        return self._upper_bound
+
     @property
     def relaxed_solution(self) -> RelaxedSolution:
         """
-        Return a copy of the relaxed solution to avoid in-place edits.
+        Return the (immutable) relaxed solution of this node.
         """
-        return self._relaxed_solution.copy()
+        if self._relaxed_solution is None:
+            self._factory._materialize(self)
+        return self._relaxed_solution
 
     @property
     def branching_decisions(self) -> BranchingDecisions:
         """
-        Return a copy of the branching decisions to avoid in-place edits.
+        Return the read-only branching decisions of this node.
         """
-        return self._branching_decisions.copy()
+        if self._branching_decisions is None:
+            self._branching_decisions = self._trail.restore()
+        return self._branching_decisions
+
+    def is_compact(self) -> bool:
+        """
+        Return True if the node currently does not hold its full state.
+        """
+        return self._relaxed_solution is None
 
 
 class NodeFactory:
@@ -120,29 +195,55 @@ class NodeFactory:
     Args:
         instance: your Knapsack problem instance.
         relaxation: a RelaxationSolver to compute upper bounds.
-        heuristics: a Heuristics instance to generate feasible solutions.
+        heuristics: a Heuristics instance to generate feasible solutions, or a
+                    `HeuristicScheduler` deciding when to run them.
         on_new_node: callback invoked after each node creation (e.g. for logging).
+        decisions_type: the `BranchingDecisions` implementation of the root node,
+                        e.g., `BitsetBranchingDecisions`. Children inherit it via `split_on`.
+        compact: create compact children that store a decision trail instead of
+                 their decisions and relaxed solution (see the module docstring).
+                 Heuristics then only run for processed nodes.
+        profiler: measures the relaxation, heuristics and `on_new_node` calls
+                  (see `SearchProfiler`).
     """
 
     def __init__(
         self,
         instance: Instance,
         relaxation: RelaxationSolver,
-        heuristics: Heuristics,
+        heuristics: Heuristics | HeuristicScheduler,
         on_new_node: Callable[[BnBNode], None],
+        decisions_type: type[BranchingDecisions] = BranchingDecisions,
+        compact: bool = False,
+        profiler: SearchProfiler = DISABLED,
     ) -> None:
         self._instance = instance
+        self._profiler = profiler
+        self._compact = compact
+        self._decisions_type = decisions_type
         self._relaxation = relaxation
-        self._heuristics = heuristics
+        self._heuristics = (
+            heuristics
+            if isinstance(heuristics, HeuristicScheduler)
+            else HeuristicScheduler(heuristics)
+        )
         self._on_new_node = on_new_node
         self._node_counter = 0
 
-    def create_root(self) -> BnBNode:
+    def create_root(self, decisions: Optional[BranchingDecisions] = None) -> BnBNode:
         """
         Create the root node with no fixations (all decisions None).
+        Pass `decisions` to create the root of a subtree with these fixations instead.
         """
-        initial_decisions = BranchingDecisions(len(self._instance.items))
+        initial_decisions = (
+            decisions
+            if decisions is not None
+            else self._decisions_type(len(self._instance.items))
+        )
+        profiler = self._profiler
+        start = profiler.now()
         relaxed_solution = self._relaxation.solve(self._instance, initial_decisions)
+        profiler.lap(Phase.RELAXATION, start)
         root = BnBNode(
             relaxed_solution=relaxed_solution,
             branching_decisions=initial_decisions,
@@ -150,13 +251,23 @@ class NodeFactory:
             node_id=self._node_counter,
             parent_id=None,
         )
-        heuristic_solutions = self._heuristics.search(self._instance, relaxed_solution)
+        root._factory = self
+        if self._compact:
+            root._trail = _TrailEntry(None, decisions=root.branching_decisions)
+        start = profiler.now()
+        runs = self._heuristics.num_calls
+        heuristic_solutions = self._heuristics.search(
+            self._instance, root, at_creation=True
+        )
+        profiler.lap(Phase.HEURISTICS, start, self._heuristics.num_calls > runs)
         root.heuristic_solution = (
             heuristic_solutions[0] if heuristic_solutions else None
         )
 
         self._node_counter += 1
+        start = profiler.now()
         self._on_new_node(root)
+        profiler.lap(Phase.TRACKING, start)
         return root
 
     def create_child(self, parent: BnBNode, decisions: BranchingDecisions) -> BnBNode:
@@ -165,7 +276,33 @@ class NodeFactory:
 
         Depth is parent.depth+1; `parent_id` is parent.node_id.
         """
-        relaxed_solution = self._relaxation.solve(self._instance, decisions)
+        return self.create_children(parent, [decisions])[0]
+
+    def create_children(
+        self, parent: BnBNode, decisions_list: Sequence[BranchingDecisions]
+    ) -> list[BnBNode]:
+        """
+        Create the children of `parent` for all `decisions_list` at once, so the
+        relaxation solver can share work between the siblings (see
+        `RelaxationSolver.solve_batch`).
+        """
+        parent_solution = parent.relaxed_solution
+        start = self._profiler.now()
+        relaxed_solutions = self._relaxation.solve_batch(
+            self._instance, decisions_list, parent_solution
+        )
+        self._profiler.lap(Phase.RELAXATION, start)
+        return [
+            self._create_child(parent, decisions, relaxed_solution)
+            for decisions, relaxed_solution in zip(decisions_list, relaxed_solutions)
+        ]
+
+    def _create_child(
+        self,
+        parent: BnBNode,
+        decisions: BranchingDecisions,
+        relaxed_solution: RelaxedSolution,
+    ) -> BnBNode:
         child = BnBNode(
             relaxed_solution=relaxed_solution,
             branching_decisions=decisions,
@@ -173,15 +310,91 @@ class NodeFactory:
             node_id=self._node_counter,
             parent_id=parent.node_id,
         )
-        heuristic_solutions = self._heuristics.search(self._instance, relaxed_solution)
-        child.heuristic_solution = (
-            heuristic_solutions[0] if heuristic_solutions else None
-        )
+        child._factory = self
+        profiler = self._profiler
+        if self._compact:
+            child._trail = self._trail_entry(parent, decisions)
+        else:
+            start = profiler.now()
+            runs = self._heuristics.num_calls
+            heuristic_solutions = self._heuristics.search(
+                self._instance, child, at_creation=True
+            )
+            profiler.lap(Phase.HEURISTICS, start, self._heuristics.num_calls > runs)
+            child.heuristic_solution = (
+                heuristic_solutions[0] if heuristic_solutions else None
+            )
 
         self._node_counter += 1
+        start = profiler.now()
         self._on_new_node(child)
+        profiler.lap(Phase.TRACKING, start)
+        if self._compact:
+            child._relaxed_solution = None
+            child._branching_decisions = None
         return child
 
+    def restore_node(
+        self,
+        decisions: BranchingDecisions,
+        upper_bound: float,
+        depth: int,
+        node_id: int,
+        parent_id: Optional[int],
+    ) -> BnBNode:
+        """
+        Recreate an open node (e.g., read back from disk) without solving its
+        relaxation: the relaxed solution is rebuilt when it is accessed.
+        """
+        node = BnBNode.__new__(BnBNode)
+        node._heuristic_solution = None
+        node._relaxed_solution = None
+        node._branching_decisions = decisions.freeze()
+        node._upper_bound = upper_bound
+        node._trail = _TrailEntry(None, decisions=node._branching_decisions)
+        node._factory = self
+        node.depth = depth
+        node.node_id = node_id
+        node.parent_id = parent_id
+        node.status = NodeStatus.ENQUEUED
+        return node
+
+    @property
+    def decisions_type(self) -> type[BranchingDecisions]:
+        return self._decisions_type
+
+    def _trail_entry(
+        self, parent: BnBNode, decisions: BranchingDecisions
+    ) -> _TrailEntry:
+        """
+        Return the trail entry of a child of `parent` with `decisions`.
+        """
+        index = decisions.last_fixed
+        parent_decisions = parent.branching_decisions
+        if (
+            parent._trail is not None
+            and index is not None
+            and parent_decisions[index] is None
+            and decisions.num_fixed() == parent_decisions.num_fixed() + 1
+        ):
+            return _TrailEntry(parent._trail, index, decisions[index])
+        return _TrailEntry(None, decisions=decisions)
+
+    def _materialize(self, node: BnBNode) -> None:
+        """
+        Rebuild the relaxed solution of a compact node from its decisions.
+        """
+        decisions = node.branching_decisions
+        start = self._profiler.now()
+        node._relaxed_solution = self._relaxation.solve(self._instance, decisions)
+        self._profiler.lap(Phase.RELAXATION, start)
+
+    def restore_counter(self, num_nodes: int) -> None:
+        """
+        Continue the node IDs after `num_nodes` nodes, e.g., when resuming a search.
+        """
+        self._node_counter = max(self._node_counter, num_nodes)
+
     def num_nodes(self) -> int:
         """
         Return the total number of nodes created so far.
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class BranchingDecisions:
     """
     Represents the binary branching decisions made during the branch-and-bound algorithm.
@@ -18,10 +21,25 @@ class BranchingDecisions:
             Iterate over the branching decisions.
         split_on(index) -> (BranchingDecisions, BranchingDecisions)
             Split the branching decisions into two based on the specified index.
+        last_fixed -> int | None
+            The index of the most recently fixed variable (None if nothing is fixed).
+        freeze() -> BranchingDecisions
+            Make the decisions read-only, e.g., when they are attached to a node.
+        num_fixed() -> int
+            Get the number of fixed variables.
+        to_bitmasks() / from_bitmasks(length, fixed, values)
+            Convert to and from two integer bitmasks, e.g., for serialization.
+        to_array() -> np.ndarray
+            Get all decisions at once: -1 for unfixed items, 0 or 1 for fixed ones.
+            Prefer it to accessing many items one by one.
+
+    Decisions with the same assignments compare equal and have the same hash.
     """
 
     def __init__(self, length: int) -> None:
         self._assignments: list[int | None] = [None] * length
+        self._last_fixed: int | None = None
+        self._frozen = False
 
     def __getitem__(self, item_index: int) -> int | None:
         return self._assignments[item_index]
@@ -31,12 +49,30 @@ class BranchingDecisions:
         Fixes the usage of an item in the knapsack to the specified value.
         Only do this if you are sure that you do not prohibit the optimal solution.
         """
+        assert not self._frozen, "Decisions are read-only; fix a copy() instead."
         assert value in {0, 1}, "Value must be 0 or 1."
         assert self._assignments[item_index] is None, "Item is already fixed."
         self._assignments[item_index] = value
+        self._last_fixed = item_index
+
+    @property
+    def last_fixed(self) -> int | None:
+        """
+        The index of the most recently fixed item, or None if no item has been fixed.
+        For the children created by `split_on`, this is the index that was split on.
+        """
+        return self._last_fixed
+
+    def freeze(self) -> "BranchingDecisions":
+        """
+        Make the decisions read-only, so they can be shared without copying.
+        Returns the decisions themselves; `copy()` gives a modifiable version.
+        """
+        self._frozen = True
+        return self
 
     def copy(self) -> "BranchingDecisions":
-        """Create a copy of the branching decisions.
+        """Create a modifiable copy of the branching decisions.
 
         Returns:
             BranchingDecisions: A copy of the branching decisions.
@@ -47,6 +83,7 @@ class BranchingDecisions:
         """
         copy = BranchingDecisions(len(self))
         copy._assignments = self._assignments.copy()
+        copy._last_fixed = self._last_fixed
         return copy
 
     def included_items(self) -> list[int]:
@@ -61,12 +98,59 @@ class BranchingDecisions:
         """
         return [idx for idx, assigned in enumerate(self._assignments) if assigned == 0]
 
+    def num_fixed(self) -> int:
+        """
+        Returns the number of fixed items.
+        """
+        return len(self._assignments) - self._assignments.count(None)
+
+    def to_bitmasks(self) -> tuple[int, int]:
+        """
+        Returns the decisions as two bitmasks (see `BitsetBranchingDecisions`):
+        the fixed items and the items fixed to 1.
+        """
+        fixed = "".join("0" if x is None else "1" for x in reversed(self))
+        values = "".join("1" if x == 1 else "0" for x in reversed(self))
+        return int(fixed or "0", 2), int(values or "0", 2)
+
+    def to_array(self) -> np.ndarray:
+        """
+        Returns the decisions as int8 array: -1 for unfixed items, 0 or 1 for
+        fixed ones.
+        """
+        return np.array(
+            [-1 if x is None else x for x in self._assignments], dtype=np.int8
+        )
+
+    @classmethod
+    def from_bitmasks(
+        cls, length: int, fixed: int, values: int
+    ) -> "BranchingDecisions":
+        """
+        Create decisions from the bitmasks of `to_bitmasks`.
+        `last_fixed` is not restored.
+        """
+        decisions = cls(length)
+        decisions._assignments = [
+            (values >> i & 1) if fixed >> i & 1 else None for i in range(length)
+        ]
+        return decisions
+
     def __len__(self) -> int:
         return len(self._assignments)
 
     def __iter__(self):
         return iter(self._assignments)
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BranchingDecisions):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __hash__(self) -> int:
+        # consistent with the bitmasks of `BitsetBranchingDecisions`
+        return hash((len(self), *self.to_bitmasks()))
+
     def is_fixed(self) -> bool:
         """Check if all items are fixed.
 
@@ -108,3 +192,163 @@ class BranchingDecisions:
         left.fix(item_index, 0)
         right.fix(item_index, 1)
         return left, right
+
+
+class BitsetBranchingDecisions(BranchingDecisions):
+    """
+    Branching decisions stored in two integer bitmasks instead of a list.
+
+    Bit `i` of `fixed` is set if item `i` is fixed, and bit `i` of `values` is set
+    if it is fixed to 1. Splitting only sets one bit in each child, counting the
+    fixed items is a popcount, and hashing/comparing is done on the two integers,
+    so nodes can be deduplicated cheaply.
+
+    It provides the same interface as `BranchingDecisions` and can be used
+    wherever those are expected. Accessing a single item costs O(n / 64) on
+    Python integers, so code that reads many items should use `to_array` (or
+    iterate), which unpacks both bitmasks at once.
+
+    Args:
+        length (int): Number of variables.
+    """
+
+    def __init__(self, length: int) -> None:
+        self._length = length
+        self._fixed = 0
+        self._values = 0
+        self._last_fixed: int | None = None
+        self._frozen = False
+
+    def _bit(self, item_index: int) -> int:
+        if item_index < 0:
+            item_index += self._length
+        if not 0 <= item_index < self._length:
+            raise IndexError("Item index out of range.")
+        return 1 << item_index
+
+    def __getitem__(self, item_index: int) -> int | None:
+        bit = self._bit(item_index)
+        if not self._fixed & bit:
+            return None
+        return 1 if self._values & bit else 0
+
+    def fix(self, item_index: int, value: int) -> None:
+        """
+        Fixes the usage of an item in the knapsack to the specified value.
+        Only do this if you are sure that you do not prohibit the optimal solution.
+        """
+        assert not self._frozen, "Decisions are read-only; fix a copy() instead."
+        assert value in {0, 1}, "Value must be 0 or 1."
+        bit = self._bit(item_index)
+        assert not self._fixed & bit, "Item is already fixed."
+        self._fixed |= bit
+        if value:
+            self._values |= bit
+        self._last_fixed = item_index % self._length
+
+    def _derive(self, fixed: int, values: int, last_fixed: int | None):
+        decisions = BitsetBranchingDecisions(self._length)
+        decisions._fixed = fixed
+        decisions._values = values
+        decisions._last_fixed = last_fixed
+        return decisions
+
+    def copy(self) -> "BitsetBranchingDecisions":
+        """
+        Create a modifiable copy of the branching decisions.
+        """
+        return self._derive(self._fixed, self._values, self._last_fixed)
+
+    def _unpack(self, mask: int) -> np.ndarray:
+        """
+        Return the bits of `mask` as uint8 array of length `len(self)`.
+        """
+        data = mask.to_bytes((self._length + 7) // 8, "little")
+        return np.unpackbits(
+            np.frombuffer(data, dtype=np.uint8), count=self._length, bitorder="little"
+        )
+
+    def included_items(self) -> list[int]:
+        """
+        Returns a list of fixed included items
+        """
+        return np.flatnonzero(self._unpack(self._values)).tolist()
+
+    def excluded_items(self) -> list[int]:
+        """
+        Returns a list of fixed excluded items
+        """
+        return np.flatnonzero(self._unpack(self._fixed & ~self._values)).tolist()
+
+    def num_fixed(self) -> int:
+        """
+        Returns the number of fixed items.
+        """
+        return self._fixed.bit_count()
+
+    def to_bitmasks(self) -> tuple[int, int]:
+        """
+        Returns the decisions as two bitmasks: the fixed items and the items fixed to 1.
+        """
+        return self._fixed, self._values
+
+    @classmethod
+    def from_bitmasks(
+        cls, length: int, fixed: int, values: int
+    ) -> "BitsetBranchingDecisions":
+        """
+        Create decisions from the bitmasks of `to_bitmasks`.
+        `last_fixed` is not restored.
+        """
+        decisions = cls(length)
+        decisions._fixed = fixed
+        decisions._values = values & fixed
+        return decisions
+
+    def to_array(self) -> np.ndarray:
+        """
+        Returns the decisions as int8 array: -1 for unfixed items, 0 or 1 for
+        fixed ones.
+        """
+        # `values` is a subset of `fixed`: unfixed -1, fixed to 0 or 1 stays
+        array = self._unpack(self._fixed).astype(np.int8) - 1
+        array += self._unpack(self._values).view(np.int8)
+        return array
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        return iter([None if x < 0 else x for x in self.to_array().tolist()])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitsetBranchingDecisions):
+            return (self._length, self._fixed, self._values) == (
+                other._length,
+                other._fixed,
+                other._values,
+            )
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash((self._length, self._fixed, self._values))
+
+    def is_fixed(self) -> bool:
+        """
+        Check if all items are fixed.
+        """
+        return self._fixed.bit_count() == self._length
+
+    def split_on(
+        self, item_index: int
+    ) -> tuple["BitsetBranchingDecisions", "BitsetBranchingDecisions"]:
+        """
+        Split the branching decisions into two based on the specified item index.
+        The left instance does not use the item, while the right instance uses it.
+        """
+        bit = self._bit(item_index)
+        assert not self._fixed & bit, "Item is already fixed."
+        item_index %= self._length
+        left = self._derive(self._fixed | bit, self._values, item_index)
+        right = self._derive(self._fixed | bit, self._values | bit, item_index)
+        return left, right
@@ -8,12 +8,19 @@ is not yet a feasible integer solution. At each branching step:
  3. If all variables are fixed, no branches are returned (leaf node).
 
 You should implement your own strategies by subclassing `BranchingStrategy`.
+Strategies that learn from the bounds of the created children (e.g.,
+`PseudocostBranchingStrategy`) override `on_children`.
 """
 
+import math
 from abc import ABC, abstractmethod
-from typing import Iterable, Tuple
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
 
 from .bnb_nodes import BnBNode, BranchingDecisions
+from .instance import Instance
+from .relaxation import RelaxationSolver
 
 
 class BranchingStrategy(ABC):
@@ -32,6 +39,12 @@ class BranchingStrategy(ABC):
         """
         ...
 
+    def on_children(self, node: BnBNode, children: Sequence[BnBNode]) -> None:
+        """
+        Called by the search with the children created from the decisions of the
+        last `make_branching_decisions(node)` call. Does nothing by default.
+        """
+
 
 class FirstUndecidedBranchingStrategy(BranchingStrategy):
     """
@@ -63,9 +76,11 @@ class MyBranchingStrategy(BranchingStrategy):
         decisions = node.branching_decisions
 
         # best value/weight ratio
+        weights = relaxed.instance.weights.tolist()
+        values = relaxed.instance.values.tolist()
         candidates = [
-            (item.value / item.weight, i)
-            for i, (x1, x2, item) in enumerate(zip(relaxed.selection, decisions, relaxed.instance.items))
+            (values[i] / weights[i], i)
+            for i, (x1, x2) in enumerate(zip(relaxed.selection, decisions))
             if x2 is None and 0.0 < x1 < 1.0
         ]
 
@@ -75,6 +90,207 @@ class MyBranchingStrategy(BranchingStrategy):
         _, best_index = max(candidates)
 
         return decisions.split_on(best_index)
-        
 
 
+class PseudocostBranchingStrategy(BranchingStrategy):
+    """
+    Reliability branching: branch on the candidate whose children are expected
+    to lower the bound the most.
+
+    Candidates are the unfixed items around the boundary between packed and
+    unpacked items in order of decreasing value/weight ratio: the fractional
+    items and `window` unfixed items on either side (see `_candidates`). Per item
+    and direction (down: fix to 0, up: fix to 1), the strategy keeps a
+    pseudocost: the average decrease of the bound per unit change of the item,
+    learned from the bounds of the children compared to their parent (see
+    `on_children`). The score of a
+    candidate with value x is the product of its estimated decreases
+    pc_down * x and pc_up * (1 - x). For an integral candidate, one child keeps
+    the relaxed solution, so it only wins if that child still lowers the bound
+    (as with `MartelloTothRelaxationSolver`, whose bound depends on the
+    neighbors of the critical item).
+
+    Until both pseudocosts of a candidate rest on `reliability` observations, the
+    children of up to `max_strong_candidates` such candidates are solved with
+    `relaxation` (strong branching); their exact decreases are used as score and
+    as observations. Unobserved pseudocosts are estimated by the average over
+    all items.
+
+    Args:
+        relaxation: the solver for strong branching, usually the search's relaxation.
+        reliability: number of observations after which a pseudocost is trusted.
+        max_strong_candidates: maximal number of strong-branching candidates per
+                               node (0 disables strong branching).
+        window: number of unfixed items in front of and behind the fractional
+                items that are candidates as well.
+    """
+
+    def __init__(
+        self,
+        relaxation: RelaxationSolver,
+        reliability: int = 4,
+        max_strong_candidates: int = 8,
+        window: int = 1,
+    ) -> None:
+        self._relaxation = relaxation
+        self._reliability = reliability
+        self._max_strong_candidates = max_strong_candidates
+        self._window = window
+        self._instance: Optional[Instance] = None
+        self._order = np.zeros(0, dtype=np.int64)  # items by decreasing ratio
+        # row 0: down (fix to 0), row 1: up (fix to 1)
+        self._gain_sum = np.zeros((2, 0))
+        self._count = np.zeros((2, 0), dtype=np.int64)
+        # (node_id, item, value, bound) of the last branching, for `on_children`
+        self._last_branching: Optional[tuple[int, int, float, float]] = None
+        self.num_strong_branchings = 0
+
+    def _prepare(self, instance: Instance) -> None:
+        """
+        Reset the statistics for a new instance.
+        """
+        if instance is self._instance:
+            return
+        if instance.num_constraints == 1:
+            weights = instance.weights
+        else:
+            # sum of the weights relative to the capacities
+            weights = (
+                instance.weight_matrix / np.maximum(instance.capacities, 1)[:, None]
+            ).sum(axis=0)
+        ratios = np.divide(
+            instance.values,
+            weights,
+            out=np.full(len(weights), np.inf),
+            where=weights > 0,
+        )
+        self._order = np.argsort(-ratios, kind="stable")
+        self._gain_sum = np.zeros((2, len(instance.items)))
+        self._count = np.zeros((2, len(instance.items)), dtype=np.int64)
+        self._instance = instance
+
+    def _observe(self, item: int, direction: int, change: float, gain: float) -> None:
+        """
+        Record the bound decrease `gain` for a change of the item by `change`.
+        """
+        if change <= 0.0 or not math.isfinite(gain):
+            return
+        self._gain_sum[direction, item] += max(gain, 0.0) / change
+        self._count[direction, item] += 1
+
+    def pseudocosts(self, items: np.ndarray) -> np.ndarray:
+        """
+        Return the down (row 0) and up (row 1) pseudocosts of `items`; unobserved
+        ones are the average of all observed pseudocosts in that direction (or 1).
+        """
+        counts = self._count[:, items]
+        costs = self._gain_sum[:, items] / np.maximum(counts, 1)
+        observed = self._count.sum(axis=1)
+        averages = np.where(
+            observed > 0,
+            self._gain_sum.sum(axis=1) / np.maximum(observed, 1),
+            1.0,
+        )
+        return np.where(counts > 0, costs, averages[:, None])
+
+    @staticmethod
+    def _score(down_gain: np.ndarray, up_gain: np.ndarray) -> np.ndarray:
+        epsilon = 1e-6
+        return np.maximum(down_gain, epsilon) * np.maximum(up_gain, epsilon)
+
+    def _candidates(self, selection: np.ndarray, unfixed: np.ndarray) -> np.ndarray:
+        """
+        Return the unfixed items from `window` items in front of the first item
+        that is not packed completely to `window` items behind the last packed
+        item, in order of decreasing ratio. This includes all fractional items.
+        """
+        items = self._order[unfixed[self._order]]
+        values = selection[items]
+        partial = np.flatnonzero(values < 1.0)
+        packed = np.flatnonzero(values > 0.0)
+        first = partial[0] if len(partial) else len(items)
+        last = packed[-1] + 1 if len(packed) else 0
+        # first <= last, as all items in front of `first` are packed
+        begin = max(min(first - self._window, len(items) - 1), 0)
+        end = max(last + self._window, begin + 1)
+        return items[begin:end]
+
+    def _strong_branching(
+        self, node: BnBNode, items: np.ndarray, values: np.ndarray
+    ) -> np.ndarray:
+        """
+        Solve both children of each item, record the observations and return
+        the scores of the exact bound decreases.
+        """
+        relaxed = node.relaxed_solution
+        decisions = node.branching_decisions
+        bound = relaxed.upper_bound
+        scores = np.empty(len(items))
+        for k, (item, value) in enumerate(zip(items.tolist(), values.tolist())):
+            down, up = self._relaxation.solve_batch(
+                relaxed.instance, decisions.split_on(item), relaxed
+            )
+            # an infeasible child removes that branch: the largest possible decrease
+            down_gain = bound - max(down.upper_bound, 0.0)
+            up_gain = bound - max(up.upper_bound, 0.0)
+            if not down.is_infeasible():
+                self._observe(item, 0, value, down_gain)
+            if not up.is_infeasible():
+                self._observe(item, 1, 1.0 - value, up_gain)
+            scores[k] = self._score(down_gain, up_gain)
+        self.num_strong_branchings += len(items)
+        return scores
+
+    def make_branching_decisions(self, node: BnBNode) -> Tuple[BranchingDecisions, ...]:
+        relaxed = node.relaxed_solution
+        decisions = node.branching_decisions
+        self._prepare(relaxed.instance)
+        selection = relaxed.selection
+
+        unfixed = decisions.to_array() < 0
+        candidates = self._candidates(selection, unfixed)
+        if len(candidates) == 0:
+            return ()  # leaf node, nothing to branch
+
+        if len(candidates) == 1:
+            best = int(candidates[0])
+        else:
+            values = selection[candidates]
+            down_costs, up_costs = self.pseudocosts(candidates)
+            scores = self._score(down_costs * values, up_costs * (1.0 - values))
+            unreliable = np.flatnonzero(
+                self._count[:, candidates].min(axis=0) < self._reliability
+            )
+            if len(unreliable) and self._max_strong_candidates > 0:
+                # strong branching on the most promising unreliable candidates
+                count = min(len(unreliable), self._max_strong_candidates)
+                order = np.argsort(-scores[unreliable], kind="stable")
+                strong = unreliable[order[:count]]
+                scores[strong] = self._strong_branching(
+                    node, candidates[strong], values[strong]
+                )
+            best = int(candidates[np.argmax(scores)])
+
+        self._last_branching = (
+            node.node_id,
+            best,
+            float(selection[best]),
+            relaxed.upper_bound,
+        )
+        return decisions.split_on(best)
+
+    def on_children(self, node: BnBNode, children: Sequence[BnBNode]) -> None:
+        """
+        Update the pseudocosts of the branched item with the bounds of the
+        children (created in the order of `split_on`: down, then up).
+        """
+        if self._last_branching is None or self._last_branching[0] != node.node_id:
+            return
+        _, item, value, bound = self._last_branching
+        self._last_branching = None
+        if len(children) != 2:
+            return
+        down, up = children
+        # `BnBNode.upper_bound` does not rebuild compact children
+        self._observe(item, 0, value, bound - down.upper_bound)
+        self._observe(item, 1, 1.0 - value, bound - up.upper_bound)
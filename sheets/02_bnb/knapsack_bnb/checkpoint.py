@@ -0,0 +1,130 @@
+"""
+Checkpoint Module
+
+Saves the state of a running branch-and-bound search to a compact binary file
+and reads it back, so a search can be resumed after it was stopped
+(see `BnBSearch.search(checkpoint_path=...)` and `BnBSearch.resume`).
+
+File layout (little-endian):
+  - header: magic, number of items, capacity, number of created nodes,
+    number of processed nodes, CRC32 of the weights (of all constraints), values
+    and further capacities, incumbent flag,
+  - the incumbent's selection as packed bits (if any),
+  - the number of open nodes and their records (see `serialization.NodeCodec`).
+The file is written to a temporary file first and then renamed, so an interrupted
+write never destroys the previous checkpoint.
+"""
+
+import os
+import struct
+import zlib
+from typing import Iterable, NamedTuple, Optional
+
+import numpy as np
+
+from .bnb_nodes import BnBNode, NodeFactory
+from .heuristics import HeuristicSolution
+from .instance import Instance
+from .serialization import NodeCodec
+
+_MAGIC = b"BNBCKPT\x01"
+_HEADER = struct.Struct("<8sqqqqIB")
+_COUNT = struct.Struct("<q")
+
+
+class Checkpoint(NamedTuple):
+    """
+    The state read from a checkpoint file.
+    """
+
+    nodes: list[BnBNode]  # the open nodes
+    incumbent: Optional[HeuristicSolution]
+    num_nodes: int  # number of nodes created by the factory
+    num_iterations: int  # number of nodes processed before the checkpoint
+
+
+def _fingerprint(instance: Instance) -> int:
+    # the first capacity is in the header; for single-constraint instances, this
+    # is the CRC32 of the weights and values as before
+    crc = zlib.crc32(instance.weight_matrix.tobytes() + instance.values.tobytes())
+    return zlib.crc32(instance.capacities[1:].tobytes(), crc)
+
+
+def write_checkpoint(
+    path: str,
+    instance: Instance,
+    nodes: Iterable[BnBNode],
+    incumbent: Optional[HeuristicSolution],
+    num_nodes: int,
+    num_iterations: int,
+) -> None:
+    """
+    Write the open `nodes`, the `incumbent` and the counters to `path`.
+    """
+    codec = NodeCodec(len(instance.items))
+    records = codec.encode(nodes)
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(
+            _HEADER.pack(
+                _MAGIC,
+                len(instance.items),
+                instance.capacity,
+                num_nodes,
+                num_iterations,
+                _fingerprint(instance),
+                incumbent is not None,
+            )
+        )
+        if incumbent is not None:
+            file.write(np.packbits(incumbent.selection.astype(bool)).tobytes())
+        file.write(_COUNT.pack(len(records)))
+        records.tofile(file)
+    os.replace(temporary, path)
+
+
+def read_checkpoint(path: str, instance: Instance, factory: NodeFactory) -> Checkpoint:
+    """
+    Read a checkpoint of a search on `instance`; the open nodes are recreated
+    with `factory`.
+
+    Raises:
+        ValueError: if the file is no checkpoint or belongs to another instance.
+    """
+    codec = NodeCodec(len(instance.items))
+    with open(path, "rb") as file:
+        header = file.read(_HEADER.size)
+        if len(header) != _HEADER.size or header[:8] != _MAGIC:
+            raise ValueError(f"{path} is not a BnB checkpoint.")
+        (
+            _,
+            num_items,
+            capacity,
+            num_nodes,
+            num_iterations,
+            fingerprint,
+            has_incumbent,
+        ) = _HEADER.unpack(header)
+        if (
+            num_items != len(instance.items)
+            or capacity != instance.capacity
+            or fingerprint != _fingerprint(instance)
+        ):
+            raise ValueError(f"Checkpoint {path} belongs to a different instance.")
+
+        incumbent = None
+        if has_incumbent:
+            packed = np.frombuffer(file.read(codec.num_bytes), dtype=np.uint8)
+            selection = np.unpackbits(packed, count=num_items).astype(np.float64)
+            value = float(selection @ instance.values)
+            incumbent = HeuristicSolution(instance, selection, value)
+        (count,) = _COUNT.unpack(file.read(_COUNT.size))
+        records = np.fromfile(file, dtype=codec.dtype, count=count)
+    if len(records) != count:
+        raise ValueError(f"Checkpoint {path} is truncated.")
+    return Checkpoint(
+        nodes=codec.decode(records, factory),
+        incumbent=incumbent,
+        num_nodes=num_nodes,
+        num_iterations=num_iterations,
+    )
@@ -0,0 +1,113 @@
+"""
+Dynamic Programming Module
+
+Because weights and capacity are integers, the 0/1 knapsack problem can also be
+solved exactly by dynamic programming over the capacity in O(n * capacity) time.
+For instances with a small capacity (up to a few million), this is usually much
+faster than any tree search.
+
+The table row of an item is computed with a single vectorized NumPy operation:
+    best[c] = max(best[c], best[c - weight] + value)   for all c >= weight
+Only one bit per item and capacity is kept (whether the item improved the entry),
+which is enough to reconstruct an optimal selection afterwards.
+
+Usage:
+    solver = DynamicProgrammingSolver(instance)
+    best = solver.solve()
+"""
+
+import numpy as np
+
+from .heuristics import HeuristicSolution
+from .instance import Instance
+
+DEFAULT_MEMORY_BUDGET = 512 * 1024**2  # bytes
+
+
+def effective_capacity(instance: Instance) -> int:
+    """
+    The capacity the DP has to consider: larger capacities than the total
+    weight of all items do not change the optimum.
+    """
+    return min(instance.capacity, int(instance.weights.sum()))
+
+
+def dp_memory_required(instance: Instance) -> int:
+    """
+    Number of bytes the DP needs: one bit per item and capacity for the
+    reconstruction, and two int64 rows of the table.
+    """
+    columns = effective_capacity(instance) + 1
+    return len(instance.items) * ((columns + 7) // 8) + 2 * 8 * columns
+
+
+class DynamicProgrammingSolver:
+    """
+    Exact solver for the 0/1 knapsack problem by dynamic programming over the capacity.
+
+    Args:
+        instance: the knapsack instance.
+        memory_budget: the maximal number of bytes the DP table may use.
+    """
+
+    def __init__(
+        self, instance: Instance, memory_budget: int = DEFAULT_MEMORY_BUDGET
+    ) -> None:
+        self.instance = instance
+        self.memory_budget = memory_budget
+
+    def solve(self) -> HeuristicSolution:
+        """
+        Compute an optimal solution.
+
+        Returns:
+            An optimal solution (the empty selection if nothing fits).
+
+        Raises:
+            ValueError: if the DP table exceeds the memory budget or the instance
+                is multi-dimensional.
+        """
+        if self.instance.constraints:
+            raise ValueError("Dynamic programming needs a single-constraint instance.")
+        required = dp_memory_required(self.instance)
+        if required > self.memory_budget:
+            raise ValueError(
+                f"Dynamic programming needs {required} bytes, "
+                f"but the memory budget is {self.memory_budget} bytes."
+            )
+        weights = self.instance.weights
+        values = self.instance.values
+        capacity = effective_capacity(self.instance)
+
+        best = np.zeros(capacity + 1, dtype=np.int64)
+        taken = np.zeros((len(weights), (capacity + 8) // 8), dtype=np.uint8)
+        improved = np.zeros(capacity + 1, dtype=bool)
+        for i, (weight, value) in enumerate(zip(weights.tolist(), values.tolist())):
+            if weight > capacity or value == 0:
+                continue
+            if weight == 0:
+                best += value
+                improved[:] = True
+            else:
+                candidate = best[: capacity + 1 - weight] + value
+                improved[:weight] = False
+                np.greater(candidate, best[weight:], out=improved[weight:])
+                np.maximum(best[weight:], candidate, out=best[weight:])
+            taken[i] = np.packbits(improved)
+
+        # `best` is non-decreasing, so best[capacity] is the optimum.
+        selection = [0] * len(weights)
+        remaining = capacity
+        for i in range(len(weights) - 1, -1, -1):
+            if (taken[i, remaining >> 3] >> (7 - (remaining & 7))) & 1:
+                selection[i] = 1
+                remaining -= int(weights[i])
+        value = int(best[capacity])
+        return HeuristicSolution.from_aggregates(
+            self.instance,
+            selection,
+            value,
+            value=value,
+            weight=capacity - remaining,
+            is_integral=True,
+        )
@@ -0,0 +1,114 @@
+"""
+Engine Selection Module
+
+Chooses between the two exact engines of this package:
+  - dynamic programming (`DynamicProgrammingSolver`): O(n * capacity) time and
+    memory, independent of how hard the instance is for tree search,
+  - branch-and-bound (`BnBSearch`): independent of the capacity, but may explore
+    exponentially many nodes.
+
+DP is used whenever its table fits into the memory budget and n * capacity is
+below `max_cells`; otherwise the instance goes to branch-and-bound.
+
+Usage:
+    searcher = AutoSearch(
+        instance,
+        relaxation=my_relaxation,
+        search_strategy=my_search_strategy,
+        branching_strategy=my_branching,
+        heuristics=my_heuristics,
+    )
+    best = searcher.search()
+    print(searcher.engine)
+"""
+
+from enum import Enum
+from typing import Any, Optional
+
+from .bnb import BnBSearch
+from .branching_strategy import BranchingStrategy
+from .dynamic_programming import (
+    DEFAULT_MEMORY_BUDGET,
+    DynamicProgrammingSolver,
+    dp_memory_required,
+    effective_capacity,
+)
+from .heuristics import Heuristics
+from .instance import Instance
+from .relaxation import RelaxationSolver, RelaxedSolution
+from .search_strategy import SearchStrategy
+
+DEFAULT_MAX_CELLS = 5 * 10**8  # a few seconds of vectorized DP
+
+
+class Engine(Enum):
+    DYNAMIC_PROGRAMMING = "dynamic_programming"
+    BRANCH_AND_BOUND = "branch_and_bound"
+
+
+def select_engine(
+    instance: Instance,
+    memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    max_cells: int = DEFAULT_MAX_CELLS,
+) -> Engine:
+    """
+    Pick the engine for `instance` from n * capacity and the memory budget.
+    Multi-dimensional instances always use branch-and-bound.
+    """
+    if instance.constraints:
+        return Engine.BRANCH_AND_BOUND
+    cells = len(instance.items) * (effective_capacity(instance) + 1)
+    if cells <= max_cells and dp_memory_required(instance) <= memory_budget:
+        return Engine.DYNAMIC_PROGRAMMING
+    return Engine.BRANCH_AND_BOUND
+
+
+class AutoSearch:
+    """
+    Solves an instance with the engine chosen by `select_engine`.
+
+    The branch-and-bound components are only used if branch-and-bound is chosen.
+    Further keyword arguments (e.g., `tracker_mode`) are passed to `BnBSearch`.
+    After `search()`, `bnb` holds the `BnBSearch` (or None if DP was used).
+    """
+
+    def __init__(
+        self,
+        instance: Instance,
+        relaxation: RelaxationSolver,
+        search_strategy: SearchStrategy,
+        branching_strategy: BranchingStrategy,
+        heuristics: Heuristics,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        max_cells: int = DEFAULT_MAX_CELLS,
+        **bnb_options: Any,
+    ) -> None:
+        self.instance = instance
+        self.memory_budget = memory_budget
+        self.engine = select_engine(instance, memory_budget, max_cells)
+        self.bnb: Optional[BnBSearch] = None
+        self._components = (relaxation, search_strategy, branching_strategy, heuristics)
+        self._bnb_options = bnb_options
+
+    def search(self, iteration_limit: int = 10_000) -> Optional[RelaxedSolution]:
+        """
+        Solve the instance to optimality.
+
+        Args:
+            iteration_limit: max number of nodes if branch-and-bound is used.
+
+        Returns:
+            The best feasible solution found or None if none found.
+        """
+        if self.engine is Engine.DYNAMIC_PROGRAMMING:
+            return DynamicProgrammingSolver(self.instance, self.memory_budget).solve()
+        relaxation, search_strategy, branching_strategy, heuristics = self._components
+        self.bnb = BnBSearch(
+            self.instance,
+            relaxation=relaxation,
+            search_strategy=search_strategy,
+            branching_strategy=branching_strategy,
+            heuristics=heuristics,
+            **self._bnb_options,
+        )
+        return self.bnb.search(iteration_limit)
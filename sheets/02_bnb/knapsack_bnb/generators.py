@@ -0,0 +1,139 @@
+"""
+Instance Generators Module
+
+Seeded generators for the classic knapsack instance classes of Pisinger
+("Where are the hard knapsack problems?", 2005). The weights are drawn from
+[1, R] for a data range R (default 1000); the values depend on the class:
+  - uncorrelated: v uniform in [1, R],
+  - weakly correlated: v uniform in [w - R/10, w + R/10], at least 1,
+  - strongly correlated: v = w + R/10,
+  - inverse strongly correlated: v uniform in [1, R] and w = v + R/10,
+  - subset-sum: v = w,
+  - spanner: a spanner set of `spanner_size` strongly correlated items is scaled
+    down by 2/m, and every item is a multiple a * (w_k, v_k), a in [1, m], of a
+    random spanner item.
+The capacity is `capacity_ratio` (default 1/2) of the total weight.
+The same class, size and seed always give the same instance.
+
+`generate_multidimensional_instance` creates multi-dimensional instances as in
+the OR-Library benchmark of Chu and Beasley (1998): weights uniform in [1, 1000],
+each capacity `tightness` of its total weight, and values correlated with the
+sum of the weights.
+
+Usage:
+    instance = generate_instance(InstanceClass.STRONGLY_CORRELATED, 1000, seed=1)
+    instance = generate_multidimensional_instance(100, 5, seed=1)
+"""
+
+import math
+from enum import Enum
+
+import numpy as np
+
+from .instance import Instance
+
+
+class InstanceClass(Enum):
+    UNCORRELATED = "uncorrelated"
+    WEAKLY_CORRELATED = "weakly-correlated"
+    STRONGLY_CORRELATED = "strongly-correlated"
+    INVERSE_STRONGLY_CORRELATED = "inverse-strongly-correlated"
+    SUBSET_SUM = "subset-sum"
+    SPANNER = "spanner"
+
+
+def _strongly_correlated(
+    rng: np.random.Generator, num_items: int, data_range: int
+) -> tuple[np.ndarray, np.ndarray]:
+    weights = rng.integers(1, data_range, size=num_items, endpoint=True)
+    return weights, weights + data_range // 10
+
+
+def generate_instance(
+    instance_class: InstanceClass,
+    num_items: int,
+    seed: int = 0,
+    data_range: int = 1000,
+    capacity_ratio: float = 0.5,
+    spanner_size: int = 2,
+    spanner_multiplier: int = 10,
+) -> Instance:
+    """
+    Generate a random instance of `instance_class` (see the module docstring).
+
+    Args:
+        instance_class: the Pisinger class.
+        num_items: number of items.
+        seed: seed of the random generator.
+        data_range: R, the range of the weights and values.
+        capacity_ratio: capacity as fraction of the total weight.
+        spanner_size: number of spanner items (SPANNER only).
+        spanner_multiplier: m, the largest multiplier (SPANNER only).
+
+    Returns:
+        The instance; its id is `seed + 1`.
+    """
+    if num_items < 1 or data_range < 10 or not 0 < capacity_ratio <= 1:
+        raise ValueError("Need items, a data range >= 10 and a ratio in (0, 1].")
+    rng = np.random.default_rng(seed)
+    spread = data_range // 10
+    if instance_class == InstanceClass.UNCORRELATED:
+        weights = rng.integers(1, data_range, size=num_items, endpoint=True)
+        values = rng.integers(1, data_range, size=num_items, endpoint=True)
+    elif instance_class == InstanceClass.WEAKLY_CORRELATED:
+        weights = rng.integers(1, data_range, size=num_items, endpoint=True)
+        noise = rng.integers(-spread, spread, size=num_items, endpoint=True)
+        values = np.maximum(weights + noise, 1)
+    elif instance_class == InstanceClass.STRONGLY_CORRELATED:
+        weights, values = _strongly_correlated(rng, num_items, data_range)
+    elif instance_class == InstanceClass.INVERSE_STRONGLY_CORRELATED:
+        values = rng.integers(1, data_range, size=num_items, endpoint=True)
+        weights = values + spread
+    elif instance_class == InstanceClass.SUBSET_SUM:
+        weights = rng.integers(1, data_range, size=num_items, endpoint=True)
+        values = weights.copy()
+    elif instance_class == InstanceClass.SPANNER:
+        m = spanner_multiplier
+        spanner_weights, spanner_values = _strongly_correlated(
+            rng, spanner_size, data_range
+        )
+        spanner_weights = np.ceil(2 * spanner_weights / m).astype(np.int64)
+        spanner_values = np.ceil(2 * spanner_values / m).astype(np.int64)
+        chosen = rng.integers(0, spanner_size, size=num_items)
+        multipliers = rng.integers(1, m, size=num_items, endpoint=True)
+        weights = multipliers * spanner_weights[chosen]
+        values = multipliers * spanner_values[chosen]
+    else:
+        raise ValueError(f"Unknown instance class {instance_class}.")
+
+    capacity = math.floor(capacity_ratio * int(weights.sum()))
+    return Instance.from_arrays(weights, values, capacity, id=seed + 1)
+
+
+def generate_multidimensional_instance(
+    num_items: int,
+    num_constraints: int,
+    seed: int = 0,
+    tightness: float = 0.5,
+) -> Instance:
+    """
+    Generate a random multi-dimensional instance (see the module docstring).
+
+    Args:
+        num_items: number of items.
+        num_constraints: number of constraints.
+        seed: seed of the random generator.
+        tightness: each capacity as fraction of the total weight of its constraint.
+
+    Returns:
+        The instance; its id is `seed + 1`.
+    """
+    if num_items < 1 or num_constraints < 1 or not 0 < tightness <= 1:
+        raise ValueError("Need items, constraints and a tightness in (0, 1].")
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(1, 1000, size=(num_constraints, num_items), endpoint=True)
+    values = weights.sum(axis=0) // num_constraints + rng.integers(
+        0, 500, size=num_items, endpoint=True
+    )
+    capacities = np.floor(tightness * weights.sum(axis=1)).astype(np.int64)
+    return Instance.from_matrix(weights, values, capacities, id=seed + 1)
@@ -0,0 +1,155 @@
+"""
+Heuristic Scheduler Module
+
+Heuristics are requested twice per node: when the node is created (to show its
+lower bound) and when it is processed (to improve the incumbent). The scheduler
+caches the results per relaxed solution, so a heuristic runs at most once per node,
+and decides at which nodes it runs at all:
+  - max_depth / depth_frequency: only at depths <= max_depth that are multiples
+    of depth_frequency (e.g., depth_frequency=5 runs at depths 0, 5, 10, ...),
+  - node_frequency: at every k-th node,
+  - stall_nodes: whenever the incumbent has not improved for this many nodes,
+  - max_time_fraction: never if the heuristics already took this fraction of the
+    runtime.
+Without any rule, the heuristics run at every node (but only once).
+If depth rules and node_frequency/stall_nodes are given, a node has to satisfy the
+depth rules and one of the others.
+
+Usage:
+    scheduler = HeuristicScheduler(MyHeuristic(), node_frequency=10, stall_nodes=100)
+    searcher = BnBSearch(instance, ..., heuristics=scheduler)
+"""
+
+from __future__ import annotations
+
+import time
+import weakref
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from .heuristics import Heuristics, HeuristicSolution
+from .instance import Instance
+
+if TYPE_CHECKING:
+    from .bnb_nodes import BnBNode
+
+
+class HeuristicScheduler:
+    """
+    Runs a `Heuristics` plug-in at selected nodes and caches its results.
+
+    Args:
+        heuristics: the heuristics to schedule.
+        max_depth: run only at nodes up to this depth.
+        depth_frequency: run only at depths that are a multiple of this.
+        node_frequency: run at every k-th node.
+        stall_nodes: run if the incumbent did not improve for this many nodes.
+        max_time_fraction: skip if the heuristics took more than this fraction
+                           of the time since the first node.
+        at_creation: run heuristics already when a node is created (as before),
+                     not only when it is processed. Nodes that get pruned without
+                     processing still pay for the heuristics then, but show their
+                     lower bound in the visualization.
+    """
+
+    def __init__(
+        self,
+        heuristics: Heuristics,
+        max_depth: Optional[int] = None,
+        depth_frequency: int = 1,
+        node_frequency: Optional[int] = None,
+        stall_nodes: Optional[int] = None,
+        max_time_fraction: Optional[float] = None,
+        at_creation: bool = True,
+    ) -> None:
+        if depth_frequency < 1 or (node_frequency is not None and node_frequency < 1):
+            raise ValueError("Frequencies must be at least 1.")
+        self.heuristics = heuristics
+        self.max_depth = max_depth
+        self.depth_frequency = depth_frequency
+        self.node_frequency = node_frequency
+        self.stall_nodes = stall_nodes
+        self.max_time_fraction = max_time_fraction
+        self.at_creation = at_creation
+
+        # relaxed solution -> heuristic solutions (empty if skipped)
+        self._cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._best_value = float("-inf")
+        self._nodes_since_improvement = 0
+        self._start: Optional[float] = None
+
+        # Statistics
+        self.num_nodes = 0  # nodes scheduled
+        self.num_calls = 0  # nodes the heuristics ran on
+        self.cache_hits = 0
+        self.seconds = 0.0
+
+    def __getstate__(self) -> dict:
+        # weak references cannot be pickled (e.g., for `ParallelBnBSearch`)
+        state = self.__dict__.copy()
+        state["_cache"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._cache = weakref.WeakKeyDictionary()
+
+    def observe(self, best_value: float) -> None:
+        """
+        Report the incumbent value before a node is processed (for `stall_nodes`).
+        """
+        if best_value > self._best_value:
+            self._best_value = best_value
+            self._nodes_since_improvement = 0
+        else:
+            self._nodes_since_improvement += 1
+
+    def _should_run(self, node: BnBNode) -> bool:
+        if self.max_time_fraction is not None and self._start is not None:
+            elapsed = time.perf_counter() - self._start
+            if self.seconds > self.max_time_fraction * elapsed:
+                return False
+        if self.max_depth is not None and node.depth > self.max_depth:
+            return False
+        if node.depth % self.depth_frequency != 0:
+            return False
+        if self.node_frequency is None and self.stall_nodes is None:
+            return True
+        if (
+            self.node_frequency is not None
+            and self.num_nodes % self.node_frequency == 0
+        ):
+            return True
+        if (
+            self.stall_nodes is not None
+            and self._nodes_since_improvement >= self.stall_nodes
+        ):
+            self._nodes_since_improvement = 0
+            return True
+        return False
+
+    def search(
+        self, instance: Instance, node: BnBNode, at_creation: bool = False
+    ) -> Tuple[HeuristicSolution, ...]:
+        """
+        Return the heuristic solutions for `node`, running the heuristics
+        only on the first request and only if the schedule selects the node.
+        """
+        relaxed = node.relaxed_solution
+        cached = self._cache.get(relaxed)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+        if at_creation and not self.at_creation:
+            return ()
+        if self._start is None:
+            self._start = time.perf_counter()
+
+        solutions: Tuple[HeuristicSolution, ...] = ()
+        if self._should_run(node):
+            start = time.perf_counter()
+            solutions = tuple(self.heuristics.search(instance, relaxed))
+            self.seconds += time.perf_counter() - start
+            self.num_calls += 1
+        self.num_nodes += 1
+        self._cache[relaxed] = solutions
+        return solutions
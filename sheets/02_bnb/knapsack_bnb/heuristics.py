@@ -8,12 +8,19 @@ Instead of waiting for an integral node, you can derive feasible solutions from
 
 You can implement heuristics by subclassing `Heuristics` and overriding `search(instance, node)`.
 `search` should yield zero or more feasible `RelaxedSolution` objects.
+
+`LocalSearchHeuristic` is a ready-to-use heuristic: greedy fill by value/weight ratio,
+improved by 1-swap and 2-swap moves that are evaluated with NumPy.
+`MultiDimensionalGreedyHeuristic` is a cheaper greedy heuristic. Both obey all
+constraints of a multi-dimensional instance.
 """
 
 import math
 from abc import ABC, abstractmethod
 from typing import Tuple
 
+import numpy as np
+
 from .instance import Instance
 from .relaxed_solution import RelaxedSolution
 
@@ -24,15 +31,7 @@ class HeuristicSolution(RelaxedSolution):
     Inherits from `RelaxedSolution` for compatibility with the rest of the codebase.
     """
 
-    def copy(self) -> "HeuristicSolution":
-        """
-        Return a deep copy of this heuristic solution.
-        """
-        return HeuristicSolution(
-            self.instance,
-            list(self.selection),
-            self.upper_bound,
-        )
+    __slots__ = ()
 
 
 class Heuristics(ABC):
@@ -63,7 +62,301 @@ class MyHeuristic(Heuristics):
     def search(self, instance: Instance, relaxed: RelaxedSolution) -> Tuple[HeuristicSolution, ...]:
         # make relaxed solution an integer rounded solution
         selection = [1 if x == 1.0 else 0 for x in relaxed.selection]
-        total_value = sum(item.value * sel for item, sel in zip(instance.items, selection))
+        total_value = int(np.dot(instance.values, selection))
         
         heuristic_sol = HeuristicSolution(instance, selection, total_value)
-        return (heuristic_sol,)
\ No newline at end of file
+        # the rounded solution may violate the further constraints of a
+        # multi-dimensional instance
+        if not heuristic_sol.does_obey_capacity_constraint():
+            return ()
+        return (heuristic_sol,)
+
+
+class LocalSearchHeuristic(Heuristics):
+    """
+    Greedy construction followed by local search.
+
+    Three starting points give diverse solutions:
+      - the relaxed solution rounded down,
+      - the relaxed solution rounded up (low-ratio items removed until it fits),
+      - the empty knapsack, filled by value instead of ratio.
+    Each is filled greedily by decreasing value/weight ratio and then improved by
+    the best of the following moves until no move improves the value:
+      - 1-swap: replace one packed item by one unpacked item,
+      - 2-swap: replace one packed item by two unpacked items, or two by one.
+    The gains of all moves of a kind are computed at once with NumPy broadcasting.
+    1-swaps consider all items unless there are more than `max_pairs` pairs, 2-swaps
+    the `neighborhood` packed items with the lowest and the `neighborhood` unpacked
+    items with the highest ratio. After every move, the free capacity is filled again.
+
+    On multi-dimensional instances, the ratio uses the sum of the weights relative
+    to the capacities, and every fill and move must fit into all constraints.
+
+    A call costs far more than rounding, so consider running it only at some nodes
+    with a `HeuristicScheduler`.
+
+    Args:
+        max_solutions: number of distinct solutions to return (best first).
+        max_moves: maximal number of improving moves per starting point.
+        neighborhood: number of candidate items per side for 2-swaps.
+        max_pairs: maximal number of 1-swap pairs evaluated at once.
+    """
+
+    def __init__(
+        self,
+        max_solutions: int = 3,
+        max_moves: int = 50,
+        neighborhood: int = 16,
+        max_pairs: int = 1_000_000,
+    ) -> None:
+        self.max_solutions = max_solutions
+        self.max_moves = max_moves
+        self.neighborhood = neighborhood
+        self.max_pairs = max_pairs
+        self._instance: Instance | None = None
+        self._order = np.zeros(0, dtype=np.int64)  # indices by decreasing ratio
+        self._rank = np.zeros(0, dtype=np.int64)  # position of each item in `_order`
+        self._value_order = np.zeros(0, dtype=np.int64)
+        self._columns: list[list[int]] = []
+
+    def _prepare(self, instance: Instance) -> None:
+        """
+        Cache the ratio and value orders of `instance`.
+        """
+        if instance is self._instance:
+            return
+        values = instance.values
+        if instance.num_constraints == 1:
+            weights = instance.weights
+        else:
+            # sum of the weights relative to the capacities
+            weights = (
+                instance.weight_matrix / np.maximum(instance.capacities, 1)[:, None]
+            ).sum(axis=0)
+            # the weights per item, for the fit checks in Python
+            self._columns = instance.weight_matrix.T.tolist()
+        ratios = np.divide(
+            values, weights, out=np.full(len(values), np.inf), where=weights > 0
+        )
+        self._order = np.argsort(-ratios, kind="stable")
+        self._rank = np.empty_like(self._order)
+        self._rank[self._order] = np.arange(len(self._order))
+        self._value_order = np.argsort(-values, kind="stable")
+        self._instance = instance
+
+    def _repair(self, instance: Instance, packed: np.ndarray) -> np.ndarray:
+        """
+        Remove packed items with the lowest ratio until all capacities are obeyed.
+        """
+        matrix = instance.weight_matrix
+        excess = matrix[:, packed].sum(axis=1) - instance.capacities
+        if np.all(excess <= 0):
+            return packed
+        by_ratio = self._order[packed[self._order]][::-1]  # lowest ratio first
+        removed = np.cumsum(matrix[:, by_ratio], axis=1)
+        count = 1 + max(
+            int(np.searchsorted(removed[row], excess[row]))
+            for row in np.flatnonzero(excess > 0).tolist()
+        )
+        packed = packed.copy()
+        packed[by_ratio[:count]] = False
+        return packed
+
+    def _fill(self, instance: Instance, packed: np.ndarray, order: np.ndarray) -> None:
+        """
+        Add unpacked items in `order` as long as they fit (in place).
+        """
+        if instance.num_constraints > 1:
+            remaining = (
+                instance.capacities - instance.weight_matrix[:, packed].sum(axis=1)
+            ).tolist()
+            for i in order[~packed[order]].tolist():
+                column = self._columns[i]
+                if all(w <= r for w, r in zip(column, remaining)):
+                    packed[i] = True
+                    remaining = [r - w for w, r in zip(column, remaining)]
+            return
+        weights = instance.weights
+        remaining = instance.capacity - int(weights[packed].sum())
+        for i in order[~packed[order]].tolist():
+            if weights[i] <= remaining:
+                packed[i] = True
+                remaining -= int(weights[i])
+
+    def _extremes(self, items: np.ndarray, count: int, lowest: bool) -> np.ndarray:
+        """
+        Return up to `count` of `items` with the lowest (or highest) ratio.
+        """
+        if len(items) <= count:
+            return items
+        ranks = self._rank[items]
+        if lowest:
+            return items[np.argpartition(-ranks, count - 1)[:count]]
+        return items[np.argpartition(ranks, count - 1)[:count]]
+
+    def _best_move(
+        self, instance: Instance, packed: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Return the items to remove and to add of the best improving move, if any.
+        """
+        matrix, values = instance.weight_matrix, instance.values
+        slack = instance.capacities - matrix[:, packed].sum(axis=1)
+        inside = np.flatnonzero(packed)
+        outside = np.flatnonzero(~packed)
+        if len(inside) == 0 or len(outside) == 0:
+            return None
+        best_gain = 0
+        best_move = None
+
+        def consider(gains, feasible, removed, added):
+            nonlocal best_gain, best_move
+            gains = np.where(feasible, gains, 0)
+            k = int(np.argmax(gains))
+            if gains.flat[k] > best_gain:
+                a, b = np.unravel_index(k, gains.shape)
+                best_gain = gains.flat[k]
+                best_move = (removed[a], added[b])
+
+        def fits(removed_weights, added_weights):
+            # (m, r) and (m, a) weights -> (r, a): the move fits into all constraints
+            return np.all(
+                added_weights[:, None, :] - removed_weights[:, :, None]
+                <= slack[:, None, None],
+                axis=0,
+            )
+
+        # 1-swaps
+        side = max(1, math.isqrt(self.max_pairs))
+        if len(inside) * len(outside) > self.max_pairs:
+            ins = self._extremes(inside, side, lowest=True)
+            outs = self._extremes(outside, side, lowest=False)
+        else:
+            ins, outs = inside, outside
+        consider(
+            values[outs][None, :] - values[ins][:, None],
+            fits(matrix[:, ins], matrix[:, outs]),
+            ins[:, None],
+            outs[:, None],
+        )
+
+        # 2-swaps
+        ins = self._extremes(inside, self.neighborhood, lowest=True)
+        outs = self._extremes(outside, self.neighborhood, lowest=False)
+        if len(outs) >= 2:
+            first, second = np.triu_indices(len(outs), 1)
+            pairs = np.stack((outs[first], outs[second]), axis=1)
+            consider(
+                (values[pairs[:, 0]] + values[pairs[:, 1]])[None, :]
+                - values[ins][:, None],
+                fits(matrix[:, ins], matrix[:, pairs[:, 0]] + matrix[:, pairs[:, 1]]),
+                ins[:, None],
+                pairs,
+            )
+        if len(ins) >= 2:
+            first, second = np.triu_indices(len(ins), 1)
+            pairs = np.stack((ins[first], ins[second]), axis=1)
+            consider(
+                values[outs][None, :]
+                - (values[pairs[:, 0]] + values[pairs[:, 1]])[:, None],
+                fits(matrix[:, pairs[:, 0]] + matrix[:, pairs[:, 1]], matrix[:, outs]),
+                pairs,
+                outs[:, None],
+            )
+        return best_move
+
+    def _improve(self, instance: Instance, packed: np.ndarray) -> np.ndarray:
+        for _ in range(self.max_moves):
+            move = self._best_move(instance, packed)
+            if move is None:
+                break
+            removed, added = move
+            packed[removed] = False
+            packed[added] = True
+            self._fill(instance, packed, self._order)
+        return packed
+
+    def search(
+        self, instance: Instance, relaxed: RelaxedSolution
+    ) -> Tuple[HeuristicSolution, ...]:
+        self._prepare(instance)
+        empty = np.zeros(len(instance.items), dtype=bool)
+        starts = (
+            (relaxed.selection >= 1.0, self._order),
+            (relaxed.selection > 0.0, self._order),
+            (empty, self._value_order),
+        )
+
+        solutions: dict[bytes, HeuristicSolution] = {}
+        for start, order in starts:
+            packed = self._repair(instance, start).copy()
+            self._fill(instance, packed, order)
+            packed = self._improve(instance, packed)
+            key = np.packbits(packed).tobytes()
+            if key not in solutions:
+                value = int(instance.values[packed].sum())
+                solutions[key] = HeuristicSolution.from_aggregates(
+                    instance,
+                    packed.astype(np.float64),
+                    value,
+                    value=value,
+                    weight=int(instance.weights[packed].sum()),
+                    is_integral=True,
+                )
+        best_first = sorted(solutions.values(), key=lambda s: -s.value())
+        return tuple(best_first[: self.max_solutions])
+
+
+class MultiDimensionalGreedyHeuristic(Heuristics):
+    """
+    Greedy heuristic for multi-dimensional instances (see `Instance.constraints`).
+
+    Packs the items in order of decreasing relaxed value, ties broken by value per
+    normalized weight (the sum of weight / capacity over all constraints), as long
+    as they fit into every constraint. Works for single-constraint instances as well.
+    """
+
+    def __init__(self) -> None:
+        self._instance: Instance | None = None
+        self._efficiency = np.zeros(0)
+        self._columns: list[list[int]] = []
+
+    def _prepare(self, instance: Instance) -> None:
+        if instance is self._instance:
+            return
+        normalized = (
+            instance.weight_matrix / np.maximum(instance.capacities, 1)[:, None]
+        ).sum(axis=0)
+        self._efficiency = np.divide(
+            instance.values,
+            normalized,
+            out=np.full(len(normalized), np.inf),
+            where=normalized > 0,
+        )
+        # the weights per item, for the fit checks in Python
+        self._columns = instance.weight_matrix.T.tolist()
+        self._instance = instance
+
+    def search(
+        self, instance: Instance, relaxed: RelaxedSolution
+    ) -> Tuple[HeuristicSolution, ...]:
+        self._prepare(instance)
+        order = np.lexsort((-self._efficiency, -relaxed.selection))
+        remaining = instance.capacities.tolist()
+        packed = np.zeros(len(instance.items), dtype=bool)
+        for i in order.tolist():
+            column = self._columns[i]
+            if all(w <= r for w, r in zip(column, remaining)):
+                packed[i] = True
+                remaining = [r - w for w, r in zip(column, remaining)]
+        value = int(instance.values[packed].sum())
+        return (
+            HeuristicSolution.from_aggregates(
+                instance,
+                packed.astype(np.float64),
+                value,
+                value=value,
+                weight=int(instance.weights[packed].sum()),
+                is_integral=True,
+            ),
+        )
@@ -1,4 +1,10 @@
-from pydantic import BaseModel, ConfigDict, Field
+import json
+from collections.abc import Sequence
+from functools import cached_property
+from typing import Iterator, Union, overload
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, model_validator
 
 
 class Item(BaseModel):
@@ -13,12 +19,88 @@ class Item(BaseModel):
     model_config = ConfigDict(frozen=True)
 
 
+class Constraint(BaseModel):
+    """
+    An additional knapsack constraint: the weight of every item and the capacity.
+    """
+
+    weights: list[int] = Field(..., description="Weight of each item")
+    capacity: int = Field(..., ge=0, description="Capacity of the constraint")
+
+    # Prevent the model from being modified after creation
+    model_config = ConfigDict(frozen=True)
+
+
+class ItemView(Sequence):
+    """
+    Read-only sequence of `Item`s backed by weight and value arrays. The items
+    are created (without validation) only when accessed.
+    """
+
+    def __init__(self, weights: np.ndarray, values: np.ndarray) -> None:
+        self._weights = weights
+        self._values = values
+
+    def _item(self, i: int) -> Item:
+        return Item.model_construct(
+            weight=int(self._weights[i]), value=int(self._values[i])
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> Item: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Item]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Item, list[Item]]:
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(len(self))[index]]
+        return self._item(range(len(self))[index])
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def __iter__(self) -> Iterator[Item]:
+        for weight, value in zip(self._weights.tolist(), self._values.tolist()):
+            yield Item.model_construct(weight=weight, value=value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ItemView):
+            return np.array_equal(self._weights, other._weights) and np.array_equal(
+                self._values, other._values
+            )
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+
+def _column(data: np.ndarray) -> np.ndarray:
+    """
+    Return `data` as a contiguous, read-only int64 array owned by the instance.
+    """
+    column = np.array(data, dtype=np.int64, copy=True, order="C")
+    if column.ndim != 1:
+        raise ValueError("Weights and values must be one-dimensional.")
+    column.flags.writeable = False
+    return column
+
+
 class Instance(BaseModel):
     """
     Represents an instance with a list of items and capacity of the knapsack problem.
+
+    Solvers should use the contiguous `weights` and `values` arrays. Large
+    instances can be created without validating every item by `from_arrays`,
+    `from_csv` or `from_jsonl`; their `items` are then a lazy `ItemView`.
+
+    A multi-dimensional knapsack instance has further `constraints`. The item
+    weights and `capacity` form the first constraint, so single-constraint
+    solvers still see a relaxation of the instance. `weight_matrix` and
+    `capacities` hold all `num_constraints` constraints; create such an instance
+    from arrays with `from_matrix`.
     """
 
-    items: list[Item] = Field(
+    items: Sequence[Item] = Field(
         default_factory=list,
         description="List of items in the knapsack problem instance",
     )
@@ -26,6 +108,150 @@ class Instance(BaseModel):
         ..., ge=0, description="Capacity of the knapsack problem instance"
     )
     id: int = Field(default=1, ge=1, description="Id of the instance")
+    constraints: list[Constraint] = Field(
+        default_factory=list,
+        description="Additional constraints of a multi-dimensional knapsack instance",
+    )
 
     # Prevent the model from being modified after creation
     model_config = ConfigDict(frozen=True)
+
+    @model_validator(mode="after")
+    def _check_constraints(self) -> "Instance":
+        for constraint in self.constraints:
+            if len(constraint.weights) != len(self.items):
+                raise ValueError("Every constraint needs one weight per item.")
+            if min(constraint.weights, default=0) < 0:
+                raise ValueError("Constraint weights must be non-negative.")
+        return self
+
+    @field_serializer("items", mode="wrap")
+    def _serialize_items(self, items: Sequence[Item], handler):
+        return handler(items if isinstance(items, list) else list(items))
+
+    def __eq__(self, other: object) -> bool:
+        # compare the fields only: the cached arrays in `__dict__` are ambiguous
+        # under `==`
+        if not isinstance(other, Instance):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in type(self).model_fields
+        )
+
+    @classmethod
+    def from_arrays(
+        cls, weights: np.ndarray, values: np.ndarray, capacity: int, id: int = 1
+    ) -> "Instance":
+        """
+        Create an instance from weight and value arrays without validating the
+        items. The caller guarantees non-negative integers.
+
+        Raises:
+            ValueError: if the arrays are not one-dimensional of equal length.
+        """
+        weights, values = _column(weights), _column(values)
+        if weights.shape != values.shape:
+            raise ValueError("Weights and values must have the same length.")
+        instance = cls.model_construct(
+            items=ItemView(weights, values), capacity=int(capacity), id=int(id)
+        )
+        # pre-fill the cached properties
+        instance.__dict__["weights"] = weights
+        instance.__dict__["values"] = values
+        return instance
+
+    @classmethod
+    def from_matrix(
+        cls,
+        weights: np.ndarray,
+        values: np.ndarray,
+        capacities: np.ndarray,
+        id: int = 1,
+    ) -> "Instance":
+        """
+        Create a multi-dimensional instance from an (m, n) weight matrix, n values
+        and m capacities without validating the items (see `from_arrays`).
+
+        Raises:
+            ValueError: if the shapes do not match.
+        """
+        matrix = np.array(weights, dtype=np.int64, copy=True, order="C", ndmin=2)
+        capacities = _column(capacities)
+        if matrix.ndim != 2 or capacities.shape != (len(matrix),) or len(matrix) < 1:
+            raise ValueError("Need an (m, n) weight matrix and m capacities.")
+        instance = cls.from_arrays(matrix[0], values, int(capacities[0]), id)
+        instance.__dict__["constraints"] = [
+            Constraint.model_construct(weights=row, capacity=capacity)
+            for row, capacity in zip(matrix[1:].tolist(), capacities[1:].tolist())
+        ]
+        matrix.flags.writeable = False
+        instance.__dict__["weight_matrix"] = matrix
+        instance.__dict__["capacities"] = capacities
+        return instance
+
+    @classmethod
+    def from_csv(cls, path: str, capacity: int, id: int = 1) -> "Instance":
+        """
+        Load the items from a CSV file with a header and the columns weight,value.
+        """
+        data = np.loadtxt(path, delimiter=",", skiprows=1, dtype=np.int64, ndmin=2)
+        if data.size == 0:
+            data = np.empty((0, 2), dtype=np.int64)
+        return cls.from_arrays(data[:, 0], data[:, 1], capacity, id)
+
+    @classmethod
+    def from_jsonl(cls, path: str, capacity: int, id: int = 1) -> "Instance":
+        """
+        Load the items from a JSON lines file with one {"weight": .., "value": ..}
+        object per line.
+        """
+        weights, values = [], []
+        with open(path) as file:
+            for line in file:
+                if line.strip():
+                    item = json.loads(line)
+                    weights.append(item["weight"])
+                    values.append(item["value"])
+        return cls.from_arrays(np.array(weights), np.array(values), capacity, id)
+
+    @cached_property
+    def weights(self) -> np.ndarray:
+        """
+        Read-only array of the item weights, computed once per instance.
+        """
+        return _column([item.weight for item in self.items])
+
+    @cached_property
+    def values(self) -> np.ndarray:
+        """
+        Read-only array of the item values, computed once per instance.
+        """
+        return _column([item.value for item in self.items])
+
+    @property
+    def num_constraints(self) -> int:
+        return 1 + len(self.constraints)
+
+    @cached_property
+    def weight_matrix(self) -> np.ndarray:
+        """
+        Read-only (num_constraints, n) array of the weights of all constraints;
+        row 0 is `weights`.
+        """
+        if not self.constraints:
+            return self.weights[None, :]
+        matrix = np.vstack(
+            [self.weights] + [constraint.weights for constraint in self.constraints]
+        ).astype(np.int64)
+        matrix.flags.writeable = False
+        return matrix
+
+    @cached_property
+    def capacities(self) -> np.ndarray:
+        """
+        Read-only array of the capacities of all constraints; entry 0 is `capacity`.
+        """
+        return _column(
+            [self.capacity] + [constraint.capacity for constraint in self.constraints]
+        )
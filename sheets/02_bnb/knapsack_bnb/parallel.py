@@ -0,0 +1,266 @@
+"""
+Parallel Branch-and-Bound Module
+
+Explore the BnB tree with several worker processes. Every worker runs its own
+search on a subtree, using the same relaxation, search strategy, branching strategy
+and heuristics as a sequential `BnBSearch` (each worker gets a copy of them, so
+they must be picklable, e.g., no lambdas as priority functions).
+
+The value of the best solution is shared between all workers, so a solution found
+by one worker immediately prunes nodes in all other workers. Work is distributed
+by work stealing: whenever workers are idle, busy workers hand over their open
+nodes with the highest bounds through a shared task queue.
+
+Usage:
+    searcher = ParallelBnBSearch(
+        instance,
+        relaxation=my_relaxation,
+        search_strategy=my_search_strategy,
+        branching_strategy=my_branching,
+        heuristics=my_heuristics,
+        num_workers=8,
+    )
+    best = searcher.search()
+"""
+
+import logging
+import multiprocessing
+import os
+import queue
+import traceback
+from typing import Any, NamedTuple, Optional
+
+from .bnb import BnBSearch
+from .branching_decisions import BranchingDecisions
+from .branching_strategy import BranchingStrategy
+from .heuristics import Heuristics, HeuristicSolution
+from .instance import Instance
+from .progress_tracker import TrackerMode
+from .relaxation import RelaxationSolver
+from .search_strategy import SearchStrategy
+from .solutions import SolutionPool
+
+
+class _SharedState(NamedTuple):
+    """
+    Synchronized objects shared by the coordinator and all workers.
+    """
+
+    tasks: Any  # queue of BranchingDecisions (subtree roots), None to stop
+    incumbent: Any  # value of the best solution found by any worker
+    idle: Any  # number of workers waiting for a task
+    waiting: Any  # number of tasks in the queue
+    pending: Any  # number of tasks in the queue or in progress
+
+
+def _add(counter: Any, delta: int) -> None:
+    with counter.get_lock():
+        counter.value += delta
+
+
+class _SharedIncumbentPool(SolutionPool):
+    """
+    A solution pool that prunes with the best value of all workers and
+    publishes its own improvements.
+    """
+
+    def __init__(self, incumbent: Any) -> None:
+        super().__init__(max_solutions=1)
+        self._incumbent = incumbent
+
+    def add(self, solution: HeuristicSolution) -> bool:
+        added = super().add(solution)
+        value = solution.value()
+        if added and value > self._incumbent.value:
+            with self._incumbent.get_lock():
+                if value > self._incumbent.value:
+                    self._incumbent.value = value
+        return added
+
+    def best_solution_value(self) -> float:
+        return max(super().best_solution_value(), self._incumbent.value)
+
+
+def _donate(
+    searcher: BnBSearch, shared: _SharedState, pool: _SharedIncumbentPool
+) -> None:
+    """
+    Hand over open nodes with the highest bounds while workers are idle.
+    """
+    strategy = searcher.search_strategy
+    while len(strategy) > 1 and shared.waiting.value < shared.idle.value:
+        node = strategy.next_best_bound()
+        if node.upper_bound <= pool.best_solution_value():
+            continue  # pruned anyway
+        _add(shared.pending, 1)
+        _add(shared.waiting, 1)
+        shared.tasks.put(node.branching_decisions)
+
+
+def _run_worker(
+    instance: Instance,
+    relaxation: RelaxationSolver,
+    search_strategy: SearchStrategy,
+    branching_strategy: BranchingStrategy,
+    heuristics: Heuristics,
+    shared: _SharedState,
+    results: Any,
+) -> None:
+    """
+    Process subtrees from the task queue until the coordinator stops the worker.
+    Sends ("done", selection, value, num_nodes) or ("error", traceback) to `results`.
+    """
+    try:
+        pool = _SharedIncumbentPool(shared.incumbent)
+        searcher = BnBSearch(
+            instance,
+            relaxation=relaxation,
+            search_strategy=search_strategy,
+            branching_strategy=branching_strategy,
+            heuristics=heuristics,
+            tracker_mode=TrackerMode.SILENT,
+            solutions=pool,
+        )
+        strategy = searcher.search_strategy
+        num_nodes = 0
+        while True:
+            _add(shared.idle, 1)
+            decisions = shared.tasks.get()
+            _add(shared.idle, -1)
+            if decisions is None:
+                break
+            _add(shared.waiting, -1)
+            strategy.enqueue(searcher.node_factory.create_root(decisions))
+            while strategy.has_next():
+                if strategy.upper_bound() <= pool.best_solution_value():
+                    # global prune of the local subtree
+                    while strategy.has_next():
+                        strategy.next()
+                    break
+                searcher._process_node(strategy.next())
+                num_nodes += 1
+                _donate(searcher, shared, pool)
+            _add(shared.pending, -1)
+
+        best = pool.best_solution()
+        results.put(
+            (
+                "done",
+                best.selection if best is not None else None,
+                best.value() if best is not None else None,
+                num_nodes,
+            )
+        )
+    except BaseException:
+        results.put(("error", traceback.format_exc()))
+
+
+class ParallelBnBSearch:
+    """
+    Branch-and-bound solver that distributes the tree over worker processes.
+
+    Args:
+        instance: the knapsack instance.
+        relaxation, search_strategy, branching_strategy, heuristics:
+            the components as for `BnBSearch`; every worker uses a copy.
+        num_workers: number of worker processes (default: number of CPUs).
+        decisions_type: the `BranchingDecisions` implementation of the root node.
+        start_method: the multiprocessing start method ("fork", "spawn" or
+                      "forkserver"; default: the platform's default).
+    """
+
+    def __init__(
+        self,
+        instance: Instance,
+        relaxation: RelaxationSolver,
+        search_strategy: SearchStrategy,
+        branching_strategy: BranchingStrategy,
+        heuristics: Heuristics,
+        num_workers: Optional[int] = None,
+        decisions_type: type[BranchingDecisions] = BranchingDecisions,
+        start_method: Optional[str] = None,
+    ) -> None:
+        self.instance = instance
+        self.relaxation = relaxation
+        self.search_strategy = search_strategy
+        self.branching_strategy = branching_strategy
+        self.heuristics = heuristics
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self._decisions_type = decisions_type
+        self._start_method = start_method
+        self.num_nodes = 0  # total number of nodes processed by all workers
+
+    def search(self) -> Optional[HeuristicSolution]:
+        """
+        Run the parallel branch-and-bound algorithm to optimality.
+
+        Returns:
+            The best feasible solution found or None if none found.
+
+        Raises:
+            RuntimeError: if a worker fails.
+        """
+        context = multiprocessing.get_context(self._start_method)
+        shared = _SharedState(
+            tasks=context.Queue(),
+            incumbent=context.Value("d", float("-inf")),
+            idle=context.Value("i", 0),
+            waiting=context.Value("i", 1),
+            pending=context.Value("i", 1),
+        )
+        results = context.Queue()
+        shared.tasks.put(self._decisions_type(len(self.instance.items)))
+        workers = [
+            context.Process(
+                target=_run_worker,
+                args=(
+                    self.instance,
+                    self.relaxation,
+                    self.search_strategy,
+                    self.branching_strategy,
+                    self.heuristics,
+                    shared,
+                    results,
+                ),
+                daemon=True,
+            )
+            for _ in range(self.num_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            # wait until all tasks are done; only errors are reported meanwhile
+            while shared.pending.value > 0:
+                try:
+                    message = results.get(timeout=0.05)
+                except queue.Empty:
+                    if any(worker.exitcode is not None for worker in workers):
+                        raise RuntimeError("A worker terminated unexpectedly.")
+                    continue
+                raise RuntimeError(f"Worker failed:\n{message[1]}")
+
+            for _ in workers:
+                shared.tasks.put(None)
+            best: Optional[HeuristicSolution] = None
+            self.num_nodes = 0
+            for _ in workers:
+                message = results.get()
+                if message[0] == "error":
+                    raise RuntimeError(f"Worker failed:\n{message[1]}")
+                _, selection, value, num_nodes = message
+                self.num_nodes += num_nodes
+                if selection is not None and (best is None or value > best.value()):
+                    best = HeuristicSolution(self.instance, selection, value)
+        finally:
+            for worker in workers:
+                worker.join(timeout=1.0)
+                if worker.is_alive():
+                    worker.terminate()
+
+        logging.info(
+            "Parallel search finished with %d nodes on %d workers.",
+            self.num_nodes,
+            self.num_workers,
+        )
+        return best
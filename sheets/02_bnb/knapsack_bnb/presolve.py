@@ -0,0 +1,255 @@
+"""
+Presolve Module
+
+Before branching, many items can already be fixed at the root:
+  - items that do not fit or have no value are never packed,
+  - items without weight but with a value are always packed,
+  - dominance: if item i weighs at most as much as item j, is worth at least as
+    much, and both do not fit together, item j is never needed (replacing it by
+    i is feasible and not worse), so it is never packed,
+  - reduced-cost fixing (Dembo and Hammer): let U be the bound of the fractional
+    relaxation with critical ratio r = value/weight of the critical item, and let
+    d_j = value_j - r * weight_j be the reduced cost of item j. Flipping item j
+    against its value in the relaxation lowers the bound to at most U - |d_j|.
+    As values are integers, the flip cannot improve on the incumbent LB if
+    U - |d_j| < LB + 1, so item j can be fixed to its value in the relaxation.
+
+The rules are repeated on the remaining items until nothing changes. The search
+then runs on the smaller instance and `PresolveResult.restore` maps its result
+back to the original instance (falling back to the presolve incumbent, which may
+not be consistent with the fixations).
+
+Usage:
+    presolved = presolve_instance(instance)
+    best = presolved.restore(solve(presolved.instance))
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+
+from .heuristics import HeuristicSolution
+from .instance import Instance
+from .relaxed_solution import RelaxedSolution
+
+FREE = -1
+
+
+def _dominated(weights: np.ndarray, values: np.ndarray, capacity: int) -> np.ndarray:
+    """
+    Return which items j are dominated by another item i with w_i <= w_j,
+    v_i >= v_j and w_i + w_j > capacity. Of equal items, the first one is kept.
+
+    Only items with 2 * w_j > capacity can be dominated. By increasing weight,
+    the candidates i of j are the items from the first one with
+    w_i > capacity - w_j up to j; this window only grows with j, so its maximal
+    value is updated in a single pass.
+    """
+    if len(weights) == 0 or 2 * int(weights.max()) <= capacity:
+        return np.zeros(len(weights), dtype=bool)
+    order = np.lexsort((-values, weights))  # stable: equal items by index
+    w, v = weights[order], values[order]
+    sorted_dominated = np.zeros(len(order), dtype=bool)
+    start = int(np.searchsorted(2 * w, capacity, side="right"))
+    lows = np.searchsorted(w, capacity - w, side="right").tolist()
+    left = right = start  # the window v[left:right] has maximum `best`
+    best = -1
+    for j in range(start, len(order)):
+        if lows[j] < left:
+            best = max(best, int(v[lows[j] : left].max()))
+            left = lows[j]
+        if right < j:
+            best = max(best, int(v[right:j].max()))
+            right = j
+        sorted_dominated[j] = best >= v[j]
+    dominated = np.empty_like(sorted_dominated)
+    dominated[order] = sorted_dominated
+    return dominated
+
+
+class PresolveResult:
+    """
+    The reduced instance and the information to map its solutions back.
+
+    Attributes:
+        original: the original instance.
+        instance: the reduced instance with the free items only.
+        kept: original indices of the items of the reduced instance.
+        fixed: per original item 0 or 1 if fixed, -1 (FREE) otherwise.
+        incumbent: the best solution found during presolve (original instance).
+    """
+
+    def __init__(
+        self,
+        original: Instance,
+        fixed: np.ndarray,
+        incumbent: HeuristicSolution,
+    ) -> None:
+        self.original = original
+        self.fixed = fixed
+        self.incumbent = incumbent
+        self.kept = np.flatnonzero(fixed == FREE)
+        packed = fixed == 1
+        self.fixed_value = int(original.values[packed].sum())
+        self.fixed_weight = int(original.weights[packed].sum())
+        self.instance = Instance.from_arrays(
+            original.weights[self.kept],
+            original.values[self.kept],
+            capacity=original.capacity - self.fixed_weight,
+            id=original.id,
+        )
+
+    @property
+    def num_fixed(self) -> int:
+        return len(self.fixed) - len(self.kept)
+
+    def project(self, solution: RelaxedSolution) -> Optional[HeuristicSolution]:
+        """
+        Map a solution of the original instance to the reduced instance,
+        or return None if it violates a fixation.
+        """
+        selection = solution.selection
+        bound = self.fixed != FREE
+        if np.any(selection[bound] != self.fixed[bound]):
+            return None
+        return HeuristicSolution.from_aggregates(
+            self.instance,
+            selection[self.kept],
+            solution.value() - self.fixed_value,
+            value=solution.value() - self.fixed_value,
+            weight=solution.weight() - self.fixed_weight,
+            is_integral=True,
+        )
+
+    def restore(self, solution: Optional[RelaxedSolution]) -> HeuristicSolution:
+        """
+        Map a feasible solution of the reduced instance (or None) back to
+        the original instance. Returns the incumbent if it is better.
+        """
+        if solution is None:
+            return self.incumbent
+        value = solution.value() + self.fixed_value
+        if value <= self.incumbent.value():
+            return self.incumbent
+        selection = (self.fixed == 1).astype(np.float64)
+        selection[self.kept] = solution.selection
+        return HeuristicSolution.from_aggregates(
+            self.original,
+            selection,
+            value,
+            value=value,
+            weight=solution.weight() + self.fixed_weight,
+            is_integral=True,
+        )
+
+
+def presolve_instance(
+    instance: Instance, incumbent: Optional[RelaxedSolution] = None
+) -> PresolveResult:
+    """
+    Fix items at the root by the rules of this module.
+
+    Args:
+        instance: the knapsack instance.
+        incumbent: an optional feasible 0/1 solution of `instance` as lower bound;
+                   greedy solutions are computed in any case.
+
+    Returns:
+        The reduced instance with the mapping to the original one.
+
+    Raises:
+        ValueError: if the instance is multi-dimensional.
+    """
+    if instance.constraints:
+        raise ValueError("Presolve needs a single-constraint instance.")
+    weights = instance.weights
+    values = instance.values
+    fixed = np.full(len(weights), FREE, dtype=np.int8)
+    best = np.zeros(len(weights), dtype=np.int8)
+    best_value = 0
+    if incumbent is not None:
+        assert incumbent.is_integral() and incumbent.does_obey_capacity_constraint()
+        best = incumbent.selection.astype(np.int8)
+        best_value = int(incumbent.value())
+
+    while True:
+        free = np.flatnonzero(fixed == FREE)
+        packed = fixed == 1
+        capacity = instance.capacity - int(weights[packed].sum())
+        w = weights[free]
+        v = values[free]
+
+        # Trivial fixations
+        never = (v == 0) | (w > capacity)
+        always = (w == 0) & ~never
+        if never.any() or always.any():
+            fixed[free[never]] = 0
+            fixed[free[always]] = 1
+            continue
+        if len(free) == 0:
+            break
+
+        # Dominance
+        dominated = _dominated(w, v, capacity)
+        if dominated.any():
+            fixed[free[dominated]] = 0
+            continue
+
+        # Fractional relaxation: items by decreasing ratio, critical item at s
+        order = np.argsort(-(v / w), kind="stable")
+        cumulative = np.cumsum(w[order])
+        s = int(np.searchsorted(cumulative, capacity, side="right"))
+        if s == len(free):
+            fixed[free] = 1  # everything fits
+            break
+
+        # Greedy incumbent on the free items
+        fixed_value = int(values[packed].sum())
+        greedy = packed.astype(np.int8)
+        remaining = capacity
+        greedy_value = fixed_value
+        for j in order.tolist():
+            if w[j] <= remaining:
+                remaining -= int(w[j])
+                greedy_value += int(v[j])
+                greedy[free[j]] = 1
+        if greedy_value > best_value:
+            best, best_value = greedy, greedy_value
+
+        # Reduced-cost fixing
+        critical = order[s]
+        ratio = v[critical] / w[critical]
+        packed_weight = int(cumulative[s - 1]) if s > 0 else 0
+        upper = float(v[order[:s]].sum()) + (capacity - packed_weight) * ratio
+        lower = best_value - fixed_value
+        tolerance = 1e-8 * max(1.0, abs(upper))
+        if upper < lower + 1 - tolerance:
+            fixed[:] = best  # no solution under the fixations beats the incumbent
+            break
+        flip_bound = upper - np.abs(v - ratio * w)
+        fixable = flip_bound < lower + 1 - tolerance
+        fixable[critical] = False
+        if not fixable.any():
+            break
+        in_relaxation = np.zeros(len(free), dtype=bool)
+        in_relaxation[order[:s]] = True
+        fixed[free[fixable]] = in_relaxation[fixable]
+
+    best_weight = int(weights[best == 1].sum())
+    result = PresolveResult(
+        instance,
+        fixed,
+        HeuristicSolution.from_aggregates(
+            instance,
+            best,
+            best_value,
+            value=best_value,
+            weight=best_weight,
+            is_integral=True,
+        ),
+    )
+    logging.info(
+        "Presolve fixed %d of %d items.", result.num_fixed, len(instance.items)
+    )
+    return result
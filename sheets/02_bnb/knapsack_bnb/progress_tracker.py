@@ -5,9 +5,17 @@ Track and display detailed statistics of your branch-and-bound search.
 You will see iteration counts, node creation/exploration, depth, status, and bounds.
 
 You can customize the printed table or integrate further visualization callbacks.
+
+The amount of reporting is selected by a `TrackerMode`:
+  - FULL: print every iteration and heuristic solution and write the visualization.
+  - SAMPLED: print a line every `report_every` iterations or `report_interval`
+    seconds, without visualization. Meant for long runs.
+  - SILENT: no output and no visualization at all; only the counters are kept.
 """
 
+import time
 from datetime import datetime
+from enum import Enum
 from typing import Optional
 
 from .bnb_nodes import BnBNode, NodeStatus
@@ -18,6 +26,16 @@ from .solutions import SolutionPool
 from .visualization import BnBVisualization
 
 
+class TrackerMode(Enum):
+    """
+    How much the ProgressTracker reports.
+    """
+
+    FULL = "full"
+    SAMPLED = "sampled"
+    SILENT = "silent"
+
+
 class ProgressTracker:
     """
     Monitors and reports BnB search progress:
@@ -25,7 +43,15 @@ class ProgressTracker:
       - nodes created vs. explored
       - current node depth and status
       - current node value, global UB and LB
-      - visualization callbacks
+      - visualization callbacks (only in TrackerMode.FULL)
+
+    Args:
+        instance: the knapsack instance.
+        search_strategy: the open list, used for the global upper bound.
+        solutions: the solution pool, used for the global lower bound.
+        mode: how much to report, see `TrackerMode`.
+        report_every: in SAMPLED mode, report every this many iterations.
+        report_interval: in SAMPLED mode, report at least every this many seconds.
     """
 
     def __init__(
@@ -33,13 +59,21 @@ class ProgressTracker:
         instance: Instance,
         search_strategy: SearchStrategy,
         solutions: SolutionPool,
+        mode: TrackerMode = TrackerMode.FULL,
+        report_every: int = 1000,
+        report_interval: float = 5.0,
     ) -> None:
         self._instance = instance
         self._search = search_strategy
         self._solutions = solutions
-        self._vis = BnBVisualization(instance)
+        self.mode = mode
+        self._report_every = report_every
+        self._report_interval = report_interval
+        # the visualization is only built in full mode
+        self._vis = BnBVisualization(instance) if mode == TrackerMode.FULL else None
 
         self._start_time: Optional[datetime] = None
+        self._last_report = 0.0
         self.num_iterations = 0
         self._nodes_created = 0
         self._current_node: Optional[BnBNode] = None
@@ -57,7 +91,8 @@ class ProgressTracker:
     def on_new_node_in_tree(self, node: BnBNode) -> None:
         """Called whenever a new node is generated."""
         self._nodes_created += 1
-        self._vis.on_new_node_in_tree(node)
+        if self._vis is not None:
+            self._vis.on_new_node_in_tree(node)
 
     def on_heuristic_solution(self, node: BnBNode, sol: HeuristicSolution) -> None:
         """Called when a heuristic finds a new feasible solution."""
@@ -65,19 +100,24 @@ class ProgressTracker:
             raise ValueError(f"Invalid heuristic solution: {sol}")
         # if sol.value() >= self._solutions.best_solution_value():
         node.heuristic_solution = sol
-        print(
-            f"[Heuristic] node {node.node_id} -> new feasible solution {sol} (value={sol.value():.3f})"
-        )
+        if self.mode == TrackerMode.FULL:
+            print(
+                f"[Heuristic] node {node.node_id} -> new feasible solution {sol} (value={sol.value():.3f})"
+            )
 
     def on_node_pruned(
         self, node: BnBNode, best_solution: HeuristicSolution | None
     ) -> None:
         """Called whenever a node is pruned."""
-        self._vis.on_node_pruned(node, best_solution)
+        if self._vis is not None:
+            self._vis.on_node_pruned(node, best_solution)
 
     def start_search(self) -> None:
         """Initialize search reporting and print header."""
         self._start_time = datetime.now()
+        self._last_report = time.monotonic()
+        if self.mode == TrackerMode.SILENT:
+            return
         header = (
             f"{'Iter':>5} {'Explored/Total':>15} {'Depth':>5} "
             f"{'Status':>10} {'Val':>7} {'UB':>7} {'LB':>7}"
@@ -91,10 +131,23 @@ class ProgressTracker:
         self.num_iterations += 1
         self._current_node = node
 
+    def _should_report(self) -> bool:
+        if self.mode == TrackerMode.FULL:
+            return True
+        if self.mode == TrackerMode.SILENT:
+            return False
+        if self.num_iterations % self._report_every == 0:
+            return True
+        return time.monotonic() - self._last_report >= self._report_interval
+
     def end_iteration(self, status: NodeStatus) -> None:
         """Finish processing a node and report its stats."""
         if self._current_node is None:
             return
+        if not self._should_report():
+            self._current_node = None
+            return
+        self._last_report = time.monotonic()
         explored = self.num_iterations
         total = self._nodes_created
         depth = self._current_node.depth
@@ -106,17 +159,20 @@ class ProgressTracker:
             f"{status.value:>13} {val:7.1f} {ub:7.1f} {lb:7.1f}"
         )
         # Visualization callback
-        self._vis.on_node_processed(
-            self._current_node,
-            lb=lb,
-            ub=ub,
-            best_solution=self._solutions.best_solution(),
-        )
+        if self._vis is not None:
+            self._vis.on_node_processed(
+                self._current_node,
+                lb=lb,
+                ub=ub,
+                best_solution=self._solutions.best_solution(),
+            )
         # reset per-iteration data
         self._current_node = None
 
     def end_search(self) -> None:
         """Finalize reporting and output summary and visualization."""
+        if self.mode == TrackerMode.SILENT:
+            return
         duration = datetime.now() - self._start_time if self._start_time else None
         print("\nSearch finished.")
         print(
@@ -124,9 +180,14 @@ class ProgressTracker:
         )
         best = self._solutions.best_solution()
         val = self._solutions.best_solution_value()
-        print(f"Best solution: {best} with value {val:.3f}.")
+        if self._vis is not None:
+            print(f"Best solution: {best} with value {val:.3f}.")
+        else:
+            print(f"Best solution value: {val:.3f}.")
         if duration:
             print(f"Elapsed time: {duration}.")
+        if self._vis is None:
+            return
         # write visualization
         ts = datetime.now().strftime("%Y-%m-%d_%Hh-%Mm-%Ss")
         self._vis.visualize(
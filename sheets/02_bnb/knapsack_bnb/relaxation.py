@@ -5,7 +5,7 @@ In branch-and-bound, a relaxation of the original 0/1 knapsack yields an upper b
 on the best feasible solution within a branch. If this bound does not exceed your
 current best feasible solution, you can prune that branch and skip exploring it.
 
-This file provides three example strategies:
+This file provides the following example strategies:
   1. VeryNaiveRelaxationSolver:
      - Ignores capacity entirely, sets every unfixed item to 1.
      - Fastest, loosest bound.
@@ -13,16 +13,59 @@ This file provides three example strategies:
      - Checks that already-fixed items of 1 fit capacity.
      - Sets all unfixed items to 1, ignoring capacity beyond fixed part.
      - Slightly tighter bound than VeryNaive.
-  3. MyRelaxationSolver:
+  3. FractionalRelaxationSolver:
+     - Dantzig bound: fills the remaining capacity greedily by value/weight ratio
+       and takes a fraction of the first item that does not fit (the critical item).
+     - Sorts the items only once per instance and derives a child's bound from
+       its parent's critical item whenever possible.
+     - Solves batches of unrelated nodes with one vectorized greedy fill.
+  4. MartelloTothRelaxationSolver:
+     - Martello-Toth bound U2: the better of the integral bounds for leaving out
+       the critical item (U0) and for forcing it in (U1). Never worse than Dantzig.
+  5. EnumerativeRelaxationSolver:
+     - Computes the Dantzig bounds of both branches on the critical item and takes
+       the larger one. At least as tight as U2, for about twice the cost.
+  6. SurrogateRelaxationSolver:
+     - For multi-dimensional instances: the Dantzig bound of the surrogate
+       constraint, a combination of all constraints with optimized multipliers.
+  7. LPRelaxationSolver:
+     - For multi-dimensional instances: the LP relaxation, solved with SciPy
+       (optional dependency).
+  8. MyRelaxationSolver:
      - Stub for your own algorithm (e.g., fractional knapsack, propagation).
 
+Solvers 1 to 5 only consider the first constraint of a multi-dimensional instance
+(see `Instance.constraints`). Their bounds are still valid, but their integral
+solutions may violate the other constraints, so combine them with a branching
+strategy that also branches on integral items.
+
+Solvers 3 to 7 record their compute cost in `cost` (a `RelaxationCost`), so the
+bound strength can be weighed against the node throughput, e.g., on strongly
+correlated instances where the Dantzig bound is weak.
+
 You should subclass `RelaxationSolver` and implement `solve(instance, decisions)`
 so that:
   a) fixed decisions remain unchanged;
   b) objective >= best 0/1 solution consistent with those decisions.
+Optionally, override `solve_child(instance, decisions, parent)` to reuse the
+relaxed solution of the parent node, and `solve_batch(instance, decisions_list)`
+to solve several nodes at once (e.g., all children of a node, or a batch of
+frontier nodes vectorized with NumPy).
 """
 
 import abc
+import math
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+try:  # optional, only needed for LPRelaxationSolver
+    from scipy.optimize import linprog
+except ImportError:
+    linprog = None
 
 from .branching_decisions import BranchingDecisions
 from .instance import Instance
@@ -48,6 +91,41 @@ class RelaxationSolver(abc.ABC):
         """
         ...
 
+    def solve_child(
+        self,
+        instance: Instance,
+        decisions: BranchingDecisions,
+        parent: RelaxedSolution,
+    ) -> RelaxedSolution:
+        """
+        Return the `RelaxedSolution` of a child node, given the relaxed solution
+        of its parent. The child's `decisions` extend the parent's decisions by
+        exactly one fixation, namely `decisions.last_fixed`.
+
+        Override this to reuse the work done for the parent (e.g., an incremental
+        bound). The default solves the child from scratch. `parent` must not be modified.
+        """
+        return self.solve(instance, decisions)
+
+    def solve_batch(
+        self,
+        instance: Instance,
+        decisions_list: Sequence[BranchingDecisions],
+        parent: Optional[RelaxedSolution] = None,
+    ) -> list[RelaxedSolution]:
+        """
+        Return the `RelaxedSolution`s of several nodes, in the order of
+        `decisions_list`. If `parent` is given, all nodes are children of the node
+        with this relaxed solution (see `solve_child`), e.g., the siblings of
+        `BranchingDecisions.split_on`.
+
+        Override this to share work between the nodes. The default solves them
+        one by one.
+        """
+        if parent is not None:
+            return [self.solve_child(instance, d, parent) for d in decisions_list]
+        return [self.solve(instance, d) for d in decisions_list]
+
 
 class VeryNaiveRelaxationSolver(RelaxationSolver):
     """
@@ -70,7 +148,7 @@ class VeryNaiveRelaxationSolver(RelaxationSolver):
         # build selection: 1.0 for fixed 1 or unfixed, 0 for fixed 0
         selection = [0.0 if x == 0 else 1.0 for x in decisions]
         # compute objective value
-        upper = sum(item.value * sel for item, sel in zip(instance.items, selection))
+        upper = float(np.dot(instance.values, selection))
         return RelaxedSolution(instance, selection, upper)
 
 
@@ -83,15 +161,656 @@ class NaiveRelaxationSolver(RelaxationSolver):
         self, instance: Instance, decisions: BranchingDecisions
     ) -> RelaxedSolution:
         # compute capacity after fixed 1 items
-        used = sum(item.weight for item, x in zip(instance.items, decisions) if x == 1)
+        used = sum(w for w, x in zip(instance.weights.tolist(), decisions) if x == 1)
         if used > instance.capacity:
             return RelaxedSolution.create_infeasible(instance)
 
         selection = [0.0 if x == 0 else 1.0 for x in decisions]
-        upper = sum(item.value * sel for item, sel in zip(instance.items, selection))
+        upper = float(np.dot(instance.values, selection))
         return RelaxedSolution(instance, selection, upper)
 
 
+def _floor(bound: float) -> int:
+    """
+    Round a bound down to an integer, tolerating floating-point errors.
+    """
+    return math.floor(bound + 1e-9 * max(1.0, abs(bound)))
+
+
+@dataclass
+class RelaxationCost:
+    """
+    Compute cost of a relaxation solver.
+
+    Attributes:
+        calls: number of solved nodes.
+        seconds: total time spent in the solver.
+        tightened: total amount by which the bounds are below the Dantzig bounds.
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+    tightened: float = 0.0
+
+    def seconds_per_call(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.calls} calls, {self.seconds:.3f}s "
+            f"({1e6 * self.seconds_per_call():.1f}us/call), "
+            f"tightened by {self.tightened:g}"
+        )
+
+
+class FractionalRelaxationSolver(RelaxationSolver):
+    """
+    Fractional knapsack (Dantzig) bound.
+
+    After the fixed items are packed, the unfixed items are added in order of
+    decreasing value/weight ratio until the next one does not fit anymore. A fraction
+    of this critical item fills the remaining capacity. No 0/1 solution under the same
+    decisions can be better than this LP optimum.
+
+    The ratio order is computed only once per instance. For a child node, the bound
+    is derived from the parent's critical item: fixing it to 0 continues the greedy
+    fill behind it, fixing it to 1 removes items from the end of the greedy prefix.
+    Both only touch the few items around the critical item instead of re-sorting.
+    A batch of nodes without a common parent is filled at once with NumPy: the
+    prefix sums of the unfixed weights in ratio order locate every critical item.
+
+    Subclasses can tighten the Dantzig bound by overriding `_tighten`; the
+    incremental update of a child still starts from the parent's Dantzig solution.
+    """
+
+    def __init__(self) -> None:
+        self.cost = RelaxationCost()
+        # tightened solution -> the Dantzig solution it was derived from
+        self._dantzig: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._instance: Instance | None = None
+        self._weights: list[int] = []
+        self._values: list[int] = []
+        self._order: list[int] = []  # item indices by decreasing value/weight ratio
+        self._rank: list[int] = []  # position of each item in `_order`
+        # weights, values and order as arrays for `solve_batch` (built on demand)
+        self._batch_arrays: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+
+    def __getstate__(self) -> dict:
+        # weak references cannot be pickled (e.g., for `ParallelBnBSearch`)
+        state = self.__dict__.copy()
+        state["_dantzig"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._dantzig = weakref.WeakKeyDictionary()
+
+    def _prepare(self, instance: Instance) -> None:
+        """
+        Cache weights, values and the ratio order of `instance`.
+        """
+        if instance is self._instance:
+            return
+        self._weights = instance.weights.tolist()
+        self._values = instance.values.tolist()
+        # items without weight are always packed, so they come first
+        self._order = sorted(
+            range(len(instance.items)),
+            key=lambda i: (
+                -self._values[i] / self._weights[i] if self._weights[i] else -math.inf
+            ),
+        )
+        self._rank = [0] * len(self._order)
+        for position, i in enumerate(self._order):
+            self._rank[i] = position
+        self._instance = instance
+        self._batch_arrays = None
+
+    def _create_solution(
+        self,
+        instance: Instance,
+        selection: list[float] | np.ndarray,
+        value: float,
+        remaining: int,
+        critical: int | None = None,
+    ) -> RelaxedSolution:
+        """
+        Create the solution with the aggregates known from the greedy fill.
+        `critical` is the index of the fractionally packed item, if any.
+        """
+        weight = instance.capacity - remaining
+        is_integral = True
+        if critical is not None:
+            fraction = float(selection[critical])
+            weight += fraction * self._weights[critical]
+            value += fraction * self._values[critical]
+            is_integral = fraction == 0.0
+        return RelaxedSolution.from_aggregates(
+            instance,
+            np.array(selection),
+            upper_bound=value,
+            value=value,
+            weight=weight,
+            is_integral=is_integral,
+        )
+
+    def _tighten(
+        self,
+        instance: Instance,
+        decisions: BranchingDecisions,
+        solution: RelaxedSolution,
+    ) -> RelaxedSolution:
+        """
+        Return a solution with a tighter bound than the Dantzig `solution`.
+        """
+        return solution
+
+    def _record(
+        self,
+        start: float,
+        dantzigs: list[RelaxedSolution],
+        solutions: list[RelaxedSolution],
+    ) -> list[RelaxedSolution]:
+        for dantzig, solution in zip(dantzigs, solutions):
+            if solution is not dantzig:
+                self._dantzig[solution] = dantzig
+                self.cost.tightened += dantzig.upper_bound - solution.upper_bound
+        self.cost.calls += len(solutions)
+        self.cost.seconds += time.perf_counter() - start
+        return solutions
+
+    def solve(
+        self, instance: Instance, decisions: BranchingDecisions
+    ) -> RelaxedSolution:
+        start = time.perf_counter()
+        dantzig = self._solve(instance, decisions)
+        tightened = self._tighten(instance, decisions, dantzig)
+        return self._record(start, [dantzig], [tightened])[0]
+
+    def solve_child(
+        self,
+        instance: Instance,
+        decisions: BranchingDecisions,
+        parent: RelaxedSolution,
+    ) -> RelaxedSolution:
+        start = time.perf_counter()
+        dantzig = self._solve_child(
+            instance, decisions, self._dantzig.get(parent, parent)
+        )
+        tightened = self._tighten(instance, decisions, dantzig)
+        return self._record(start, [dantzig], [tightened])[0]
+
+    def solve_batch(
+        self,
+        instance: Instance,
+        decisions_list: Sequence[BranchingDecisions],
+        parent: Optional[RelaxedSolution] = None,
+    ) -> list[RelaxedSolution]:
+        if parent is not None or len(decisions_list) < 2:
+            # children are cheaper incrementally from their parent
+            return super().solve_batch(instance, decisions_list, parent)
+        start = time.perf_counter()
+        dantzigs = self._solve_batch(instance, decisions_list)
+        tightened = [
+            self._tighten(instance, decisions, dantzig)
+            for decisions, dantzig in zip(decisions_list, dantzigs)
+        ]
+        return self._record(start, dantzigs, tightened)
+
+    def _solve(
+        self, instance: Instance, decisions: BranchingDecisions
+    ) -> RelaxedSolution:
+        self._prepare(instance)
+        weights, values = self._weights, self._values
+
+        # -1 for unfixed items; one bulk read instead of an access per item
+        fixations = decisions.to_array().tolist()
+        selection = [0.0] * len(weights)
+        remaining = instance.capacity
+        value = 0
+        for i in decisions.included_items():
+            selection[i] = 1.0
+            remaining -= weights[i]
+            value += values[i]
+        if remaining < 0:
+            return RelaxedSolution.create_infeasible(instance)
+
+        for i in self._order:
+            if fixations[i] >= 0:
+                continue
+            if weights[i] <= remaining:
+                selection[i] = 1.0
+                remaining -= weights[i]
+                value += values[i]
+            else:
+                selection[i] = remaining / weights[i]
+                return self._create_solution(instance, selection, value, remaining, i)
+        return self._create_solution(instance, selection, value, remaining)
+
+    def _solve_child(
+        self,
+        instance: Instance,
+        decisions: BranchingDecisions,
+        parent: RelaxedSolution,
+    ) -> RelaxedSolution:
+        index = decisions.last_fixed
+        if (
+            index is None
+            or instance is not self._instance
+            or parent.instance is not instance
+            or parent.is_infeasible()
+        ):
+            return self._solve(instance, decisions)
+        fixed_to = decisions[index]
+        fraction = float(parent.selection[index])
+        if fraction == fixed_to:
+            # the parent's solution already satisfies the new fixation
+            return RelaxedSolution.from_aggregates(
+                instance,
+                parent.selection,
+                parent.upper_bound,
+                value=parent.value(),
+                weight=parent.weight(),
+                is_integral=parent.is_integral(),
+            )
+        if not 0.0 < fraction < 1.0:
+            # not branched on the critical item, no incremental update
+            return self._solve(instance, decisions)
+
+        weights, values, order = self._weights, self._values, self._order
+        # Everything in front of the critical item is packed entirely (integral
+        # weights and values), so recover the exact sums to avoid numerical drift.
+        remaining = round(fraction * weights[index])
+        value = round(parent.upper_bound - fraction * values[index])
+        selection = parent.selection.tolist()
+        fixations = decisions.to_array().tolist()
+        position = self._rank[index]
+
+        if fixed_to == 0:
+            selection[index] = 0.0
+            for i in (order[p] for p in range(position + 1, len(order))):
+                if fixations[i] >= 0:
+                    continue
+                if weights[i] <= remaining:
+                    selection[i] = 1.0
+                    remaining -= weights[i]
+                    value += values[i]
+                else:
+                    selection[i] = remaining / weights[i]
+                    return self._create_solution(
+                        instance, selection, value, remaining, i
+                    )
+            return self._create_solution(instance, selection, value, remaining)
+
+        # fixed_to == 1: make room by unpacking from the end of the greedy prefix
+        selection[index] = 1.0
+        value += values[index]
+        overflow = weights[index] - remaining
+        for i in (order[p] for p in range(position - 1, -1, -1)):
+            if fixations[i] >= 0 or weights[i] == 0:
+                continue
+            value -= values[i]
+            if weights[i] <= overflow:
+                selection[i] = 0.0
+                overflow -= weights[i]
+                if overflow == 0:
+                    return self._create_solution(instance, selection, value, 0)
+            else:
+                # the item stays partially packed and fills the knapsack again
+                selection[i] = (weights[i] - overflow) / weights[i]
+                return self._create_solution(
+                    instance, selection, value, weights[i] - overflow, i
+                )
+        # even the fixed items alone exceed the capacity
+        return RelaxedSolution.create_infeasible(instance)
+
+    def _solve_batch(
+        self, instance: Instance, decisions_list: Sequence[BranchingDecisions]
+    ) -> list[RelaxedSolution]:
+        self._prepare(instance)
+        if self._batch_arrays is None:
+            self._batch_arrays = (
+                np.array(self._weights, dtype=np.int64),
+                np.array(self._values, dtype=np.int64),
+                np.array(self._order, dtype=np.intp),
+            )
+        weights, values, order = self._batch_arrays
+
+        # one row per node: -1 for unfixed items, 0 or 1 for fixed ones
+        fixations = np.array(
+            [d.to_array() for d in decisions_list], dtype=np.int8
+        ).reshape(len(decisions_list), len(weights))
+        included = fixations == 1
+        remaining = instance.capacity - included @ weights
+
+        # greedy fill: the unfixed items in ratio order whose prefix sum fits
+        free = fixations[:, order] == -1
+        prefix = np.cumsum(np.where(free, weights[order], 0), axis=1)
+        packed = free & (prefix <= remaining[:, None])
+        overflowing = free & ~packed
+        has_critical = overflowing.any(axis=1)
+        critical_position = overflowing.argmax(axis=1)
+
+        selection = included.astype(np.float64)
+        selection[:, order] += packed
+        value = included @ values + packed @ values[order]
+        remaining -= packed @ weights[order]
+
+        solutions = []
+        for row in range(len(decisions_list)):
+            if remaining[row] < 0:
+                solutions.append(RelaxedSolution.create_infeasible(instance))
+                continue
+            critical = None
+            if has_critical[row]:
+                critical = int(order[critical_position[row]])
+                selection[row, critical] = remaining[row] / weights[critical]
+            solutions.append(
+                self._create_solution(
+                    instance,
+                    selection[row],
+                    int(value[row]),
+                    int(remaining[row]),
+                    critical,
+                )
+            )
+        return solutions
+
+    def _critical_item(self, solution: RelaxedSolution) -> tuple[int, int, int] | None:
+        """
+        For a fractional Dantzig solution, return the critical item with the exact
+        value of the packed items and the capacity left for the critical item.
+        """
+        if solution.is_infeasible() or solution.is_integral():
+            return None
+        critical = int(np.flatnonzero(solution.selection % 1.0)[0])
+        fraction = float(solution.selection[critical])
+        residual = round(fraction * self._weights[critical])
+        packed_value = round(solution.upper_bound - fraction * self._values[critical])
+        return critical, packed_value, residual
+
+    def _scaled(
+        self,
+        instance: Instance,
+        solution: RelaxedSolution,
+        critical: int,
+        packed_value: int,
+        upper_bound: float,
+    ) -> RelaxedSolution:
+        """
+        Return `solution` with the bound lowered to `upper_bound`. The fraction of
+        the critical item is reduced such that the value still equals the bound.
+        """
+        if upper_bound >= solution.upper_bound:
+            return solution
+        fraction = 0.0
+        if self._values[critical] > 0:
+            fraction = (upper_bound - packed_value) / self._values[critical]
+        selection = solution.selection.copy()
+        selection[critical] = fraction
+        weight = (
+            solution.weight()
+            - (float(solution.selection[critical]) - fraction) * self._weights[critical]
+        )
+        return RelaxedSolution.from_aggregates(
+            instance,
+            selection,
+            upper_bound=upper_bound,
+            value=upper_bound,
+            weight=weight,
+            is_integral=fraction == 0.0,
+        )
+
+
+class MartelloTothRelaxationSolver(FractionalRelaxationSolver):
+    """
+    Martello-Toth upper bound U2.
+
+    Let the critical item s of the Dantzig solution get residual capacity c
+    after the packed items of value P. Every 0/1 solution either
+      - leaves s out: the remaining capacity c is filled at most with the ratio
+        of the next unfixed item behind s, U0 = P + floor(c * v_next / w_next), or
+      - packs s: at least w_s - c weight of packed items has to go, each unit
+        worth at least the ratio of the last packed unfixed item in front of s,
+        U1 = P + floor(v_s - (w_s - c) * v_prev / w_prev).
+    U2 = max(U0, U1) is never larger than the (rounded down) Dantzig bound, and
+    only needs two more items besides the Dantzig solution.
+    """
+
+    def _tighten(
+        self,
+        instance: Instance,
+        decisions: BranchingDecisions,
+        solution: RelaxedSolution,
+    ) -> RelaxedSolution:
+        critical_item = self._critical_item(solution)
+        if critical_item is None:
+            return solution
+        critical, packed_value, residual = critical_item
+        weights, values, order = self._weights, self._values, self._order
+        position = self._rank[critical]
+        fixations = decisions.to_array().tolist()
+
+        bound = packed_value  # U0 without a next item
+        for i in (order[p] for p in range(position + 1, len(order))):
+            if fixations[i] < 0:
+                bound += _floor(residual * values[i] / weights[i])
+                break
+        for i in (order[p] for p in range(position - 1, -1, -1)):
+            if fixations[i] < 0 and weights[i] > 0:
+                missing = weights[critical] - residual
+                forced = values[critical] - missing * values[i] / weights[i]
+                bound = max(bound, packed_value + _floor(forced))
+                break
+        return self._scaled(instance, solution, critical, packed_value, bound)
+
+
+class EnumerativeRelaxationSolver(FractionalRelaxationSolver):
+    """
+    Enumerative bound on the critical item.
+
+    Every 0/1 solution either leaves the critical item out or packs it, so the
+    larger Dantzig bound of these two branches is an upper bound as well. Both are
+    computed incrementally from the Dantzig solution, just as for child nodes, and
+    rounded down as all values are integers.
+    """
+
+    def _tighten(
+        self,
+        instance: Instance,
+        decisions: BranchingDecisions,
+        solution: RelaxedSolution,
+    ) -> RelaxedSolution:
+        critical_item = self._critical_item(solution)
+        if critical_item is None:
+            return solution
+        critical, packed_value, _ = critical_item
+        without, with_ = decisions.split_on(critical)
+        bound = max(
+            self._solve_child(instance, without, solution).upper_bound,
+            self._solve_child(instance, with_, solution).upper_bound,
+        )
+        bound = max(packed_value, _floor(bound))
+        return self._scaled(instance, solution, critical, packed_value, bound)
+
+
+class SurrogateRelaxationSolver(RelaxationSolver):
+    """
+    Surrogate relaxation of a multi-dimensional knapsack instance.
+
+    With multipliers u >= 0, the constraints W x <= C imply the single surrogate
+    constraint (u W) x <= u C. The Dantzig bound of the knapsack with this
+    constraint is an upper bound of the instance, and for the best multipliers it
+    equals the LP bound. The multipliers are optimized at the first node of an
+    instance by `iterations` multiplicative subgradient steps (the multipliers of
+    violated constraints grow) and then used for all nodes. Fixed items are checked
+    against every constraint.
+
+    On single-constraint instances, this is the (rounded down) Dantzig bound.
+
+    Args:
+        iterations: number of multiplier updates.
+        step: initial step size of the updates; it decays geometrically.
+    """
+
+    def __init__(self, iterations: int = 50, step: float = 1.0) -> None:
+        self.cost = RelaxationCost()
+        self._iterations = iterations
+        self._step = step
+        self._instance: Instance | None = None
+        self.multipliers = np.ones(1)
+        self._surrogate_weights = np.zeros(0)
+        self._surrogate_capacity = 0.0
+        self._order = np.zeros(0, dtype=np.intp)
+
+    def _set_multipliers(self, instance: Instance, multipliers: np.ndarray) -> None:
+        """
+        Compute the surrogate constraint and its ratio order for `multipliers`.
+        """
+        self.multipliers = multipliers
+        self._surrogate_weights = multipliers @ instance.weight_matrix
+        self._surrogate_capacity = float(multipliers @ instance.capacities)
+        weights, values = self._surrogate_weights, instance.values
+        # items without weight are always packed, so they come first
+        ratios = np.divide(
+            values, weights, out=np.full(len(values), np.inf), where=weights > 0
+        )
+        self._order = np.argsort(-ratios, kind="stable")
+
+    def _fill(
+        self, instance: Instance, fixations: np.ndarray
+    ) -> tuple[np.ndarray, float, Optional[int]]:
+        """
+        Return the Dantzig solution of the surrogate constraint, its value and the
+        critical item (if any). The fixed items must fit the surrogate constraint.
+        """
+        weights = self._surrogate_weights
+        included = fixations == 1
+        remaining = self._surrogate_capacity - float(weights[included].sum())
+        free = self._order[fixations[self._order] == -1]
+        prefix = np.cumsum(weights[free])
+        tolerance = 1e-9 * max(1.0, self._surrogate_capacity)
+        count = int(np.searchsorted(prefix, remaining + tolerance, side="right"))
+
+        selection = included.astype(np.float64)
+        selection[free[:count]] = 1.0
+        critical = None
+        if count < len(free):
+            critical = int(free[count])
+            residual = remaining - (prefix[count - 1] if count else 0.0)
+            selection[critical] = min(1.0, max(0.0, residual / weights[critical]))
+        return selection, float(instance.values @ selection), critical
+
+    def _optimize_multipliers(self, instance: Instance, fixations: np.ndarray) -> None:
+        """
+        Minimize the surrogate bound of the node with `fixations` over the multipliers.
+        """
+        weights = instance.weight_matrix
+        capacities = instance.capacities
+        scale = 1.0 / np.maximum(capacities, 1)
+        multipliers = scale / scale.sum()
+        best_multipliers, best_value = multipliers, math.inf
+        step = self._step
+        for _ in range(self._iterations):
+            self._set_multipliers(instance, multipliers)
+            selection, value, _ = self._fill(instance, fixations)
+            if value < best_value:
+                best_multipliers, best_value = multipliers, value
+            violation = (weights @ selection - capacities) * scale
+            multipliers = multipliers * np.exp(step * violation)
+            multipliers /= multipliers.sum()
+            step *= 0.95
+        self._set_multipliers(instance, best_multipliers)
+
+    def solve(
+        self, instance: Instance, decisions: BranchingDecisions
+    ) -> RelaxedSolution:
+        start = time.perf_counter()
+        fixations = decisions.to_array()
+        included = fixations == 1
+        self.cost.calls += 1
+        if np.any(instance.weight_matrix @ included > instance.capacities):
+            self.cost.seconds += time.perf_counter() - start
+            return RelaxedSolution.create_infeasible(instance)
+        if instance is not self._instance:
+            if instance.constraints and self._iterations > 0:
+                self._optimize_multipliers(instance, fixations)
+            else:
+                self._set_multipliers(instance, np.ones(instance.num_constraints))
+            self._instance = instance
+
+        selection, value, critical = self._fill(instance, fixations)
+        bound = _floor(value)
+        if critical is not None and bound < value and instance.values[critical] > 0:
+            # lower the fraction of the critical item to the integral bound
+            selection[critical] -= (value - bound) / instance.values[critical]
+            value = float(bound)
+        solution = RelaxedSolution.from_aggregates(
+            instance,
+            selection,
+            upper_bound=bound,
+            value=value,
+            weight=float(instance.weights @ selection),
+            is_integral=critical is None or selection[critical] == 0.0,
+        )
+        self.cost.seconds += time.perf_counter() - start
+        return solution
+
+
+class LPRelaxationSolver(RelaxationSolver):
+    """
+    LP relaxation of a (multi-dimensional) knapsack instance: maximize the value
+    over 0 <= x <= 1 with W x <= C and the fixed items, rounded down.
+
+    Solved with SciPy's HiGHS interface, which is an optional dependency. Meant for
+    small instances or to check the surrogate bound; per node, it is much slower
+    than `SurrogateRelaxationSolver`.
+    """
+
+    def __init__(self) -> None:
+        if linprog is None:
+            raise ImportError("LPRelaxationSolver requires SciPy (pip install scipy).")
+        self.cost = RelaxationCost()
+
+    def solve(
+        self, instance: Instance, decisions: BranchingDecisions
+    ) -> RelaxedSolution:
+        start = time.perf_counter()
+        fixations = decisions.to_array()
+        bounds = np.column_stack(
+            [
+                np.where(fixations == -1, 0, fixations),
+                np.where(fixations == -1, 1, fixations),
+            ]
+        )
+        result = linprog(
+            -instance.values,
+            A_ub=instance.weight_matrix,
+            b_ub=instance.capacities,
+            bounds=bounds,
+            method="highs",
+        )
+        self.cost.calls += 1
+        self.cost.seconds += time.perf_counter() - start
+        if result.status == 2:
+            return RelaxedSolution.create_infeasible(instance)
+        if result.status != 0:
+            raise RuntimeError(f"LP relaxation failed: {result.message}")
+
+        selection = np.clip(result.x, 0.0, 1.0)
+        rounded = np.round(selection)
+        integral = np.abs(selection - rounded) < 1e-9
+        selection[integral] = rounded[integral]
+        return RelaxedSolution.from_aggregates(
+            instance,
+            selection,
+            upper_bound=_floor(-result.fun),
+            value=float(instance.values @ selection),
+            weight=float(instance.weights @ selection),
+            is_integral=bool(integral.all()),
+        )
+
+
 class MyRelaxationSolver(RelaxationSolver):
     """
     Your relaxation solver stub.
@@ -9,13 +9,26 @@ You should ensure your relaxation solver produces RelaxedSolution objects that:
   1. Keep fixed decisions unchanged.
   2. Have `upper_bound` >= the value of any feasible 0/1 solution under those decisions.
   3. Pass validation checks in this class.
+
+Relaxed solutions are immutable, so they can be shared between nodes and
+components without copying. Their value, weight, integrality and feasibility
+are computed at most once.
 """
 
 from typing import Sequence
 
+import numpy as np
+
 from .instance import Instance
 
 
+def _number(x: float) -> float:
+    """
+    Return integral values as int, so they are displayed as in "15 / 20".
+    """
+    return int(x) if float(x).is_integer() else x
+
+
 class RelaxedSolution:
     """
     Encapsulates a possibly-relaxed assignment (`selection`) and its bound.
@@ -26,37 +39,120 @@ class RelaxedSolution:
                    fixed items must match your fixation (0 or 1).
         upper_bound: an upper bound on the value of any 0/1 solution
                      consistent with `selection` fixations.
+
+    The selection is stored as a read-only NumPy array and none of the attributes
+    can be reassigned, so a solution never changes after its creation. This allows
+    to memoize `value()`, `weight()`, `is_integral()` and
+    `does_obey_capacity_constraint()`. If a relaxation solver already knows the
+    value and weight, it can skip all computations with `from_aggregates`.
     """
 
+    __slots__ = (
+        "_instance",
+        "_selection",
+        "_upper_bound",
+        "_value",
+        "_weight",
+        "_is_integral",
+        "_obeys_capacity",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         instance: Instance,
         selection: Sequence[float],
         upper_bound: float,
     ):
-        if len(selection) != len(instance.items):
+        selection = np.array(selection, dtype=np.float64)
+        if selection.shape != (len(instance.items),):
             raise ValueError("`selection` length must match number of items.")
-        self.instance = instance
-        self.selection = list(selection)
-        self.upper_bound = upper_bound
+        selection.flags.writeable = False
+        self._set(instance, selection, upper_bound)
 
         # Validate consistency: bound must exceed or equal actual value.
         actual = self.value()
-        if self.upper_bound >= 0 and self.upper_bound < actual - 1e-8:
+        tolerance = 1e-8 * max(1.0, abs(actual))  # relative for large values
+        if self.upper_bound >= 0 and self.upper_bound < actual - tolerance:
             raise ValueError(
                 f"Actual value {actual} exceeds upper_bound {self.upper_bound}."
             )
 
+    def _set(
+        self,
+        instance: Instance,
+        selection: np.ndarray,
+        upper_bound: float,
+        value: float | None = None,
+        weight: float | None = None,
+        is_integral: bool | None = None,
+    ) -> None:
+        self._instance = instance
+        self._selection = selection
+        self._upper_bound = upper_bound
+        self._value = value
+        self._weight = weight
+        self._is_integral = is_integral
+        self._obeys_capacity: bool | None = None
+
+    @classmethod
+    def from_aggregates(
+        cls,
+        instance: Instance,
+        selection: Sequence[float] | np.ndarray,
+        upper_bound: float,
+        value: float,
+        weight: float,
+        is_integral: bool | None = None,
+    ):
+        """
+        Fast constructor for relaxation solvers that already know the aggregates.
+
+        No validation is performed: `value` and `weight` must equal the value and
+        weight of `selection` (and `is_integral` its integrality, if given).
+        A float64 NumPy array is used as is and must not be modified afterwards.
+        """
+        selection = np.asarray(selection, dtype=np.float64)
+        selection.flags.writeable = False
+        solution = cls.__new__(cls)
+        solution._set(
+            instance,
+            selection,
+            upper_bound,
+            _number(value),
+            _number(weight),
+            is_integral,
+        )
+        return solution
+
+    @property
+    def instance(self) -> Instance:
+        return self._instance
+
+    @property
+    def selection(self) -> np.ndarray:
+        """
+        The (possibly fractional) usage of each item as read-only array.
+        """
+        return self._selection
+
+    @property
+    def upper_bound(self) -> float:
+        return self._upper_bound
+
     @staticmethod
     def create_infeasible(instance: Instance) -> "RelaxedSolution":
         """
         Return a RelaxedSolution marking an infeasible branch.
         Its `upper_bound` is -infinity and `selection` is all zeros.
         """
-        return RelaxedSolution(
+        return RelaxedSolution.from_aggregates(
             instance,
-            [0.0] * len(instance.items),
+            np.zeros(len(instance.items)),
             upper_bound=float("-inf"),
+            value=0.0,
+            weight=0.0,
+            is_integral=True,
         )
 
     def is_infeasible(self) -> bool:
@@ -69,30 +165,44 @@ class RelaxedSolution:
         """
         Compute total value = sum(item.value * fraction).
         """
-        return sum(
-            item.value * frac for item, frac in zip(self.instance.items, self.selection)
-        )
+        if self._value is None:
+            self._value = _number(float(np.dot(self.instance.values, self._selection)))
+        return self._value
 
     def weight(self) -> float:
         """
         Compute total weight = sum(item.weight * fraction).
         """
-        return sum(
-            item.weight * frac
-            for item, frac in zip(self.instance.items, self.selection)
-        )
+        if self._weight is None:
+            self._weight = _number(
+                float(np.dot(self.instance.weights, self._selection))
+            )
+        return self._weight
 
     def does_obey_capacity_constraint(self) -> bool:
         """
-        Return True if this relaxed solution is within capacity and selections
-        are in [0,1]. Returns False for infeasible marker.
+        Return True if this relaxed solution is within capacity (of all
+        constraints) and selections are in [0,1]. Returns False for infeasible marker.
         """
         if self.is_infeasible():
             return False
-        return (
-            all(0.0 <= frac <= 1.0 for frac in self.selection)
-            and self.weight() <= self.instance.capacity
-        )
+        if self._obeys_capacity is None:
+            self._obeys_capacity = bool(
+                np.all((self._selection >= 0.0) & (self._selection <= 1.0))
+                and self.weight() <= self.instance.capacity
+                and self._obeys_constraints()
+            )
+        return self._obeys_capacity
+
+    def _obeys_constraints(self) -> bool:
+        """
+        Return True if the additional constraints of a multi-dimensional
+        instance are obeyed.
+        """
+        if not self.instance.constraints:
+            return True
+        usage = self.instance.weight_matrix[1:] @ self._selection
+        return bool(np.all(usage <= self.instance.capacities[1:]))
 
     def is_integral(self) -> bool:
         """
@@ -100,7 +210,11 @@ class RelaxedSolution:
         """
         if self.is_infeasible():
             return False
-        return all(frac == int(frac) for frac in self.selection)
+        if self._is_integral is None:
+            self._is_integral = bool(
+                np.all(self._selection == np.floor(self._selection))
+            )
+        return self._is_integral
 
     def __str__(self) -> str:
         """
@@ -108,7 +222,7 @@ class RelaxedSolution:
         Fractions are shown with one decimal if non-integer.
         """
         parts = []
-        for frac in self.selection:
+        for frac in self.selection.tolist():
             if frac == int(frac):
                 parts.append(str(int(frac)))
             else:
@@ -117,6 +231,17 @@ class RelaxedSolution:
 
     def copy(self) -> "RelaxedSolution":
         """
-        Return a deep copy of this RelaxedSolution.
-        """
-        return RelaxedSolution(self.instance, self.selection.copy(), self.upper_bound)
+        Return a copy of this RelaxedSolution.
+        As solutions are immutable, the copy shares the selection and all
+        computed aggregates and skips validation.
+        """
+        solution = type(self).__new__(type(self))
+        solution._set(
+            self.instance,
+            self._selection,
+            self.upper_bound,
+            self._value,
+            self._weight,
+            self._is_integral,
+        )
+        return solution
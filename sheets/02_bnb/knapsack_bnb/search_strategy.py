@@ -7,10 +7,24 @@ function that ranks open nodes; this class manages a priority queue accordingly.
 
 You can implement breadth-first, depth-first, best-first, or any custom order
 by supplying different priority functions.
+
+Independent of the priority, the strategy keeps the bounds of the open nodes in a
+max-heap, so the best bound in the queue is available in (amortized) O(log n).
+
+The open list is a plain `heapq` (the search is single-threaded, so no locking
+is needed). Besides a custom `priority`, there are built-in node selections:
+  - BestFirstSearchStrategy: highest upper bound first.
+  - DepthFirstSearchStrategy: deepest node first, better bound on ties.
+  - BestEstimateSearchStrategy: highest estimate between heuristic value and bound first.
+  - PlungingSearchStrategy: depth-first dives with periodic jumps to the best bound.
+Their priority keys are computed once, when a node is enqueued. They only use
+`node.upper_bound`, `node.depth` and `node.heuristic_solution`, so compact nodes
+(see `NodeFactory(compact=True)`) stay compact in the queue; custom priorities
+should do the same.
 """
 
-import queue
-from typing import Callable, Iterator, Tuple, Any
+import heapq
+from typing import Any, Callable, Iterator, Optional, Tuple
 
 from .bnb_nodes import BnBNode
 
@@ -22,29 +36,44 @@ class SearchStrategy:
     Args:
         priority: callable mapping a BnBNode to a comparable key.
                   Lower keys are explored first.
+                  Subclasses may override `_key` instead.
     """
 
-    def __init__(self, priority: Callable[[BnBNode], Any]) -> None:
+    def __init__(self, priority: Optional[Callable[[BnBNode], Any]] = None) -> None:
         self._priority = priority
-        # use a counter to break ties by insertion order
-        self._queue: queue.PriorityQueue[Tuple[Any, int, BnBNode]] = (
-            queue.PriorityQueue()
-        )
+        # heap of (key, counter); the counter breaks ties by insertion order
+        self._heap: list[Tuple[Any, int]] = []
+        # Max-heap of (-upper_bound, counter) of the queued nodes.
+        self._bounds: list[Tuple[float, int]] = []
+        # The queued nodes by counter. Entries of the heaps whose counter is not
+        # in here anymore have been dequeued and are skipped lazily.
+        self._open: dict[int, BnBNode] = {}
         self._counter = 0
 
+    def _key(self, node: BnBNode) -> Any:
+        """
+        Priority key of `node`, computed once when it is enqueued.
+        """
+        if self._priority is None:
+            raise ValueError("No priority function given.")
+        return self._priority(node)
+
     def enqueue(self, node: BnBNode) -> None:
         """
         Add `node` to the open-set with its priority key.
         Ties are broken by the order nodes were added.
         """
-        self._queue.put((self._priority(node), self._counter, node))
+        counter = self._counter
+        heapq.heappush(self._heap, (self._key(node), counter))
+        heapq.heappush(self._bounds, (-node.upper_bound, counter))
+        self._open[counter] = node
         self._counter += 1
 
     def has_next(self) -> bool:
         """
         Return True if there are still nodes to explore.
         """
-        return not self._queue.empty()
+        return bool(self._open)
 
     def next(self) -> BnBNode:
         """
@@ -55,19 +84,48 @@ class SearchStrategy:
         """
         if not self.has_next():
             raise ValueError("No more nodes to explore.")
-        return self._queue.get()[2]
+        return self._pop(self._heap)
+
+    def next_best_bound(self) -> BnBNode:
+        """
+        Remove and return the node with the highest upper bound, regardless of
+        the priority.
+
+        Raises:
+            ValueError: if no nodes remain.
+        """
+        if not self.has_next():
+            raise ValueError("No more nodes to explore.")
+        return self._pop(self._bounds)
+
+    def _pop(self, heap: list[Tuple[Any, int]]) -> BnBNode:
+        """
+        Remove and return the top node of `heap` (the priority or the bound heap).
+        """
+        while True:
+            counter = heapq.heappop(heap)[1]
+            node = self._open.pop(counter, None)
+            if node is not None:
+                break
+        # rebuild the heaps if they mostly consist of dequeued entries
+        if len(self._heap) + len(self._bounds) > 4 * len(self._open) + 64:
+            self._heap = [e for e in self._heap if e[1] in self._open]
+            self._bounds = [e for e in self._bounds if e[1] in self._open]
+            heapq.heapify(self._heap)
+            heapq.heapify(self._bounds)
+        return node
 
     def __len__(self) -> int:
         """
         Number of nodes currently in the queue.
         """
-        return self._queue.qsize()
+        return len(self._open)
 
     def nodes_in_queue(self) -> Iterator[BnBNode]:
         """
         Iterator over nodes still in the queue (no removal).
         """
-        return (item[2] for item in self._queue.queue)
+        return iter(self._open.values())
 
     def upper_bound(self) -> float:
         """
@@ -76,12 +134,89 @@ class SearchStrategy:
         Note: to get the global BnB upper bound, take the max of this
         and your best feasible solution value.
         """
-        if not self.has_next():
+        # drop the entries of already dequeued nodes from the top
+        while self._bounds and self._bounds[0][1] not in self._open:
+            heapq.heappop(self._bounds)
+        if not self._bounds:
             return float("-inf")
-        return max(
-            self.nodes_in_queue(),
-            key=lambda n: n.relaxed_solution.upper_bound,
-        ).relaxed_solution.upper_bound
+        return -self._bounds[0][0]
+
+
+class BestFirstSearchStrategy(SearchStrategy):
+    """
+    Explore the node with the highest upper bound first.
+    """
+
+    def _key(self, node: BnBNode) -> Any:
+        return -node.upper_bound
+
+
+class DepthFirstSearchStrategy(SearchStrategy):
+    """
+    Explore the deepest node first; among equally deep nodes the one with the
+    highest upper bound.
+    """
+
+    def _key(self, node: BnBNode) -> Any:
+        return (-node.depth, -node.upper_bound)
+
+
+class BestEstimateSearchStrategy(SearchStrategy):
+    """
+    Explore the node with the best estimate of its best 0/1 solution first.
+
+    The estimate interpolates between the value of the node's heuristic solution
+    (a lower bound) and its upper bound:
+        estimate = lb + estimate_weight * (ub - lb).
+    Nodes without heuristic solution are estimated by their upper bound.
+
+    Args:
+        estimate_weight: position of the estimate between lb (0.0) and ub (1.0).
+    """
+
+    def __init__(self, estimate_weight: float = 0.5) -> None:
+        super().__init__()
+        self._estimate_weight = estimate_weight
+
+    def _key(self, node: BnBNode) -> Any:
+        ub = node.upper_bound
+        heuristic = node.heuristic_solution
+        if heuristic is None:
+            return -ub
+        lb = heuristic.value()
+        return -(lb + self._estimate_weight * (ub - lb))
+
+
+class PlungingSearchStrategy(SearchStrategy):
+    """
+    Depth-first plunging with periodic best-first jumps.
+
+    The most recently created node is explored next, so the search dives from the
+    current node into its children. Every `jump_interval` nodes, it jumps to the
+    open node with the highest upper bound instead and continues diving from there.
+
+    Args:
+        jump_interval: number of dequeued nodes between two best-first jumps.
+    """
+
+    def __init__(self, jump_interval: int = 10) -> None:
+        super().__init__()
+        if jump_interval < 1:
+            raise ValueError("`jump_interval` must be positive.")
+        self._jump_interval = jump_interval
+        self._num_dequeued = 0
+
+    def _key(self, node: BnBNode) -> Any:
+        # last in, first out
+        return -self._counter
+
+    def next(self) -> BnBNode:
+        if not self.has_next():
+            raise ValueError("No more nodes to explore.")
+        self._num_dequeued += 1
+        if self._num_dequeued % self._jump_interval == 0:
+            return self.next_best_bound()
+        return self._pop(self._heap)
 
 
 # Default search order: you must supply your own `priority`.
@@ -94,5 +229,3 @@ def my_search_order(node: BnBNode) -> Any:
     """
     # best fit first the lower the bound the higher the priority
     return -node.relaxed_solution.upper_bound
-
-
@@ -0,0 +1,78 @@
+"""
+Serialization Module
+
+Binary encoding of open BnB nodes as fixed-size NumPy records, e.g., to move
+them to disk. A record holds what is needed to recreate an open node:
+  - upper_bound, depth, node_id and parent_id (-1 for the root),
+  - the branching decisions as two bitmasks (fixed items, items fixed to 1),
+    stored as little-endian bytes.
+The relaxed solution is not stored; it is solved again when the node is processed.
+"""
+
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .bnb_nodes import BnBNode, NodeFactory
+
+
+class NodeCodec:
+    """
+    Encodes nodes of an instance with `num_items` items into records of `dtype`.
+    """
+
+    def __init__(self, num_items: int) -> None:
+        self.num_items = num_items
+        self.num_bytes = (num_items + 7) // 8
+        self.dtype = np.dtype(
+            [
+                ("upper_bound", "<f8"),
+                ("depth", "<i8"),
+                ("node_id", "<i8"),
+                ("parent_id", "<i8"),
+                ("fixed", "u1", (self.num_bytes,)),
+                ("values", "u1", (self.num_bytes,)),
+            ]
+        )
+
+    def _to_bytes(self, mask: int) -> np.ndarray:
+        return np.frombuffer(mask.to_bytes(self.num_bytes, "little"), dtype=np.uint8)
+
+    def encode(self, nodes: Iterable[BnBNode]) -> np.ndarray:
+        """
+        Return an array with one record per node.
+        """
+        nodes = list(nodes)
+        records = np.zeros(len(nodes), dtype=self.dtype)
+        for record, node in zip(records, nodes):
+            fixed, values = node.branching_decisions.to_bitmasks()
+            record["upper_bound"] = node.upper_bound
+            record["depth"] = node.depth
+            record["node_id"] = node.node_id
+            record["parent_id"] = -1 if node.parent_id is None else node.parent_id
+            record["fixed"] = self._to_bytes(fixed)
+            record["values"] = self._to_bytes(values)
+        return records
+
+    def decode(self, records: np.ndarray, factory: NodeFactory) -> list[BnBNode]:
+        """
+        Recreate the nodes of `records` with `factory` (see `NodeFactory.restore_node`).
+        """
+        nodes = []
+        for record in records:
+            parent_id: Optional[int] = int(record["parent_id"])
+            decisions = factory.decisions_type.from_bitmasks(
+                self.num_items,
+                int.from_bytes(record["fixed"].tobytes(), "little"),
+                int.from_bytes(record["values"].tobytes(), "little"),
+            )
+            nodes.append(
+                factory.restore_node(
+                    decisions,
+                    upper_bound=float(record["upper_bound"]),
+                    depth=int(record["depth"]),
+                    node_id=int(record["node_id"]),
+                    parent_id=None if parent_id == -1 else parent_id,
+                )
+            )
+        return nodes
@@ -7,7 +7,12 @@ keeping track of the best one (highest value) for pruning and final output.
 You do not need to modify this file; it validates and stores your solutions.
 """
 
-from typing import Optional, List
+import heapq
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
 from .relaxation import RelaxedSolution
 from .heuristics import HeuristicSolution
 
@@ -16,6 +21,13 @@ class SolutionPool:
     """
     Stores feasible integral solutions and tracks the best one.
 
+    Solutions are indexed by a compact hash of their selection (one bit per item),
+    so duplicates are detected in O(1). Only the `max_solutions` best solutions are
+    kept; the value of the best one is cached for the prune test on every node.
+
+    Args:
+        max_solutions: number of best solutions to keep (None keeps all).
+
     Usage:
         pool = SolutionPool()
         pool.add(solution)
@@ -23,13 +35,30 @@ class SolutionPool:
         best_sol = pool.best_solution()
     """
 
-    def __init__(self) -> None:
-        self._solutions: List[HeuristicSolution] = []
+    def __init__(self, max_solutions: Optional[int] = 100) -> None:
+        if max_solutions is not None and max_solutions < 1:
+            raise ValueError("`max_solutions` must be positive or None.")
+        self._max_solutions = max_solutions
+        self._solutions: Dict[bytes, HeuristicSolution] = {}
+        # min-heap of (value, counter, key) to evict the worst solution
+        self._by_value: List[Tuple[float, int, bytes]] = []
+        self._counter = 0
         self._best_solution: Optional[HeuristicSolution] = None
+        self._best_value = float("-inf")
+        # time.perf_counter() when the first solution was added
+        self.first_solution_time: Optional[float] = None
+
+    @staticmethod
+    def _key(solution: RelaxedSolution) -> bytes:
+        """
+        Compact key of an integral selection: its bits packed into bytes.
+        """
+        return np.packbits(solution.selection.astype(bool)).tobytes()
 
-    def add(self, solution: HeuristicSolution) -> None:
+    def add(self, solution: HeuristicSolution) -> bool:
         """
         Add a new feasible integral solution to the pool.
+        Returns True if the solution was new and is kept.
 
         Raises:
             AssertionError: if `solution` is infeasible or non-integral.
@@ -42,25 +71,35 @@ class SolutionPool:
             "Attempted to add a non-integral solution; "
             "ensure your heuristics produce integer selections."
         )
-        # Add only unique solutions by value and selection
-        if solution not in self._solutions:
-            self._solutions.append(solution)
-            # Update best if it's strictly better
-            if (
-                self._best_solution is None
-                or solution.value() > self._best_solution.value()
-            ):
-                self._best_solution = solution
+        value = solution.value()
+        is_full = (
+            self._max_solutions is not None
+            and len(self._solutions) >= self._max_solutions
+        )
+        if is_full and value <= self._by_value[0][0]:
+            return False  # not better than any kept solution
+        # Add only unique solutions by selection
+        key = self._key(solution)
+        if key in self._solutions:
+            return False
+        self._solutions[key] = solution
+        heapq.heappush(self._by_value, (value, self._counter, key))
+        self._counter += 1
+        if is_full:
+            del self._solutions[heapq.heappop(self._by_value)[2]]
+        if self.first_solution_time is None:
+            self.first_solution_time = time.perf_counter()
+        # Update best if it's strictly better
+        if value > self._best_value:
+            self._best_solution = solution
+            self._best_value = value
+        return True
 
     def best_solution_value(self) -> float:
         """
         Return the value of the best solution, or -inf if none.
         """
-        return (
-            self._best_solution.value()
-            if self._best_solution is not None
-            else float("-inf")
-        )
+        return self._best_value
 
     def best_solution(self) -> Optional[HeuristicSolution]:
         """
@@ -70,6 +109,12 @@ class SolutionPool:
 
     def all_solutions(self) -> List[RelaxedSolution]:
         """
-        Return a list of all unique solutions found so far.
+        Return a list of all unique solutions kept, best first.
+        """
+        return sorted(self._solutions.values(), key=lambda s: -s.value())
+
+    def __len__(self) -> int:
+        """
+        Number of solutions kept.
         """
-        return list(self._solutions)
+        return len(self._solutions)
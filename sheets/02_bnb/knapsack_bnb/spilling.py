@@ -0,0 +1,288 @@
+"""
+Spilling Search Strategy Module
+
+Best-first search can queue far more nodes than fit into memory. The
+`SpillingSearchStrategy` keeps at most `max_nodes_in_memory` open nodes in the
+usual heap. If there are more, the half with the lower bounds is written to disk
+(see `serialization.NodeCodec`), grouped into files by bound range (buckets).
+The buckets have the same width, taken from the bounds of the first spill; lower
+bounds of later spills get new buckets below the first ones.
+Every spill appends to a bucket file a segment sorted by decreasing bound.
+Whenever a bucket may contain a node with a higher bound than every node in
+memory, the bucket is memory-mapped and its best nodes are read back from the
+heads of its segments, at most `max_nodes_in_memory // 2` at a time; the rest
+stays on disk and is never rewritten. So nodes are still dequeued in best-first
+order, every spilled node is read once, and never more than
+`max_nodes_in_memory` open nodes are held in memory.
+
+Usage:
+    searcher = BnBSearch(
+        instance,
+        ...,
+        search_strategy=SpillingSearchStrategy(max_nodes_in_memory=100_000),
+        tracker_mode=TrackerMode.SILENT,
+    )
+"""
+
+import itertools
+import math
+import os
+import shutil
+import sys
+import tempfile
+import weakref
+from typing import Iterator, Optional
+
+import numpy as np
+
+from .bnb_nodes import BnBNode, NodeFactory
+from .search_strategy import BestFirstSearchStrategy
+from .serialization import NodeCodec
+
+
+class _BucketStore:
+    """
+    Append-only record files, one per bucket, in a temporary directory.
+
+    Each append is a segment sorted by decreasing bound. Only the unread range
+    [start, end) of every segment is kept, so the best records of a bucket are at
+    the heads of its segments and reading them never rewrites the file.
+    """
+
+    def __init__(self, directory: Optional[str], dtype: np.dtype) -> None:
+        self._directory = tempfile.mkdtemp(prefix="bnb-spill-", dir=directory)
+        self._dtype = dtype
+        self._counts: dict[int, int] = {}
+        self._max_bounds: dict[int, float] = {}
+        self._sizes: dict[int, int] = {}  # number of records in the file
+        self._segments: dict[int, list[list[int]]] = {}  # unread [start, end)
+        self._finalizer = weakref.finalize(
+            self, shutil.rmtree, self._directory, ignore_errors=True
+        )
+
+    def _path(self, bucket: int) -> str:
+        return os.path.join(self._directory, f"{bucket}.bin")
+
+    def __len__(self) -> int:
+        return sum(self._counts.values())
+
+    def append(self, bucket: int, records: np.ndarray) -> None:
+        records = records[np.argsort(-records["upper_bound"], kind="stable")]
+        with open(self._path(bucket), "ab") as file:
+            records.tofile(file)
+        start = self._sizes.get(bucket, 0)
+        self._sizes[bucket] = start + len(records)
+        self._segments.setdefault(bucket, []).append([start, start + len(records)])
+        self._counts[bucket] = self._counts.get(bucket, 0) + len(records)
+        self._max_bounds[bucket] = max(
+            self._max_bounds.get(bucket, float("-inf")),
+            float(records["upper_bound"][0]),
+        )
+
+    def best_bound(self) -> float:
+        """
+        The highest bound of all stored records, -inf if empty.
+        """
+        return max(self._max_bounds.values(), default=float("-inf"))
+
+    def _read(self, bucket: int) -> np.ndarray:
+        return np.memmap(self._path(bucket), dtype=self._dtype, mode="r")
+
+    def pop_best(self, limit: int) -> np.ndarray:
+        """
+        Remove and return up to `limit` records with the highest bounds from the
+        bucket with the highest bounds. The other records of the bucket stay.
+
+        The best records are among the first `limit` of every segment; only their
+        bounds and then the taken records themselves are read.
+        """
+        bucket = max(self._max_bounds, key=self._max_bounds.__getitem__)
+        file = self._read(bucket)
+        segments = self._segments[bucket]
+        heads = [
+            file["upper_bound"][start : min(end, start + limit)]
+            for start, end in segments
+        ]
+        bounds = np.concatenate(heads)
+        # number of records to take from each segment (a prefix, as it is sorted)
+        taken = np.array([len(head) for head in heads])
+        if len(bounds) > limit:
+            best = np.argpartition(-bounds, limit - 1)[:limit]
+            owner = np.repeat(np.arange(len(heads)), taken)
+            taken = np.bincount(owner[best], minlength=len(heads))
+        records = np.concatenate(
+            [file[start : start + k] for (start, _), k in zip(segments, taken.tolist())]
+        )
+        for segment, k in zip(segments, taken.tolist()):
+            segment[0] += k
+        segments[:] = [segment for segment in segments if segment[0] < segment[1]]
+        self._counts[bucket] -= len(records)
+        if segments:
+            self._max_bounds[bucket] = max(
+                float(file["upper_bound"][start]) for start, _ in segments
+            )
+        else:
+            del file
+            os.remove(self._path(bucket))
+            for table in (
+                self._counts,
+                self._max_bounds,
+                self._sizes,
+                self._segments,
+            ):
+                del table[bucket]
+        return records
+
+    def records(self) -> Iterator[np.ndarray]:
+        """
+        Iterate over the records of all buckets without removing them.
+        """
+        for bucket in list(self._counts):
+            file = self._read(bucket)
+            for start, end in self._segments[bucket]:
+                yield file[start:end]
+
+    def close(self) -> None:
+        self._finalizer()
+
+
+class SpillingSearchStrategy(BestFirstSearchStrategy):
+    """
+    Best-first search strategy that spills the worse part of the open list to disk.
+
+    Args:
+        max_nodes_in_memory: maximal number of open nodes kept in memory.
+        num_buckets: number of bound ranges for the spilled nodes.
+        directory: where to create the temporary spill directory
+                   (default: the system's temporary directory).
+    """
+
+    def __init__(
+        self,
+        max_nodes_in_memory: int = 100_000,
+        num_buckets: int = 64,
+        directory: Optional[str] = None,
+    ) -> None:
+        super().__init__()
+        if max_nodes_in_memory < 2 or num_buckets < 1:
+            raise ValueError("Need at least two nodes in memory and one bucket.")
+        self._max_nodes_in_memory = max_nodes_in_memory
+        self._num_buckets = num_buckets
+        self._directory = directory
+        self._codec: Optional[NodeCodec] = None
+        self._store: Optional[_BucketStore] = None
+        self._factory: Optional[NodeFactory] = None
+        self._origin = 0.0
+        self._bucket_width = 1.0
+        self.num_spilled = 0  # total number of nodes written to disk
+
+    def _bucket(self, upper_bound: float) -> int:
+        """
+        Bucket of a bound. Bounds below the initial range get new buckets with
+        negative numbers; higher bounds go to the last bucket, -inf (infeasible
+        nodes) to a bucket below all others.
+        """
+        if math.isnan(upper_bound) or upper_bound == -math.inf:
+            return -sys.maxsize
+        if math.isinf(upper_bound):
+            return self._num_buckets - 1
+        bucket = math.floor((upper_bound - self._origin) / self._bucket_width)
+        return min(bucket, self._num_buckets - 1)
+
+    def enqueue(self, node: BnBNode) -> None:
+        super().enqueue(node)
+        if len(self._open) > self._max_nodes_in_memory:
+            self._spill()
+
+    def _spill(self) -> None:
+        """
+        Write the half of the in-memory nodes with the lower bounds to disk.
+        """
+        entries = sorted(self._open.items(), key=lambda e: -e[1].upper_bound)
+        keep = self._max_nodes_in_memory // 2
+        spilled = [node for _, node in entries[keep:]]
+        if self._store is None:
+            self._factory = spilled[0]._factory
+            self._codec = NodeCodec(len(spilled[0].branching_decisions))
+            self._store = _BucketStore(self._directory, self._codec.dtype)
+            # bucket ranges between the lowest spilled and the highest bound
+            finite = [
+                node.upper_bound
+                for _, node in entries
+                if math.isfinite(node.upper_bound)
+            ]
+            self._origin = min(finite, default=0.0)
+            span = max(finite, default=0.0) - self._origin
+            self._bucket_width = span / self._num_buckets if span > 0 else 1.0
+
+        self._open = dict(entries[:keep])
+        self._heap = [(self._key(node), c) for c, node in self._open.items()]
+        self._bounds = [(-node.upper_bound, c) for c, node in self._open.items()]
+        # entries are sorted by bound, so the heaps are already valid
+        self._heap.sort()
+        self._bounds.sort()
+
+        for bucket, group in itertools.groupby(
+            spilled, key=lambda n: self._bucket(n.upper_bound)
+        ):
+            self._store.append(bucket, self._codec.encode(group))
+        self.num_spilled += len(spilled)
+
+    def _refill(self) -> None:
+        """
+        Read back the best spilled nodes as long as they may be better than the
+        nodes in memory, at most `max_nodes_in_memory // 2` per call. Memory is
+        filled up to half only (unless better nodes are still on disk), so the
+        children of the next nodes fit without spilling again right away.
+        """
+        half = self._max_nodes_in_memory // 2
+        budget = half
+        while budget > 0 and self._num_spilled_open() > 0:
+            if self._open and self._store.best_bound() <= super().upper_bound():
+                break
+            if len(self._open) >= self._max_nodes_in_memory:
+                self._spill()
+            free = max(half - len(self._open), 1)
+            records = self._store.pop_best(min(budget, free))
+            budget -= len(records)
+            for node in self._codec.decode(records, self._factory):
+                super().enqueue(node)
+
+    def _num_spilled_open(self) -> int:
+        return len(self._store) if self._store is not None else 0
+
+    def has_next(self) -> bool:
+        return bool(self._open) or self._num_spilled_open() > 0
+
+    def next(self) -> BnBNode:
+        self._refill()
+        return super().next()
+
+    def next_best_bound(self) -> BnBNode:
+        self._refill()
+        return super().next_best_bound()
+
+    def __len__(self) -> int:
+        return len(self._open) + self._num_spilled_open()
+
+    def nodes_in_queue(self) -> Iterator[BnBNode]:
+        """
+        Iterator over nodes still in the queue (no removal). Spilled nodes are
+        read from disk and recreated.
+        """
+        yield from list(self._open.values())
+        if self._store is not None:
+            for records in self._store.records():
+                yield from self._codec.decode(records, self._factory)
+
+    def upper_bound(self) -> float:
+        if self._store is None:
+            return super().upper_bound()
+        return max(super().upper_bound(), self._store.best_bound())
+
+    def close(self) -> None:
+        """
+        Delete the spill files (also done automatically on garbage collection).
+        """
+        if self._store is not None:
+            self._store.close()
@@ -1,22 +1,60 @@
 """
 This code creates an interactive visualization of a branch and bound tree.
 You do not need to modify this code.
+
+During the search, only references to the (immutable) node data are recorded.
+All HTML is rendered in `visualize()`, with templates that are compiled once per process.
 """
 
 import logging
 from pathlib import Path
-from typing import Literal
+from typing import Literal, NamedTuple
 
-from jinja2 import Template
+from jinja2 import Environment, FileSystemLoader, Template
 from pydantic import BaseModel, Field
 
-from .bnb_nodes import BnBNode
+from .bnb_nodes import BnBNode, NodeStatus
+from .branching_decisions import BranchingDecisions
 from .heuristics import HeuristicSolution
 from .instance import Instance
 from .relaxation import RelaxedSolution
 
 RELAXED_STATUS = Literal["feasible+integral", "feasible", "infeasible"]
 
+# The environment caches the compiled templates.
+_TEMPLATES = Environment(loader=FileSystemLoader(Path(__file__).parent / "templates"))
+
+
+def _format_number(x: float) -> str:
+    """
+    Format integral numbers (also NumPy floats like the selections) without
+    decimals and others rounded to two decimals.
+    """
+    return str(int(x)) if float(x).is_integer() else str(round(float(x), 2))
+
+
+_TEMPLATES.filters["number"] = _format_number
+
+
+def _get_template(name: str) -> Template:
+    return _TEMPLATES.get_template(name)
+
+
+class _NodeRecord(NamedTuple):
+    """
+    The data of a processed or pruned node needed for rendering it later.
+    It stands in for the node in the templates.
+    """
+
+    node_id: int
+    status: NodeStatus
+    relaxed_solution: RelaxedSolution
+    branching_decisions: BranchingDecisions
+    heuristic_solution: HeuristicSolution | None
+    iteration: int
+    lb: float | None
+    best_solution: HeuristicSolution | None
+
 
 class BnBTree(BaseModel):
     """
@@ -56,6 +94,9 @@ class BnBVisualization:
         self.iteration_solution_details: dict[int, str] = {}
         self.node_tooltips: dict[int, str] = {}
         self.iterations: list[int] = []  # id of node processed in iteration
+        # raw data of the processed and pruned nodes, rendered in `visualize`
+        self._processed: list[_NodeRecord] = []
+        self._pruned: list[_NodeRecord] = []
 
     def _get_node_color(self, node: BnBNode) -> str:
         if (
@@ -103,7 +144,8 @@ class BnBVisualization:
         best_solution: HeuristicSolution | None,
     ):
         """
-        Called when a node is processed. Updates the jinja templates with information about the node.
+        Called when a node is processed. Records the data of the node, which is
+        rendered into the jinja templates in `visualize`.
         Args:
             node (BnBNode): The node that was processed.
             lb (float): The lower bound of the node from the heuristic solution.
@@ -123,50 +165,21 @@ class BnBVisualization:
             assert node_processed_at is not None
             assert parent_processed_at < node_processed_at
 
-        with (
-            Path(__file__).parent / "./templates/iteration_info.j2.html"
-        ).open() as file:
-            # Render iteration information
-            iteration_info_template = Template(file.read())
-            iteration_info = iteration_info_template.render(
-                node=node,
-                instance=self.instance,
-                best_solution=best_solution,
-                current_heuristic=node.heuristic_solution,
-            )
-            self.iteration_info_detail_texts[node.node_id] = iteration_info
+        self._processed.append(self._record(node, lb, best_solution))
 
-        with (
-            Path(__file__).parent / "./templates/iteration_solution_details.j2.html"
-        ).open() as file:
-            # Render iteration solutions
-            iteration_solutions_template = Template(file.read())
-            iteration_solutions = iteration_solutions_template.render(
-                instance=self.instance,
-                best_solution=best_solution,
-                current_heuristic=node.heuristic_solution,
-                current_relaxed=node.relaxed_solution,
-            )
-            self.iteration_solution_details[node.node_id] = iteration_solutions
-
-        with (
-            Path(__file__).parent / "./templates/node_tooltip.j2.html"
-        ).open() as file:
-            node_tooltip_template = Template(file.read())
-            node_tooltip = node_tooltip_template.render(
-                node=node,
-                included_items=node.branching_decisions.included_items(),
-                included_weight=sum(
-                    self.instance.items[i].weight
-                    for i in node.branching_decisions.included_items()
-                ),
-                excluded_items=node.branching_decisions.excluded_items(),
-                iteration=len(self.iterations) - 1,
-                iterations=self.iterations,
-                lb=lb,
-                current_heuristic=node.heuristic_solution,
-            )
-            self.node_tooltips[node.node_id] = node_tooltip
+    def _record(
+        self, node: BnBNode, lb: float | None, best_solution: HeuristicSolution | None
+    ) -> _NodeRecord:
+        return _NodeRecord(
+            node_id=node.node_id,
+            status=node.status,
+            relaxed_solution=node.relaxed_solution,
+            branching_decisions=node.branching_decisions,
+            heuristic_solution=node.heuristic_solution,
+            iteration=len(self.iterations) - 1,
+            lb=lb,
+            best_solution=best_solution,
+        )
 
     def on_node_pruned(
         self,
@@ -174,28 +187,68 @@ class BnBVisualization:
         best_solution: HeuristicSolution | None,
     ):
         """
-        Called when a node is globally pruned. Updates the jinja templates with information about the node.
+        Called when a node is globally pruned. Records the data of the node, which is
+        rendered into the jinja templates in `visualize`.
         Args:
             node (BnBNode): The node that was processed.
 
         """
-        with (
-            Path(__file__).parent / "./templates/node_tooltip.j2.html"
-        ).open() as file:
-            node_tooltip_template = Template(file.read())
-            node_tooltip = node_tooltip_template.render(
-                node=node,
-                lb=best_solution.value() if best_solution else None,
-                included_items=node.branching_decisions.included_items(),
-                included_weight=sum(
-                    self.instance.items[i].weight
-                    for i in node.branching_decisions.included_items()
-                ),
-                excluded_items=node.branching_decisions.excluded_items(),
-                iteration=len(self.iterations) - 1,
-                iterations=self.iterations,
+        self._pruned.append(
+            self._record(
+                node, best_solution.value() if best_solution else None, best_solution
             )
-            self.node_tooltips[node.node_id] = node_tooltip
+        )
+
+    def _render_nodes(self) -> None:
+        """
+        Render the iteration information and tooltips of all recorded nodes.
+        """
+        iteration_info_template = _get_template("iteration_info.j2.html")
+        iteration_solutions_template = _get_template(
+            "iteration_solution_details.j2.html"
+        )
+        node_tooltip_template = _get_template("node_tooltip.j2.html")
+        for record in self._processed:
+            # Render iteration information
+            self.iteration_info_detail_texts[record.node_id] = (
+                iteration_info_template.render(
+                    node=record,
+                    instance=self.instance,
+                    best_solution=record.best_solution,
+                    current_heuristic=record.heuristic_solution,
+                )
+            )
+            # Render iteration solutions
+            self.iteration_solution_details[record.node_id] = (
+                iteration_solutions_template.render(
+                    instance=self.instance,
+                    best_solution=record.best_solution,
+                    current_heuristic=record.heuristic_solution,
+                    current_relaxed=record.relaxed_solution,
+                )
+            )
+            self.node_tooltips[record.node_id] = self._render_tooltip(
+                node_tooltip_template,
+                record,
+                current_heuristic=record.heuristic_solution,
+            )
+        for record in self._pruned:
+            self.node_tooltips[record.node_id] = self._render_tooltip(
+                node_tooltip_template, record
+            )
+
+    def _render_tooltip(self, template: Template, record: _NodeRecord, **kwargs) -> str:
+        included_items = record.branching_decisions.included_items()
+        return template.render(
+            node=record,
+            lb=record.lb,
+            included_items=included_items,
+            included_weight=int(self.instance.weights[included_items].sum()),
+            excluded_items=record.branching_decisions.excluded_items(),
+            iteration=record.iteration,
+            iterations=self.iterations,
+            **kwargs,
+        )
 
     def visualize(
         self, end_solution: RelaxedSolution | None, path: str = "output.html"
@@ -213,50 +266,42 @@ class BnBVisualization:
         if end_solution is None:
             msg = "No solution to visualize."
             raise ValueError(msg)
-        with (
-            Path(__file__).parent / "./templates/instance_info.j2.html"
-        ).open() as file:
-            # Render instance information
-            instance_template = Template(file.read())
-            instance_info = instance_template.render(
-                instance=self.instance, best_solution=end_solution
-            )
-        with (
-            Path(__file__).parent / "./templates/solution_details.j2.html"
-        ).open() as file:
-            solution_template = Template(file.read())
-            solution_details = solution_template.render(
-                instance=self.instance,
-                num_iterations=len(self.iterations) - 1,
-                best_solution=end_solution,
-            )
+        self._render_nodes()
+        # Render instance information
+        instance_info = _get_template("instance_info.j2.html").render(
+            instance=self.instance, best_solution=end_solution
+        )
+        solution_details = _get_template("solution_details.j2.html").render(
+            instance=self.instance,
+            num_iterations=len(self.iterations) - 1,
+            best_solution=end_solution,
+        )
 
         # Render main html
-        with (Path(__file__).parent / "./templates/bnb.j2.html").open() as file:
-            template: Template = Template(file.read())
-            with Path(path).open("w") as file:
-                data = str(self.root.model_dump_json())
-                file.write(
-                    template.render(
-                        tree_data=data,
-                        num_iterations=len(self.iterations) - 1,
-                        iterations=self.iterations,
-                        iteration_info=self.iteration_info_detail_texts,
-                        iteration_solution_details=self.iteration_solution_details,
-                        instance_info=instance_info,
-                        instance=self.instance,
-                        solution_details=solution_details,
-                        node_tooltips=self.node_tooltips,
-                    )
+        template = _get_template("bnb.j2.html")
+        with Path(path).open("w") as file:
+            data = str(self.root.model_dump_json())
+            file.write(
+                template.render(
+                    tree_data=data,
+                    num_iterations=len(self.iterations) - 1,
+                    iterations=self.iterations,
+                    iteration_info=self.iteration_info_detail_texts,
+                    iteration_solution_details=self.iteration_solution_details,
+                    instance_info=instance_info,
+                    instance=self.instance,
+                    solution_details=solution_details,
+                    node_tooltips=self.node_tooltips,
                 )
-                logging.info("Visualization saved to %s", path)
-                # open the file in the default web browser
-                try:
-                    import webbrowser
-
-                    webbrowser.open_new_tab(path)
-                except Exception as e:
-                    logging.error(
-                        "Error opening the file in the browser. Please open it manually."
-                    )
-                    logging.exception(e)
+            )
+            logging.info("Visualization saved to %s", path)
+        # open the file in the default web browser
+        try:
+            import webbrowser
+
+            webbrowser.open_new_tab(path)
+        except Exception as e:
+            logging.error(
+                "Error opening the file in the browser. Please open it manually."
+            )
+            logging.exception(e)
@@ -0,0 +1,41 @@
+import itertools
+import logging
+
+import numpy as np
+
+from knapsack_bnb import BnBSearch, TrackerMode
+from knapsack_bnb.bnb import TerminationReason
+from knapsack_bnb.branching_strategy import MyBranchingStrategy
+from knapsack_bnb.generators import generate_multidimensional_instance
+from knapsack_bnb.heuristics import MyHeuristic
+from knapsack_bnb.relaxation import FractionalRelaxationSolver
+from knapsack_bnb.search_strategy import BestFirstSearchStrategy
+
+
+def _brute_force(instance) -> int:
+    selections = np.array(list(itertools.product([0, 1], repeat=len(instance.items))))
+    fits = np.all(selections @ instance.weight_matrix.T <= instance.capacities, axis=1)
+    return int((selections @ instance.values)[fits].max())
+
+
+def test_unbranched_nodes_keep_their_bound(caplog):
+    # the single-constraint relaxation yields integral, infeasible solutions that
+    # `MyBranchingStrategy` cannot branch on
+    caplog.set_level(logging.ERROR)
+    for seed in range(20):
+        instance = generate_multidimensional_instance(10, 2, seed=seed)
+        searcher = BnBSearch(
+            instance,
+            FractionalRelaxationSolver(),
+            BestFirstSearchStrategy(),
+            MyBranchingStrategy(),
+            MyHeuristic(),
+            tracker_mode=TrackerMode.SILENT,
+        )
+        searcher.search(iteration_limit=100_000)
+        result = searcher.result
+        optimum = _brute_force(instance)
+        assert result.upper_bound >= optimum
+        if result.reason == TerminationReason.OPTIMAL:
+            assert result.lower_bound == optimum
+            assert result.gap == 0
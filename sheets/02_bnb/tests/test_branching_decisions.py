@@ -0,0 +1,25 @@
+import random
+
+import pytest
+
+from knapsack_bnb.branching_decisions import (
+    BitsetBranchingDecisions,
+    BranchingDecisions,
+)
+
+
+@pytest.mark.parametrize("length", [0, 1, 7, 8, 9, 70])
+def test_bitset_matches_list_decisions(length):
+    rng = random.Random(length)
+    for _ in range(20):
+        plain, bitset = BranchingDecisions(length), BitsetBranchingDecisions(length)
+        for index in rng.sample(range(length), rng.randint(0, length)):
+            value = rng.randint(0, 1)
+            plain.fix(index, value)
+            bitset.fix(index, value)
+
+        assert list(bitset) == list(plain)
+        assert bitset.to_array().tolist() == plain.to_array().tolist()
+        assert bitset.included_items() == plain.included_items()
+        assert bitset.excluded_items() == plain.excluded_items()
+        assert bitset == plain and hash(bitset) == hash(plain)
@@ -0,0 +1,58 @@
+import pickle
+
+import pytest
+
+from knapsack_bnb import BnBSearch, ParallelBnBSearch, TrackerMode
+from knapsack_bnb.branching_decisions import BranchingDecisions
+from knapsack_bnb.branching_strategy import MyBranchingStrategy
+from knapsack_bnb.generators import InstanceClass, generate_instance
+from knapsack_bnb.heuristics import MyHeuristic
+from knapsack_bnb.relaxation import (
+    EnumerativeRelaxationSolver,
+    FractionalRelaxationSolver,
+    MartelloTothRelaxationSolver,
+)
+from knapsack_bnb.search_strategy import BestFirstSearchStrategy
+
+SOLVERS = [
+    FractionalRelaxationSolver,
+    MartelloTothRelaxationSolver,
+    EnumerativeRelaxationSolver,
+]
+
+
+@pytest.mark.parametrize("solver_type", SOLVERS)
+def test_relaxation_pickles_with_cache(solver_type):
+    instance = generate_instance(InstanceClass.WEAKLY_CORRELATED, 20, seed=1)
+    solver = solver_type()
+    root = solver.solve(instance, BranchingDecisions(len(instance.items)))
+
+    copy = pickle.loads(pickle.dumps(solver))
+    assert len(copy._dantzig) == 0
+    again = copy.solve(instance, BranchingDecisions(len(instance.items)))
+    assert again.upper_bound == root.upper_bound
+
+
+@pytest.mark.parametrize("solver_type", SOLVERS)
+def test_parallel_search_with_spawn(solver_type):
+    instance = generate_instance(InstanceClass.STRONGLY_CORRELATED, 20, seed=1)
+    sequential = BnBSearch(
+        instance,
+        solver_type(),
+        BestFirstSearchStrategy(),
+        MyBranchingStrategy(),
+        MyHeuristic(),
+        tracker_mode=TrackerMode.SILENT,
+    )
+    expected = sequential.search().value()
+
+    parallel = ParallelBnBSearch(
+        instance,
+        relaxation=solver_type(),
+        search_strategy=BestFirstSearchStrategy(),
+        branching_strategy=MyBranchingStrategy(),
+        heuristics=MyHeuristic(),
+        num_workers=2,
+        start_method="spawn",
+    )
+    assert parallel.search().value() == expected
@@ -0,0 +1,38 @@
+import itertools
+import random
+
+import numpy as np
+
+from knapsack_bnb.instance import Instance
+from knapsack_bnb.presolve import _dominated, presolve_instance
+
+
+def _optimum(weights, values, capacity) -> int:
+    selections = np.array(list(itertools.product([0, 1], repeat=len(weights))))
+    fits = selections @ weights <= capacity
+    return int((selections @ values)[fits].max())
+
+
+def test_dominated_items():
+    weights = np.array([6, 5, 6, 6, 2])
+    values = np.array([3, 4, 3, 5, 1])
+    # 1 is lighter and worth more than 0 and 2, but does not fit with them; 3 is
+    # worth more than 1, and 4 fits with every item
+    assert _dominated(weights, values, 10).tolist() == [True, False, True, False, False]
+
+
+def test_presolve_keeps_the_optimum():
+    rng = random.Random(0)
+    for _ in range(300):
+        n = rng.randint(1, 10)
+        capacity = rng.randint(1, 30)
+        weights = np.array([rng.randint(1, capacity) for _ in range(n)])
+        values = np.array([rng.randint(1, 8) for _ in range(n)])
+        presolved = presolve_instance(Instance.from_arrays(weights, values, capacity))
+
+        reduced = presolved.instance
+        value = presolved.fixed_value
+        if len(reduced.items) > 0:
+            value += _optimum(reduced.weights, reduced.values, reduced.capacity)
+        value = max(value, presolved.incumbent.value())
+        assert value == _optimum(weights, values, capacity)